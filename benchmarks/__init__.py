@@ -0,0 +1 @@
+"""Benchmarks for the pyadt abstract data types."""
@@ -0,0 +1,75 @@
+"""Command line interface of the benchmark suite.
+
+Run every scenario and save the results:
+
+    python -m benchmarks run --output results.json
+
+Compare two runs and fail when a timing regressed by more than 10%:
+
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import sys
+
+from benchmarks import runner
+
+
+def _report(name, size, seconds):
+    print(f"{name:<28} {size:>9} {seconds:>14.6f}", flush=True)
+
+
+def _run(args):
+    print(f"{'scenario':<28} {'size':>9} {'seconds':>14}")
+    results = runner.run(args.sizes, args.filter, report=_report)
+    if args.output:
+        runner.save(results, args.output)
+    return 0
+
+
+def _compare(args):
+    regressions = runner.compare(
+        runner.load(args.baseline), runner.load(args.current), args.threshold
+    )
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.scenario} size={regression.size}: "
+            f"{regression.baseline:.6f}s -> {regression.current:.6f}s "
+            f"({regression.ratio:.2f}x)"
+        )
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark scenarios")
+    run.add_argument(
+        "--sizes", type=int, nargs="+", default=runner.SIZES, metavar="N"
+    )
+    run.add_argument(
+        "--filter", default="*", help="glob pattern, e.g. 'map.*'"
+    )
+    run.add_argument("--output", help="save the results to this JSON file")
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown to flag, 0.1 means 10%% (default)",
+    )
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Compare pyadt.ConcurrentMap against a Map behind a single lock.
+
+Every thread runs the same mix of operations on random keys: mostly
+reads, some writes and a few compute_if_absent() calls. The baseline
+guards a pyadt.Map with one lock around every access, as callers had to
+do before ConcurrentMap existed, so each access also pays for its O(n)
+scan of the keys. ConcurrentMap with a single shard is shown too, to
+separate the cost of the lock from the cost of the storage.
+
+With the GIL, threads don't run Python code in parallel, so the
+throughput measures how much time threads lose waiting for each other.
+On a free-threaded build, the sharded map also scales with the cores.
+
+Run with: python -m benchmarks.concurrentmap
+"""
+
+import threading
+from random import Random
+from time import perf_counter
+
+from pyadt import ConcurrentMap, Map
+
+KEYS = 1_000
+OPERATIONS = 20_000
+THREADS = (1, 2, 4, 8)
+
+
+class LockedMap:
+    """A pyadt.Map with a single lock around every access."""
+
+    def __init__(self, pairs):
+        self._map = Map(pairs)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                return self._map[key]
+            except KeyError:
+                return None
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._map[key] = value
+
+    def compute_if_absent(self, key, function):
+        with self._lock:
+            try:
+                return self._map[key]
+            except KeyError:
+                value = self._map[key] = function(key)
+                return value
+
+
+def _work(mapping, seed):
+    random = Random(seed)
+    for _ in range(OPERATIONS):
+        key = random.randrange(KEYS)
+        choice = random.random()
+        if choice < 0.8:
+            mapping.get(key)
+        elif choice < 0.95:
+            mapping[key] = choice
+        else:
+            mapping.compute_if_absent(key, str)
+
+
+def _throughput(mapping, threads):
+    workers = [
+        threading.Thread(target=_work, args=(mapping, seed))
+        for seed in range(threads)
+    ]
+    start = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * OPERATIONS / (perf_counter() - start)
+
+
+def main():
+    pairs = [(key, key) for key in range(KEYS)]
+    factories = {
+        "locked Map": lambda: LockedMap(pairs),
+        "1 shard": lambda: ConcurrentMap(pairs, shards=1),
+        "16 shards": lambda: ConcurrentMap(pairs, shards=16),
+    }
+    print(
+        f"{'threads':>7}", *(f"{name + ' (op/s)':>18}" for name in factories)
+    )
+    for threads in THREADS:
+        rates = [
+            _throughput(factory(), threads) for factory in factories.values()
+        ]
+        print(f"{threads:>7}", *(f"{rate:>18,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
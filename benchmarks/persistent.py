@@ -0,0 +1,79 @@
+"""Measure the memory of retained versions of persistent and copied ADTs.
+
+Every version adds one item to the previous one. The persistent variants
+share structure between versions, while the baselines copy the whole
+container for every snapshot. Copying takes O(n²) memory, so the
+baselines only run up to COPY_LIMIT versions.
+
+Run with: python -m benchmarks.persistent
+"""
+
+import tracemalloc
+
+from pyadt import LinkedList, PersistentLinkedList, PersistentStack, Stack
+
+VERSIONS = (1_000, 10_000, 100_000)
+COPY_LIMIT = 2_000
+
+
+def persistent_stack_versions(count):
+    versions = [PersistentStack()]
+    for item in range(count):
+        versions.append(versions[-1].push(item))
+    return versions
+
+
+def copied_stack_versions(count):
+    versions = [Stack()]
+    for item in range(count):
+        stack = Stack(versions[-1])
+        stack.push(item)
+        versions.append(stack)
+    return versions
+
+
+def persistent_llist_versions(count):
+    versions = [PersistentLinkedList()]
+    for item in range(count):
+        versions.append(versions[-1].append_left(item))
+    return versions
+
+
+def copied_llist_versions(count):
+    versions = [LinkedList()]
+    for item in range(count):
+        llist = LinkedList([node.data for node in versions[-1]])
+        llist.append_left(item)
+        versions.append(llist)
+    return versions
+
+
+def measure(build, count):
+    tracemalloc.start()
+    versions = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del versions
+    return size
+
+
+def main():
+    print(
+        f"{'ADT':<22} {'versions':>9} {'persistent (B)':>15} {'copied (B)':>14}"
+    )
+    for name, persistent, copied in (
+        ("Stack", persistent_stack_versions, copied_stack_versions),
+        ("LinkedList", persistent_llist_versions, copied_llist_versions),
+    ):
+        for count in VERSIONS:
+            shared = measure(persistent, count)
+            baseline = (
+                f"{measure(copied, count):>14,}"
+                if count <= COPY_LIMIT
+                else f"{'-':>14}"
+            )
+            print(f"{name:<22} {count:>9,} {shared:>15,} {baseline}")
+
+
+if __name__ == "__main__":
+    main()
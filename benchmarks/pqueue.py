@@ -0,0 +1,63 @@
+"""Compare pyadt.PriorityQueue against the heapq module.
+
+Run with: python -m benchmarks.pqueue
+"""
+
+import heapq
+from random import Random
+from timeit import timeit
+
+from pyadt import PriorityQueue
+
+SIZES = (100, 1_000, 10_000, 100_000)
+
+
+def _priorities(size):
+    random = Random(size)
+    return [random.random() for _ in range(size)]
+
+
+def bench_pqueue(priorities, arity=4):
+    pq = PriorityQueue(arity=arity)
+    for item, priority in enumerate(priorities):
+        pq.enqueue(item, priority)
+    while pq:
+        pq.dequeue()
+
+
+def bench_heapq(priorities):
+    heap = []
+    for item, priority in enumerate(priorities):
+        heapq.heappush(heap, (priority, item))
+    while heap:
+        heapq.heappop(heap)
+
+
+def bench_pqueue_heapify(priorities):
+    PriorityQueue((item, priority) for item, priority in enumerate(priorities))
+
+
+def bench_heapq_heapify(priorities):
+    heap = [(priority, item) for item, priority in enumerate(priorities)]
+    heapq.heapify(heap)
+
+
+def main():
+    print(f"{'size':>8} {'scenario':<20} {'pyadt (s)':>12} {'heapq (s)':>12}")
+    for size in SIZES:
+        priorities = _priorities(size)
+        number = max(1, 100_000 // size)
+        for name, ours, theirs in (
+            ("enqueue/dequeue", bench_pqueue, bench_heapq),
+            ("heapify", bench_pqueue_heapify, bench_heapq_heapify),
+        ):
+            ours_time = timeit(lambda: ours(priorities), number=number)
+            theirs_time = timeit(lambda: theirs(priorities), number=number)
+            print(
+                f"{size:>8} {name:<20} "
+                f"{ours_time / number:>12.6f} {theirs_time / number:>12.6f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Run benchmark scenarios and compare saved results."""
+
+import json
+import platform
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from benchmarks.scenarios import SCENARIOS, Scenario
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+Results = Dict[str, Dict[str, float]]
+
+
+class Regression(NamedTuple):
+    scenario: str
+    size: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def _repeats(size: int) -> int:
+    # Small workloads are noisy, so they get more runs
+    return max(3, min(50, 100_000 // size))
+
+
+def time_scenario(scenario: Scenario, size: int) -> float:
+    """Return the best time in seconds of several runs of scenario."""
+    best = float("inf")
+    for _ in range(_repeats(size)):
+        run = scenario.setup(size)
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def run(
+    sizes: Iterable[int] = SIZES,
+    pattern: str = "*",
+    report: Optional[Callable] = None,
+) -> Results:
+    """Run the scenarios matching pattern for every size they support."""
+    results: Results = {}
+    for name, scenario in SCENARIOS.items():
+        if not fnmatch(name, pattern):
+            continue
+        timings = results.setdefault(name, {})
+        for size in sizes:
+            if scenario.max_size is not None and size > scenario.max_size:
+                continue
+            timings[str(size)] = time_scenario(scenario, size)
+            if report is not None:
+                report(name, size, timings[str(size)])
+    return results
+
+
+def save(results: Results, path: str) -> None:
+    """Save results as JSON together with the platform they come from."""
+    document = {
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def load(path: str) -> Results:
+    """Load the results saved in path."""
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def compare(
+    baseline: Results, current: Results, threshold: float = 0.1
+) -> List[Regression]:
+    """Return the timings that got slower than baseline by over threshold.
+
+    Only scenarios and sizes present in both results are compared.
+    """
+    regressions = []
+    for name, timings in current.items():
+        for size, seconds in timings.items():
+            reference = baseline.get(name, {}).get(size)
+            if reference and seconds > reference * (1 + threshold):
+                regressions.append(Regression(name, size, reference, seconds))
+    return regressions
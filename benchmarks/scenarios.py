@@ -0,0 +1,376 @@
+"""Benchmark scenarios for every pyadt abstract data type.
+
+A scenario is a setup function that takes a size and returns a callable
+running the workload once. The runner calls setup before every timed
+run, so workloads are free to consume the container they build.
+"""
+
+from random import Random
+from typing import Callable, Dict, NamedTuple, Optional
+
+from pyadt import (
+    AggregateStack,
+    Array,
+    Bag,
+    LinkedList,
+    Map,
+    Matrix,
+    PriorityQueue,
+    Queue,
+    Set,
+    SortedMap,
+    SortedSet,
+    Stack,
+)
+from pyadt.dllist import DoublyLinkedList
+
+Workload = Callable[[], object]
+
+
+class Scenario(NamedTuple):
+    name: str
+    setup: Callable[[int], Workload]
+    max_size: Optional[int]
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, max_size: Optional[int] = None) -> Callable:
+    """Register a setup function as the scenario called name.
+
+    Sizes above max_size are skipped, which keeps quadratic workloads
+    runnable.
+    """
+
+    def register(setup: Callable[[int], Workload]) -> Callable:
+        SCENARIOS[name] = Scenario(name, setup, max_size)
+        return setup
+
+    return register
+
+
+def _shuffled(size: int) -> list:
+    values = list(range(size))
+    Random(size).shuffle(values)
+    return values
+
+
+def _side(size: int) -> int:
+    # Matrix scenarios use size as the number of cells
+    return max(1, int(size**0.5))
+
+
+# Array
+
+
+@scenario("array.fill")
+def array_fill(size):
+    array = Array(size)
+
+    def run():
+        for i in range(size):
+            array[i] = i
+
+    return run
+
+
+@scenario("array.index")
+def array_index(size):
+    array = Array(size)
+    indices = _shuffled(size)
+
+    def run():
+        for i in indices:
+            array[i]
+
+    return run
+
+
+# Map
+
+
+@scenario("map.set", max_size=10_000)
+def map_set(size):
+    keys = _shuffled(size)
+
+    def run():
+        mapping = Map()
+        for key in keys:
+            mapping[key] = key
+
+    return run
+
+
+@scenario("map.get", max_size=10_000)
+def map_get(size):
+    keys = _shuffled(size)
+    mapping = Map.fromkeys(keys, 0)
+
+    def run():
+        for key in keys:
+            mapping[key]
+
+    return run
+
+
+@scenario("map.delete", max_size=10_000)
+def map_delete(size):
+    keys = _shuffled(size)
+    mapping = Map.fromkeys(keys, 0)
+
+    def run():
+        for key in keys:
+            del mapping[key]
+
+    return run
+
+
+# SortedMap
+
+
+@scenario("sortedmap.set")
+def sortedmap_set(size):
+    keys = _shuffled(size)
+
+    def run():
+        mapping = SortedMap()
+        for key in keys:
+            mapping[key] = key
+
+    return run
+
+
+@scenario("sortedmap.get")
+def sortedmap_get(size):
+    keys = _shuffled(size)
+    mapping = SortedMap.from_sorted((key, 0) for key in range(size))
+
+    def run():
+        for key in keys:
+            mapping[key]
+
+    return run
+
+
+@scenario("sortedmap.range")
+def sortedmap_range(size):
+    mapping = SortedMap.from_sorted((key, 0) for key in range(size))
+
+    def run():
+        for key in range(0, size, 10):
+            for _ in mapping.range(key, key + 10):
+                pass
+
+    return run
+
+
+# Set
+
+
+@scenario("set.add", max_size=10_000)
+def set_add(size):
+    values = _shuffled(size)
+
+    def run():
+        elements = Set()
+        for value in values:
+            elements.add(value)
+
+    return run
+
+
+@scenario("set.union", max_size=10_000)
+def set_union(size):
+    first, second = Set(range(size)), Set(range(size // 2, size + size // 2))
+    return lambda: first.union(second)
+
+
+@scenario("set.intersection", max_size=10_000)
+def set_intersection(size):
+    first, second = Set(range(size)), Set(range(size // 2, size + size // 2))
+    return lambda: first.intersection(second)
+
+
+@scenario("set.difference", max_size=10_000)
+def set_difference(size):
+    first, second = Set(range(size)), Set(range(size // 2, size + size // 2))
+    return lambda: first.difference(second)
+
+
+# SortedSet
+
+
+@scenario("sortedset.add")
+def sortedset_add(size):
+    values = _shuffled(size)
+
+    def run():
+        elements = SortedSet()
+        for value in values:
+            elements.add(value)
+
+    return run
+
+
+def _sortedset_operation(method: str) -> None:
+    @scenario(f"sortedset.{method}")
+    def setup(size):
+        first = SortedSet.from_sorted(range(size))
+        second = SortedSet.from_sorted(range(size // 2, size + size // 2))
+        return lambda: getattr(first, method)(second)
+
+
+for _method in ("union", "intersection", "difference"):
+    _sortedset_operation(_method)
+
+
+# Bag
+
+
+@scenario("bag.add")
+def bag_add(size):
+    values = _shuffled(size)
+
+    def run():
+        bag = Bag()
+        for value in values:
+            bag.add(value)
+
+    return run
+
+
+@scenario("bag.count", max_size=100_000)
+def bag_count(size):
+    bag = Bag(value % 100 for value in range(size))
+    return lambda: [bag.count(value) for value in range(100)]
+
+
+@scenario("bag.randpop", max_size=100_000)
+def bag_randpop(size):
+    bag = Bag(range(size))
+    pops = min(size, 100)
+
+    def run():
+        for _ in range(pops):
+            bag.randpop()
+
+    return run
+
+
+# Matrix
+
+
+@scenario("matrix.add", max_size=1_000_000)
+def matrix_add(size):
+    side = _side(size)
+    first, second = Matrix(side, side, 1), Matrix(side, side, 2)
+    return lambda: first + second
+
+
+@scenario("matrix.mul", max_size=10_000)
+def matrix_mul(size):
+    side = _side(size)
+    first, second = Matrix(side, side, 1), Matrix(side, side, 2)
+    return lambda: first * second
+
+
+@scenario("matrix.transpose")
+def matrix_transpose(size):
+    side = _side(size)
+    matrix = Matrix(side, side, 1)
+    return matrix.transpose
+
+
+# Stack and Queue
+
+
+@scenario("stack.push_pop")
+def stack_push_pop(size):
+    def run():
+        stack = Stack()
+        for i in range(size):
+            stack.push(i)
+        for _ in range(size):
+            stack.pop()
+
+    return run
+
+
+@scenario("queue.enqueue_dequeue")
+def queue_enqueue_dequeue(size):
+    def run():
+        queue = Queue()
+        for i in range(size):
+            queue.enqueue(i)
+        for _ in range(size):
+            queue.dequeue()
+
+    return run
+
+
+@scenario("aggstack.push_pop")
+def aggstack_push_pop(size):
+    def run():
+        stack = AggregateStack()
+        for i in range(size):
+            stack.push(i)
+        for _ in range(size):
+            stack.min()
+            stack.pop()
+
+    return run
+
+
+@scenario("pqueue.enqueue_dequeue")
+def pqueue_enqueue_dequeue(size):
+    priorities = _shuffled(size)
+
+    def run():
+        queue = PriorityQueue()
+        for priority in priorities:
+            queue.enqueue(priority, priority)
+        for _ in range(size):
+            queue.dequeue()
+
+    return run
+
+
+# Linked lists
+
+
+def _llist_scenarios(prefix: str, cls: type, append_max_size: int) -> None:
+    @scenario(f"{prefix}.append", max_size=append_max_size)
+    def append(size):
+        def run():
+            llist = cls()
+            for i in range(size):
+                llist.append(i)
+
+        return run
+
+    @scenario(f"{prefix}.insert", max_size=10_000)
+    def insert(size):
+        llist = cls(list(range(size)))
+        inserts = min(size, 100)
+
+        def run():
+            for i in range(inserts):
+                llist.insert(size // 2, i)
+
+        return run
+
+    @scenario(f"{prefix}.remove", max_size=10_000)
+    def remove(size):
+        values = _shuffled(size)[: min(size // 2, 100)]
+        llist = cls(list(range(size)))
+
+        def run():
+            for value in values:
+                llist.remove(value)
+
+        return run
+
+
+_llist_scenarios("llist", LinkedList, append_max_size=10_000)
+_llist_scenarios("dllist", DoublyLinkedList, append_max_size=None)
@@ -0,0 +1,78 @@
+"""Compare pyadt.WorkStealingPool against a pool sharing a single Queue.
+
+Both pools run the same recursive fork/join workload, a parallel tree sum.
+Workers that join a task run other pending tasks while they wait. With a
+single FIFO queue, those are often unrelated tasks that join in turn, so
+the call stack grows with the number of tasks instead of with the depth
+of the recursion. The benchmark raises the recursion limit to cope.
+
+Run with: python -m benchmarks.scheduler
+"""
+
+import sys
+import threading
+from timeit import timeit
+
+from pyadt import Queue, WorkStealingPool
+from pyadt.scheduler import Task
+
+SIZES = (10_000, 100_000, 1_000_000)
+WORKERS = (1, 2, 4, 8)
+CUTOFF = 256
+
+
+class SharedQueuePool(WorkStealingPool):
+    """Pool whose workers all take tasks from one shared Queue."""
+
+    def __init__(self, workers=None):
+        self._queue = Queue()
+        self._lock = threading.Lock()
+        super().__init__(workers)
+
+    def spawn(self, function, /, *args, **kwargs):
+        task = Task(self, function, args, kwargs)
+        with self._lock:
+            self._queue.enqueue(task)
+        self._work_available.set()
+        return task
+
+    def _find_task(self, worker):
+        with self._lock:
+            if self._queue.is_empty():
+                return None
+            return self._queue.dequeue()
+
+
+def tree_sum(pool, low, high):
+    if high - low <= CUTOFF:
+        return sum(range(low, high))
+    middle = (low + high) // 2
+    left = pool.spawn(tree_sum, pool, low, middle)
+    right = tree_sum(pool, middle, high)
+    return left.join() + right
+
+
+def main():
+    sys.setrecursionlimit(100_000)
+    threading.stack_size(512 * 1024 * 1024)
+    print(
+        f"{'size':>9} {'workers':>8} {'stealing (s)':>14} {'shared (s)':>12}"
+    )
+    for size in SIZES:
+        for workers in WORKERS:
+            times = []
+            for pool_class in (WorkStealingPool, SharedQueuePool):
+                with pool_class(workers) as pool:
+                    times.append(
+                        timeit(
+                            lambda: pool.run(tree_sum, pool, 0, size), number=3
+                        )
+                        / 3
+                    )
+            print(
+                f"{size:>9} {workers:>8} {times[0]:>14.6f} {times[1]:>12.6f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Compare pyadt.SortedMap against a sorted list managed with bisect.
+
+The baseline keeps parallel lists of keys and values. Lookups are as
+fast as they get in Python, but every insertion and deletion shifts the
+tail of both lists, so it's O(n).
+
+Run with: python -m benchmarks.sortedmap
+"""
+
+from bisect import bisect_left
+from random import Random
+from timeit import timeit
+
+from pyadt import SortedMap
+
+SIZES = (100, 1_000, 10_000, 100_000)
+
+
+class BisectMap:
+    """A minimal sorted map based on two lists and the bisect module."""
+
+    def __init__(self):
+        self.keys = []
+        self.values = []
+
+    def __setitem__(self, key, value):
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            self.values[index] = value
+        else:
+            self.keys.insert(index, key)
+            self.values.insert(index, value)
+
+    def __getitem__(self, key):
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return self.values[index]
+        raise KeyError(key)
+
+    def __delitem__(self, key):
+        index = bisect_left(self.keys, key)
+        if index == len(self.keys) or self.keys[index] != key:
+            raise KeyError(key)
+        del self.keys[index]
+        del self.values[index]
+
+    def range(self, low, high):
+        start, stop = bisect_left(self.keys, low), bisect_left(self.keys, high)
+        return zip(self.keys[start:stop], self.values[start:stop])
+
+
+def _keys(size):
+    keys = list(range(size))
+    Random(size).shuffle(keys)
+    return keys
+
+
+def _filled(cls, keys):
+    mapping = cls()
+    for key in keys:
+        mapping[key] = key
+    return mapping
+
+
+def bench_set(cls, keys):
+    _filled(cls, keys)
+
+
+def bench_get(mapping, keys):
+    for key in keys:
+        mapping[key]
+
+
+def bench_delete(mapping, keys):
+    for key in keys:
+        del mapping[key]
+
+
+def bench_range(mapping, keys):
+    # Scans of 10 keys starting at every key
+    for key in keys:
+        for _ in mapping.range(key, key + 10):
+            pass
+
+
+def main():
+    print(f"{'size':>8} {'scenario':<12} {'pyadt (s)':>12} {'bisect (s)':>12}")
+    for size in SIZES:
+        keys = _keys(size)
+        number = max(1, 10_000 // size)
+        rows = [
+            (
+                "set",
+                lambda: bench_set(SortedMap, keys),
+                lambda: bench_set(BisectMap, keys),
+            ),
+            (
+                "bulk load",
+                lambda: SortedMap.from_sorted(
+                    (key, key) for key in range(size)
+                ),
+                lambda: (list(range(size)), list(range(size))),
+            ),
+        ]
+        ours, theirs = _filled(SortedMap, keys), _filled(BisectMap, keys)
+        for name, bench in (("get", bench_get), ("range", bench_range)):
+            rows.append(
+                (
+                    name,
+                    lambda bench=bench: bench(ours, keys),
+                    lambda bench=bench: bench(theirs, keys),
+                )
+            )
+        for name, run_ours, run_theirs in rows:
+            ours_time = timeit(run_ours, number=number)
+            theirs_time = timeit(run_theirs, number=number)
+            print(
+                f"{size:>8} {name:<12} "
+                f"{ours_time / number:>12.6f} {theirs_time / number:>12.6f}"
+            )
+        # Deleting consumes the maps, so it's timed once
+        ours_time = timeit(lambda: bench_delete(ours, keys), number=1)
+        theirs_time = timeit(lambda: bench_delete(theirs, keys), number=1)
+        print(
+            f"{size:>8} {'delete':<12} {ours_time:>12.6f} {theirs_time:>12.6f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
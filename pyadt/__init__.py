@@ -1,12 +1,96 @@
-"""Provide the pyadt package."""
+"""Provide the pyadt package.
 
-from .array import Array
-from .bag import Bag
-from .llist import LinkedList
-from .map import Map
-from .matrix import Matrix
-from .queue import Queue
-from .set import Set
-from .stack import Stack
+The ADT classes are imported on first access, so importing one of them
+doesn't load the modules, and dependencies, of all the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "0.1.0"
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "AggregateQueue": "aggstack",
+    "AggregateStack": "aggstack",
+    "Array": "array",
+    "Bag": "bag",
+    "BloomFilter": "filters",
+    "ConcurrentMap": "concurrentmap",
+    "CountMinSketch": "sketches",
+    "CuckooFilter": "filters",
+    "DiskMap": "diskmap",
+    "HyperLogLog": "hyperloglog",
+    "IndexedMap": "indexedmap",
+    "IndexedPriorityQueue": "pqueue",
+    "IntSet": "intset",
+    "LinkedList": "llist",
+    "Map": "map",
+    "Matrix": "matrix",
+    "PersistentLinkedList": "persistent",
+    "PersistentStack": "persistent",
+    "PriorityQueue": "pqueue",
+    "Queue": "queue",
+    "Set": "set",
+    "SharedQueue": "shmqueue",
+    "SketchBag": "sketches",
+    "SortedMap": "sortedmap",
+    "SortedSet": "sortedset",
+    "SpaceSaving": "sketches",
+    "Stack": "stack",
+    "TTLMap": "ttlmap",
+    "WorkStealingDeque": "wsdeque",
+    "WorkStealingPool": "scheduler",
+    "instrument": None,
+}
+
+__all__ = sorted(_EXPORTS)
+
+if TYPE_CHECKING:
+    from . import instrument
+    from .aggstack import AggregateQueue, AggregateStack
+    from .array import Array
+    from .bag import Bag
+    from .concurrentmap import ConcurrentMap
+    from .diskmap import DiskMap
+    from .filters import BloomFilter, CuckooFilter
+    from .hyperloglog import HyperLogLog
+    from .indexedmap import IndexedMap
+    from .intset import IntSet
+    from .llist import LinkedList
+    from .map import Map
+    from .matrix import Matrix
+    from .persistent import PersistentLinkedList, PersistentStack
+    from .pqueue import IndexedPriorityQueue, PriorityQueue
+    from .queue import Queue
+    from .scheduler import WorkStealingPool
+    from .set import Set
+    from .shmqueue import SharedQueue
+    from .sketches import CountMinSketch, SketchBag, SpaceSaving
+    from .sortedmap import SortedMap
+    from .sortedset import SortedSet
+    from .stack import Stack
+    from .ttlmap import TTLMap
+    from .wsdeque import WorkStealingDeque
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    if module_name is None:  # A submodule exported as is
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        module = importlib.import_module(f".{module_name}", __name__)
+        value = getattr(module, name)
+    # Cache it, so later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    # Not set(), imported submodules such as pyadt.set shadow builtins here
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,298 @@
+"""Aggregate Stack and Queue abstract data types."""
+
+from collections import deque
+from operator import add
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from pyadt.stack import Stack
+from pyadt.utils import complexity
+
+Operations = Dict[str, Callable[[Any, Any], Any]]
+
+DEFAULT_OPERATIONS: Operations = {"min": min, "max": max, "sum": add}
+
+
+class AggregateStack(Stack):
+    """Implement a Stack that tracks running aggregates of its items.
+
+    Every level of the stack stores the aggregates of the items below it,
+    so querying an aggregate takes O(1). Aggregates are computed with
+    associative binary operations, min, max and sum by default.
+
+    >>> s = AggregateStack([3, 1, 4])
+    >>> s
+    AggregateStack([3, 1, 4])
+    >>> s.min(), s.max(), s.sum()
+    (1, 4, 8)
+    >>> s.pop()
+    4
+    >>> s.max()
+    3
+
+    >>> from math import gcd
+    >>> s = AggregateStack([12, 18], operations={"gcd": gcd})
+    >>> s.aggregate("gcd")
+    6
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Any]] = None,
+        /,
+        operations: Optional[Operations] = None,
+    ) -> None:
+        if operations is None:
+            operations = DEFAULT_OPERATIONS
+        self._names = {name: i for i, name in enumerate(operations)}
+        self._operations = tuple(operations.values())
+        self._aggregates: deque = deque()
+        super().__init__()
+        if iterable is not None:
+            for item in iterable:
+                self.push(item)
+
+    @complexity("O(1)")
+    def push(self, item: Any) -> None:
+        """Push an item onto the stack and update the aggregates.
+
+        >>> s = AggregateStack()
+        >>> s.push(42)
+        >>> s
+        AggregateStack([42])
+        >>> s.push([])
+        Traceback (most recent call last):
+        TypeError: '<' not supported between instances of 'list' and 'int'
+        """
+        if self._aggregates:
+            below = self._aggregates[-1]
+            aggregates = tuple(
+                self._combine(operation, value, item)
+                for operation, value in zip(self._operations, below)
+            )
+        else:
+            aggregates = (item,) * len(self._operations)
+        self._aggregates.append(aggregates)
+        super().push(item)
+
+    def _combine(self, operation: Callable, below: Any, item: Any) -> Any:
+        return operation(below, item)
+
+    @complexity("O(1)")
+    def pop(self) -> Any:
+        """Pop an item from the top of the stack.
+
+        >>> s = AggregateStack([1, 2])
+        >>> s.pop()
+        2
+        >>> s.pop()
+        1
+        >>> s.pop()
+        Traceback (most recent call last):
+        IndexError: pop from an empty stack
+        """
+        item = super().pop()
+        self._aggregates.pop()
+        return item
+
+    @complexity("O(1)")
+    def aggregate(self, name: str) -> Any:
+        """Return the aggregate computed by the operation called name.
+
+        >>> s = AggregateStack([2, 5])
+        >>> s.aggregate("sum")
+        7
+        >>> s.aggregate("product")
+        Traceback (most recent call last):
+        KeyError: 'unknown aggregate: product'
+        >>> AggregateStack().aggregate("sum")
+        Traceback (most recent call last):
+        IndexError: aggregate of an empty stack
+        """
+        index = self._index(name)
+        try:
+            return self._aggregates[-1][index]
+        except IndexError:
+            raise IndexError("aggregate of an empty stack") from None
+
+    def _index(self, name: str) -> int:
+        try:
+            return self._names[name]
+        except KeyError:
+            raise KeyError(f"unknown aggregate: {name}") from None
+
+    def min(self) -> Any:
+        """Return the smallest item in the stack."""
+        return self.aggregate("min")
+
+    def max(self) -> Any:
+        """Return the largest item in the stack."""
+        return self.aggregate("max")
+
+    def sum(self) -> Any:
+        """Return the sum of the items in the stack."""
+        return self.aggregate("sum")
+
+
+class _FrontStack(AggregateStack):
+    # Holds the oldest items of an AggregateQueue, the oldest on top, so
+    # every pushed item goes to the left of the items below it
+    def _combine(self, operation: Callable, below: Any, item: Any) -> Any:
+        return operation(item, below)
+
+
+class AggregateQueue:
+    """Implement a Queue (FIFO) that tracks running aggregates of its items.
+
+    The queue is built on two AggregateStack objects: enqueued items go to
+    the back stack and get moved to the front stack when it runs out of
+    items. All operations take amortized O(1) time, which makes the queue
+    a good fit for sliding-window aggregates. With maxlen, enqueuing to a
+    full queue dequeues the oldest item.
+
+    >>> q = AggregateQueue([5, 1, 3], maxlen=3)
+    >>> q.min(), q.max(), q.sum()
+    (1, 5, 9)
+    >>> q.enqueue(4)
+    >>> q
+    AggregateQueue([1, 3, 4])
+    >>> q.max()
+    4
+    >>> q.dequeue()
+    1
+    >>> q.min()
+    3
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Any]] = None,
+        /,
+        operations: Optional[Operations] = None,
+        maxlen: Optional[int] = None,
+    ) -> None:
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("maxlen must be at least 1")
+        self._maxlen = maxlen
+        self._front = _FrontStack(operations=operations)
+        self._back = AggregateStack(operations=operations)
+        if iterable is not None:
+            for item in iterable:
+                self.enqueue(item)
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        """Return the maximum length of the queue, or None if unbounded."""
+        return self._maxlen
+
+    def enqueue(self, item: Any) -> None:
+        """Add an item to the right end of the queue.
+
+        >>> q = AggregateQueue(maxlen=2)
+        >>> for number in range(1, 5):
+        ...     q.enqueue(number)
+        >>> q
+        AggregateQueue([3, 4])
+        """
+        if self._maxlen is not None and len(self) == self._maxlen:
+            self.dequeue()
+        self._back.push(item)
+
+    def dequeue(self) -> Any:
+        """Remove and return an item from the left end of the queue.
+
+        >>> q = AggregateQueue([1, 2])
+        >>> q.dequeue()
+        1
+        >>> q.dequeue()
+        2
+        >>> q.dequeue()
+        Traceback (most recent call last):
+        IndexError: dequeue from an empty queue
+        """
+        self._refill()
+        try:
+            return self._front.pop()
+        except IndexError:
+            raise IndexError("dequeue from an empty queue") from None
+
+    def front(self) -> Any:
+        """Return the item at the beginning of the queue.
+
+        >>> q = AggregateQueue([1, 2, 3])
+        >>> q.front()
+        1
+        """
+        self._refill()
+        try:
+            return self._front.top()
+        except IndexError:
+            raise IndexError("front from an empty queue") from None
+
+    def _refill(self) -> None:
+        if self._front.is_empty():
+            while not self._back.is_empty():
+                self._front.push(self._back.pop())
+
+    def is_empty(self) -> bool:
+        """Return True if the queue is empty, False otherwise.
+
+        >>> q = AggregateQueue()
+        >>> q.is_empty()
+        True
+        """
+        return len(self) == 0
+
+    @complexity("O(1)")
+    def aggregate(self, name: str) -> Any:
+        """Return the aggregate computed by the operation called name.
+
+        >>> q = AggregateQueue(["a", "b"], operations={"concat": str.__add__})
+        >>> q.enqueue("c")
+        >>> q.dequeue()
+        'a'
+        >>> q.aggregate("concat")
+        'bc'
+        """
+        if self._front.is_empty():
+            if self._back.is_empty():
+                # Validate the name before complaining about the size
+                self._back._index(name)
+                raise IndexError("aggregate of an empty queue")
+            return self._back.aggregate(name)
+        if self._back.is_empty():
+            return self._front.aggregate(name)
+        operation = self._back._operations[self._back._index(name)]
+        return operation(
+            self._front.aggregate(name), self._back.aggregate(name)
+        )
+
+    def min(self) -> Any:
+        """Return the smallest item in the queue."""
+        return self.aggregate("min")
+
+    def max(self) -> Any:
+        """Return the largest item in the queue."""
+        return self.aggregate("max")
+
+    def sum(self) -> Any:
+        """Return the sum of the items in the queue."""
+        return self.aggregate("sum")
+
+    def __len__(self) -> int:
+        return len(self._front) + len(self._back)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._front or item in self._back
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    __str__ = __repr__
+
+    def __iter__(self) -> Iterator:
+        yield from reversed(self._front)
+        yield from self._back
+
+    def __reversed__(self) -> Iterator:
+        yield from reversed(self._back)
+        yield from self._front
@@ -3,6 +3,8 @@
 import ctypes
 from typing import Any, Generator, Optional
 
+from pyadt.utils import complexity
+
 
 class Array:
     """Array abstract data type based on ctypes.py_object.
@@ -25,6 +27,7 @@ class Array:
         self._type = None
         self.clear()
 
+    @complexity("O(n)")
     def clear(self, value: Optional[Any] = None) -> None:
         """Clear the array by setting all its items to value.
 
@@ -46,12 +49,14 @@ class Array:
     def __contain__(self, value):
         return value in self._data
 
+    @complexity("O(1)")
     def __getitem__(self, index: int) -> Any:
         try:
             return self._data[index]
         except IndexError:
             raise IndexError(f"Index out of range: {index}") from None
 
+    @complexity("O(1)")
     def __setitem__(self, index: int, value: Any) -> None:
         try:
             self._data[index] = value
@@ -69,3 +74,9 @@ class Array:
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(size={self._size})"
+
+    def __reduce__(self) -> tuple:
+        # Imported here, pyadt.serialize imports this module
+        from pyadt.serialize import reduce
+
+        return reduce(self)
@@ -1,7 +1,11 @@
 """Bag abstract data type."""
 
+from itertools import chain
+from operator import index
 from random import choice as _choice
-from typing import Any, Counter, Iterable, List, Optional
+from typing import Any, Counter, Iterable, List, Optional, Tuple
+
+from pyadt.utils import complexity
 
 
 class Bag:
@@ -15,13 +19,32 @@ class Bag:
     Bag([1, 2, 3, 4])
     >>> len(b)
     4
+
+    Bags of hashable objects also keep the count of every distinct object,
+    so counting and the multiset operations don't scan the whole Bag.
+
+    >>> Bag("abracadabra").most_common(2)
+    [('a', 5), ('b', 2)]
     """
 
     def __init__(self, iterable: Optional[Iterable[Any]] = None, /) -> None:
         self._data: List[Any] = []
+        # Count of every distinct object, or None once an unhashable object
+        # was added, until a multiset operation can count them again
+        self._counts: Optional[Counter] = Counter()
         if iterable is not None:
-            self._data.extend(iterable)
+            self.add_many(iterable)
+
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[Any]], /) -> "Bag":
+        """Return a new Bag built from an iterable of chunks of values.
+
+        >>> Bag.from_iterable([[1, 2], [2, 3]])
+        Bag([1, 2, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
 
+    @complexity("O(1)")
     def add(self, value: Any) -> None:
         """Add an object to the Bag.
 
@@ -31,7 +54,50 @@ class Bag:
         Bag([1, 2])
         """
         self._data.append(value)
+        if self._counts is not None:
+            try:
+                self._counts[value] += 1
+            except TypeError:
+                self._counts = None
+
+    def add_many(
+        self, iterable: Iterable[Any], counts: Optional[Iterable[int]] = None
+    ) -> None:
+        """Add every object of iterable, or counts[i] times iterable[i].
+
+        >>> b = Bag([1])
+        >>> b.add_many([2, 3])
+        >>> b.add_many("xy", counts=[2, 1])
+        >>> b
+        Bag([1, 2, 3, 'x', 'x', 'y'])
+        >>> b.add_many("z", counts=[-1])
+        Traceback (most recent call last):
+        ValueError: count must be non-negative
+        >>> b.add_many("zw", counts=[1])
+        Traceback (most recent call last):
+        ValueError: iterable and counts must have the same length
+        """
+        start = len(self._data)
+        if counts is None:
+            self._data.extend(iterable)
+        else:
+            # Check every count first, so an error leaves the Bag unchanged
+            values, counts = list(iterable), [index(n) for n in counts]
+            if len(values) != len(counts):
+                raise ValueError(
+                    "iterable and counts must have the same length"
+                )
+            if any(count < 0 for count in counts):
+                raise ValueError("count must be non-negative")
+            for value, count in zip(values, counts):
+                self._data.extend([value] * count)
+        if self._counts is not None:
+            try:
+                self._counts.update(self._data[start:])
+            except TypeError:
+                self._counts = None
 
+    @complexity("O(n)")
     def remove(self, value: Any) -> None:
         """Remove an object from the Bag.
 
@@ -52,10 +118,20 @@ class Bag:
             raise ValueError(
                 f"{value} not in {self.__class__.__name__}"
             ) from None
+        self._discount(value)
 
+    def _discount(self, value: Any) -> None:
+        if self._counts is not None:
+            self._counts[value] -= 1
+            if not self._counts[value]:
+                del self._counts[value]
+
+    @complexity("O(1)")
     def count(self, value: Any) -> int:
         """Count the number of times an object appears in the Bag.
 
+        It takes O(n) time if the Bag holds unhashable objects.
+
         >>> b = Bag([1, 2, 2])
         >>> b.count(1)
         1
@@ -64,6 +140,11 @@ class Bag:
         >>> b.count(3)
         0
         """
+        if self._counts is not None:
+            try:
+                return self._counts[value]
+            except TypeError:
+                return 0
         return self._data.count(value)
 
     def clear(self) -> None:
@@ -75,7 +156,9 @@ class Bag:
         Bag([])
         """
         self._data.clear()
+        self._counts = Counter()
 
+    @complexity("O(1)")
     def pop(self) -> Any:
         """Pop an object from the right end of the Bag.
 
@@ -91,9 +174,11 @@ class Bag:
         IndexError: pop from empty bag
         """
         try:
-            return self._data.pop()
+            value = self._data.pop()
         except IndexError:
             raise IndexError("pop from empty bag") from None
+        self._discount(value)
+        return value
 
     def randpop(self) -> Any:
         """Pop a random object from the Bag.
@@ -106,7 +191,7 @@ class Bag:
             value: Any = _choice(self._data)
         except IndexError:
             raise IndexError("randpop from empty bag") from None
-        self._data.remove(value)
+        self.remove(value)
         return value
 
     def as_counter(self) -> Counter:
@@ -120,15 +205,107 @@ class Bag:
         Traceback (most recent call last):
         TypeError: unhashable type: 'list'
         """
-        try:
-            return Counter(self._data)
-        except TypeError:
-            raise
+        return Counter(self._counter())
+
+    def _counter(self) -> Counter:
+        # Unhashable objects may have been removed since they were added
+        if self._counts is None:
+            self._counts = Counter(self._data)
+        return self._counts
+
+    @classmethod
+    def _from_counts(cls, counts: Counter) -> "Bag":
+        new_bag = cls()
+        new_bag._data.extend(counts.elements())
+        new_bag._counts = counts
+        return new_bag
+
+    def _validate_other(self, other: "Bag") -> None:
+        if other.__class__ is not self.__class__:
+            raise TypeError("Bag object expected")
+
+    @complexity("O(n)")
+    def sum(self, other: "Bag") -> "Bag":
+        """Return a new Bag with the objects of both Bags.
+
+        The multiset operations combine the counts of the distinct objects,
+        and raise TypeError if either Bag holds unhashable objects.
+
+        >>> Bag([1, 1, 2]).sum(Bag([1, 3]))
+        Bag([1, 1, 1, 2, 3])
+        """
+        self._validate_other(other)
+        return self._from_counts(self._counter() + other._counter())
+
+    @complexity("O(n)")
+    def union(self, other: "Bag") -> "Bag":
+        """Return a new Bag with the largest count of every object.
+
+        >>> Bag([1, 1, 2]).union(Bag([1, 3]))
+        Bag([1, 1, 2, 3])
+        """
+        self._validate_other(other)
+        return self._from_counts(self._counter() | other._counter())
+
+    @complexity("O(n)")
+    def intersection(self, other: "Bag") -> "Bag":
+        """Return a new Bag with the smallest count of every object.
+
+        >>> Bag([1, 1, 2]).intersection(Bag([1, 1, 1, 3]))
+        Bag([1, 1])
+        """
+        self._validate_other(other)
+        return self._from_counts(self._counter() & other._counter())
+
+    @complexity("O(n)")
+    def difference(self, other: "Bag") -> "Bag":
+        """Return a new Bag with the objects of the Bag not in other.
+
+        Every object in other cancels out one occurrence in the Bag.
+
+        >>> Bag([1, 1, 2]).difference(Bag([1, 3]))
+        Bag([1, 2])
+        """
+        self._validate_other(other)
+        return self._from_counts(self._counter() - other._counter())
+
+    @complexity("O(n)")
+    def is_subbag(self, other: "Bag") -> bool:
+        """Return True if other has every object at least as many times.
+
+        >>> Bag([1, 2]).is_subbag(Bag([1, 1, 2]))
+        True
+        >>> Bag([1, 1]).is_subbag(Bag([1, 2]))
+        False
+        """
+        self._validate_other(other)
+        if len(self) > len(other):
+            return False
+        counts = other._counter()
+        return all(
+            count <= counts[value] for value, count in self._counter().items()
+        )
+
+    @complexity("O(n log n)")
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """Return the k most common objects and their counts.
+
+        Objects with the same count are in the order they were first added.
+
+        >>> Bag([1, 2, 2, 3, 3, 3]).most_common(2)
+        [(3, 3), (2, 2)]
+        """
+        return self._counter().most_common(k)
 
     def __len__(self) -> int:
         return len(self._data)
 
     def __contains__(self, value: Any) -> bool:
+        if self._counts is not None:
+            try:
+                return value in self._counts
+            except TypeError:
+                return False
         return value in self._data
 
     def __iter__(self):
@@ -141,3 +318,9 @@ class Bag:
         return f"{self.__class__.__name__}({self._data})"
 
     __str__ = __repr__
+
+    def __reduce__(self) -> tuple:
+        # Imported here, pyadt.serialize imports this module
+        from pyadt.serialize import reduce
+
+        return reduce(self)
@@ -0,0 +1,910 @@
+"""Check the time complexity declared by the pyadt abstract data types.
+
+Methods declare their expected complexity with the pyadt.utils.complexity
+decorator. This module times every declared method at growing sizes,
+fits the timings against the usual complexity classes, and reports the
+methods that grow faster than declared.
+
+>>> fit([256, 512, 1024, 2048], [3.0, 3.0, 3.0, 3.0])
+'O(1)'
+>>> fit([256, 512, 1024, 2048], [2.0, 4.0, 8.0, 16.0])
+'O(n)'
+
+Run every check from the command line with:
+
+    python -m pyadt.complexity
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from fnmatch import fnmatch
+from math import isqrt, log, log2
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from pyadt.aggstack import AggregateQueue, AggregateStack
+from pyadt.array import Array
+from pyadt.bag import Bag
+from pyadt.concurrentmap import ConcurrentMap
+from pyadt.diskmap import DiskMap
+from pyadt.dllist import DoublyLinkedList
+from pyadt.filters import BloomFilter, CuckooFilter
+from pyadt.hyperloglog import HyperLogLog
+from pyadt.indexedmap import IndexedMap
+from pyadt.intset import IntSet
+from pyadt.llist import LinkedList
+from pyadt.map import Map
+from pyadt.matrix import Matrix
+from pyadt.persistent import PersistentLinkedList, PersistentStack
+from pyadt.pqueue import IndexedPriorityQueue, PriorityQueue
+from pyadt.queue import Queue
+from pyadt.set import Set
+from pyadt.sketches import CountMinSketch, SketchBag, SpaceSaving
+from pyadt.sortedmap import SortedMap
+from pyadt.sortedset import SortedSet
+from pyadt.stack import Stack
+from pyadt.ttlmap import TTLMap
+from pyadt.utils import COMPLEXITY_CLASSES
+
+SIZES = (256, 512, 1024, 2048, 4096, 8192, 16384)
+QUADRATIC_SIZES = (32, 64, 128, 256, 512)
+# Operations per timed run of cheap methods, so timer resolution is no issue
+OPERATIONS = 200
+REPEATS = 5
+# How much faster than declared a method may grow before it fails. Timings
+# are noisy and caches make large containers slower per operation, so the
+# check catches an extra factor of n, not one of log n
+SLACK = 0.3
+
+MODELS: Dict[str, Callable[[int], float]] = {
+    "O(log n)": lambda n: log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * log2(n),
+    "O(n^2)": lambda n: n * n,
+}
+
+Workload = Callable[[], object]
+
+
+class Probe(NamedTuple):
+    cls: type
+    method: str
+    setup: Callable[[int], Workload]
+    sizes: Sequence[int]
+
+    @property
+    def name(self) -> str:
+        return f"{self.cls.__name__}.{self.method}"
+
+    @property
+    def declared(self) -> str:
+        return getattr(self.cls, self.method).__complexity__
+
+
+class Result(NamedTuple):
+    name: str
+    declared: str
+    measured: str
+    exponent: float
+    passed: bool
+
+
+PROBES: List[Probe] = []
+
+
+def probe(cls: type, method: str, sizes: Sequence[int] = SIZES) -> Callable:
+    """Register a setup function that exercises cls.method.
+
+    The setup function takes a size and returns a callable calling the
+    method a fixed number of times on a container of that size.
+    """
+
+    def register(setup: Callable[[int], Workload]) -> Callable:
+        PROBES.append(Probe(cls, method, setup, sizes))
+        return setup
+
+    return register
+
+
+def declarations(cls: type) -> Dict[str, str]:
+    """Return the complexity declared by each method of cls.
+
+    >>> declarations(Stack)
+    {'pop': 'O(1)', 'push': 'O(1)', 'top': 'O(1)'}
+    """
+    declared = {}
+    for name in dir(cls):
+        # Skip private aliases such as __append_left = append_left
+        if name.startswith("_") and not name.endswith("__"):
+            continue
+        expected = getattr(getattr(cls, name), "__complexity__", None)
+        if expected is not None:
+            declared[name] = expected
+    return declared
+
+
+def _slope(x: Sequence[float], y: Sequence[float]) -> float:
+    # Least squares slope of y against x
+    mean_x, mean_y = sum(x) / len(x), sum(y) / len(y)
+    variance = sum((xi - mean_x) ** 2 for xi in x)
+    covariance = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
+    return covariance / variance
+
+
+def growth(sizes: Sequence[int], values: Sequence[float]) -> float:
+    """Return the exponent k that best fits values ~ sizes**k.
+
+    >>> growth([16, 32, 64, 128], [1.0, 4.0, 16.0, 64.0])
+    2.0
+    """
+    return _slope([log(n) for n in sizes], [log(v) for v in values])
+
+
+def expected_growth(declared: str, sizes: Sequence[int]) -> float:
+    """Return the exponent that the complexity class declared has at sizes.
+
+    Only O(1), O(n) and O(n^2) have a fixed exponent. The exponents of
+    O(log n) and O(n log n) depend on the sizes.
+
+    >>> expected_growth("O(n)", [16, 32, 64, 128])
+    1.0
+    """
+    if declared == "O(1)":
+        return 0.0
+    model = MODELS[declared]
+    return growth(sizes, [model(n) for n in sizes])
+
+
+def fit(sizes: Sequence[int], times: Sequence[float]) -> str:
+    """Return the complexity class whose growth is closest to times.
+
+    >>> fit([16, 32, 64, 128], [3.0, 3.1, 2.9, 3.0])
+    'O(1)'
+    >>> fit([16, 32, 64, 128], [2.0, 4.0, 8.0, 16.0])
+    'O(n)'
+    >>> fit([16, 32, 64, 128], [1.0, 4.0, 16.0, 64.0])
+    'O(n^2)'
+    """
+    measured = growth(sizes, times)
+    return min(
+        COMPLEXITY_CLASSES,
+        key=lambda name: abs(expected_growth(name, sizes) - measured),
+    )
+
+
+def measure(
+    target: Probe, sizes: Optional[Sequence[int]] = None
+) -> List[float]:
+    """Return the best time of several runs of target at every size."""
+    times = []
+    for size in sizes or target.sizes:
+        best = float("inf")
+        for _ in range(REPEATS):
+            run = target.setup(size)
+            start = perf_counter()
+            run()
+            best = min(best, perf_counter() - start)
+        times.append(best)
+    return times
+
+
+def verify(
+    pattern: str = "*", report: Optional[Callable] = None
+) -> List[Result]:
+    """Check every probe whose name matches pattern, e.g. 'Map.*'."""
+    results = []
+    for each in PROBES:
+        if not fnmatch(each.name, pattern):
+            continue
+        times = measure(each)
+        exponent = growth(each.sizes, times)
+        limit = expected_growth(each.declared, each.sizes) + SLACK
+        results.append(
+            Result(
+                each.name,
+                each.declared,
+                fit(each.sizes, times),
+                exponent,
+                exponent <= limit,
+            )
+        )
+        if report is not None:
+            report(results[-1])
+    return results
+
+
+def _repeat(operation: Callable[[int], object], times: int = OPERATIONS):
+    def run():
+        for i in range(times):
+            operation(i)
+
+    return run
+
+
+# Setup helpers fill the containers directly, since building them through
+# their public interface is quadratic for the list based ADTs
+
+
+def _filled_map(size: int, cls: type = Map) -> Map:
+    mapping = cls()
+    mapping._keys = list(range(size))
+    mapping._values = list(range(size))
+    return mapping
+
+
+def _filled_ttlmap(size: int, cls: type = TTLMap) -> TTLMap:
+    # Every item gets a deadline, so the probes also pay for the heap
+    return cls(((key, key) for key in range(size)), ttl=3600)
+
+
+def _filled_indexedmap(size: int, cls: type = IndexedMap) -> IndexedMap:
+    mapping = _filled_map(size, cls)
+    mapping.add_index("parity", lambda value: value % 2)
+    mapping.add_index("value", lambda value: value, sorted=True)
+    return mapping
+
+
+def _filled_set(size: int, start: int = 0) -> Set:
+    elements = Set()
+    elements._data = list(range(start, start + size))
+    return elements
+
+
+# Array
+
+
+@probe(Array, "__getitem__")
+def _array_getitem(size):
+    array = Array(size)
+    return _repeat(lambda i: array[size - 1])
+
+
+@probe(Array, "__setitem__")
+def _array_setitem(size):
+    array = Array(size)
+    return _repeat(lambda i: array.__setitem__(size - 1, i))
+
+
+@probe(Array, "clear")
+def _array_clear(size):
+    return Array(size).clear
+
+
+# Map
+
+
+def _map_probes(
+    cls: type, filled: Callable[[int, type], Map] = _filled_map
+) -> None:
+    @probe(cls, "__getitem__")
+    def getitem(size):
+        mapping = filled(size, cls)
+        return _repeat(lambda i: mapping[size - 1])
+
+    @probe(cls, "get")
+    def get(size):
+        mapping = filled(size, cls)
+        return _repeat(lambda i: mapping.get(size - 1))
+
+    @probe(cls, "__setitem__")
+    def setitem(size):
+        mapping = filled(size, cls)
+        return _repeat(lambda i: mapping.__setitem__(size + i, i))
+
+    @probe(cls, "__delitem__")
+    def delitem(size):
+        mapping = filled(size, cls)
+        return _repeat(lambda i: mapping.__delitem__(size - 1 - i))
+
+    @probe(cls, "pop")
+    def pop(size):
+        mapping = filled(size, cls)
+        return _repeat(lambda i: mapping.pop(size - 1 - i))
+
+    @probe(cls, "popitem")
+    def popitem(size):
+        mapping = filled(size, cls)
+        return _repeat(lambda i: mapping.popitem())
+
+    # The bulk operations get a batch of half as many keys as the map has
+
+    @probe(cls, "get_many")
+    def get_many(size):
+        mapping = filled(size, cls)
+        return lambda: mapping.get_many(range(0, size, 2))
+
+    @probe(cls, "set_many")
+    def set_many(size):
+        mapping = filled(size, cls)
+        return lambda: mapping.set_many((key, 0) for key in range(0, size, 2))
+
+    @probe(cls, "delete_many")
+    def delete_many(size):
+        mapping = filled(size, cls)
+        return lambda: mapping.delete_many(range(0, size, 2))
+
+    @probe(cls, "merge")
+    def merge(size):
+        mapping, other = filled(size, cls), filled(size // 2, cls)
+        return lambda: mapping.merge(other, max)
+
+    @probe(cls, "__eq__")
+    def eq(size):
+        mapping, other = filled(size, cls), filled(size, cls)
+        items = list(other.items())
+        other.clear()
+        other.update(reversed(items))
+        return lambda: mapping == other
+
+
+_map_probes(Map)
+_map_probes(TTLMap, _filled_ttlmap)
+_map_probes(IndexedMap, _filled_indexedmap)
+
+
+@probe(IndexedMap, "find_by")
+def _indexedmap_find_by(size):
+    mapping = _filled_indexedmap(size)
+    return _repeat(lambda i: mapping.find_by("value", i), 10)
+
+
+@probe(IndexedMap, "find_range")
+def _indexedmap_find_range(size):
+    mapping = _filled_indexedmap(size)
+    return _repeat(lambda i: mapping.find_range("value", i, i + 4), 10)
+
+
+@probe(TTLMap, "set")
+def _ttlmap_set(size):
+    mapping = _filled_ttlmap(size)
+    return _repeat(lambda i: mapping.set(size + i, i, ttl=60), 10)
+
+
+# DiskMap, in a temporary directory removed at exit
+
+_diskmaps: List[DiskMap] = []
+_diskmap_directory: List[tempfile.TemporaryDirectory] = []
+
+
+def _filled_diskmap(size: int) -> DiskMap:
+    # Close the map of the previous run, so files don't pile up
+    while _diskmaps:
+        _diskmaps.pop().close()
+    if not _diskmap_directory:
+        _diskmap_directory.append(tempfile.TemporaryDirectory())
+    path = f"{_diskmap_directory[0].name}/{size}"
+    for suffix in ("", ".index"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    mapping = DiskMap(path, fsync=False)
+    mapping.set_many((key, key) for key in range(size))
+    _diskmaps.append(mapping)
+    return mapping
+
+
+def _diskmap_probe(method: str, operation: Callable) -> None:
+    @probe(DiskMap, method)
+    def setup(size):
+        mapping = _filled_diskmap(size)
+        return _repeat(lambda i: operation(mapping, size, i))
+
+
+_diskmap_probe("__getitem__", lambda m, size, i: m[size - 1 - i])
+_diskmap_probe("get", lambda m, size, i: m.get(size - 1 - i))
+_diskmap_probe("__setitem__", lambda m, size, i: m.__setitem__(i, -i))
+_diskmap_probe("__delitem__", lambda m, size, i: m.__delitem__(i))
+_diskmap_probe("pop", lambda m, size, i: m.pop(i))
+
+
+# ConcurrentMap
+
+
+def _concurrentmap_probe(method: str, operation: Callable) -> None:
+    @probe(ConcurrentMap, method)
+    def setup(size):
+        mapping = ConcurrentMap((key, key) for key in range(size))
+        return _repeat(lambda i: operation(mapping, size, i))
+
+
+_concurrentmap_probe("__getitem__", lambda m, size, i: m[size - 1 - i])
+_concurrentmap_probe("get", lambda m, size, i: m.get(size - 1 - i))
+_concurrentmap_probe("__setitem__", lambda m, size, i: m.__setitem__(i, i))
+_concurrentmap_probe("__delitem__", lambda m, size, i: m.__delitem__(i))
+_concurrentmap_probe("pop", lambda m, size, i: m.pop(i))
+_concurrentmap_probe("set_default", lambda m, size, i: m.set_default(-i))
+_concurrentmap_probe(
+    "compute_if_absent", lambda m, size, i: m.compute_if_absent(-i, abs)
+)
+
+
+# SortedMap
+
+
+def _filled_sortedmap(size: int) -> SortedMap:
+    return SortedMap.from_sorted((key, key) for key in range(size))
+
+
+@probe(SortedMap, "from_sorted")
+def _sortedmap_from_sorted(size):
+    items = [(key, key) for key in range(size)]
+    return lambda: SortedMap.from_sorted(items)
+
+
+@probe(SortedMap, "__getitem__")
+def _sortedmap_getitem(size):
+    mapping = _filled_sortedmap(size)
+    return _repeat(lambda i: mapping[size - 1 - i])
+
+
+@probe(SortedMap, "__setitem__")
+def _sortedmap_setitem(size):
+    mapping = _filled_sortedmap(size)
+    return _repeat(lambda i: mapping.__setitem__(size - 0.5 - i, i))
+
+
+@probe(SortedMap, "pop_first")
+def _sortedmap_pop_first(size):
+    mapping = _filled_sortedmap(size)
+    return _repeat(lambda i: mapping.pop_first())
+
+
+@probe(SortedMap, "pop_last")
+def _sortedmap_pop_last(size):
+    mapping = _filled_sortedmap(size)
+    return _repeat(lambda i: mapping.pop_last())
+
+
+def _sortedmap_by_key(method: str) -> None:
+    @probe(SortedMap, method)
+    def setup(size):
+        mapping = _filled_sortedmap(size)
+        # Keys, or indexes for select, from the end of the map
+        return _repeat(lambda i: getattr(mapping, method)(size - 1 - i))
+
+
+for _method in ("__delitem__", "pop", "floor", "ceiling", "rank", "select"):
+    _sortedmap_by_key(_method)
+
+
+# Set
+
+
+@probe(Set, "add")
+def _set_add(size):
+    elements = _filled_set(size)
+    return _repeat(lambda i: elements.add(size + i), 10)
+
+
+@probe(Set, "remove")
+def _set_remove(size):
+    elements = _filled_set(size)
+    return _repeat(lambda i: elements.remove(size - 1 - i), 10)
+
+
+@probe(Set, "pop")
+def _set_pop(size):
+    elements = _filled_set(size)
+    return _repeat(lambda i: elements.pop())
+
+
+def _set_operation(method: str, sizes: Sequence[int] = SIZES) -> None:
+    @probe(Set, method, sizes)
+    def setup(size):
+        # A subset, so is_subset has to look every element up
+        first = _filled_set(size, start=size // 2)
+        second = _filled_set(2 * size)
+        return lambda: getattr(first, method)(second)
+
+
+_set_operation("is_subset", QUADRATIC_SIZES)
+for _method in ("union", "intersection", "difference"):
+    _set_operation(_method)
+
+
+# SortedSet
+
+
+def _filled_sortedset(size: int, start: int = 0) -> SortedSet:
+    return SortedSet.from_sorted(range(start, start + size))
+
+
+@probe(SortedSet, "from_sorted")
+def _sortedset_from_sorted(size):
+    elements = list(range(size))
+    return lambda: SortedSet.from_sorted(elements)
+
+
+@probe(SortedSet, "add")
+def _sortedset_add(size):
+    elements = _filled_sortedset(size)
+    return _repeat(lambda i: elements.add(size - 0.5 - i))
+
+
+@probe(SortedSet, "pop")
+def _sortedset_pop(size):
+    elements = _filled_sortedset(size)
+    return _repeat(lambda i: elements.pop())
+
+
+def _sortedset_by_element(method: str) -> None:
+    @probe(SortedSet, method)
+    def setup(size):
+        elements = _filled_sortedset(size)
+        return _repeat(lambda i: getattr(elements, method)(size - 1 - i))
+
+
+for _method in ("remove", "rank", "index", "__getitem__", "__contains__"):
+    _sortedset_by_element(_method)
+
+
+def _sortedset_operation(method: str) -> None:
+    @probe(SortedSet, method)
+    def setup(size):
+        # A subset, so is_subset has to merge every element
+        first = _filled_sortedset(size, start=size // 2)
+        second = _filled_sortedset(2 * size)
+        return lambda: getattr(first, method)(second)
+
+
+for _method in ("is_subset", "union", "intersection", "difference"):
+    _sortedset_operation(_method)
+
+
+# IntSet, with sparse values, so that containers stay arrays
+
+
+def _sparse_intset(size: int, start: int = 0) -> IntSet:
+    return IntSet(range(start * 100, (start + size) * 100, 100))
+
+
+@probe(IntSet, "add")
+def _intset_add(size):
+    elements = _sparse_intset(size)
+    return _repeat(lambda i: elements.add(size * 100 - 50 - i))
+
+
+@probe(IntSet, "pop")
+def _intset_pop(size):
+    elements = _sparse_intset(size)
+    return _repeat(lambda i: elements.pop())
+
+
+def _intset_by_value(method: str) -> None:
+    @probe(IntSet, method)
+    def setup(size):
+        elements = _sparse_intset(size)
+        return _repeat(
+            lambda i: getattr(elements, method)((size - 1 - i) * 100)
+        )
+
+
+for _method in ("remove", "__contains__"):
+    _intset_by_value(_method)
+
+
+def _intset_operation(method: str) -> None:
+    @probe(IntSet, method)
+    def setup(size):
+        first = _sparse_intset(size, start=size // 2)
+        second = _sparse_intset(2 * size)
+        return lambda: getattr(first, method)(second)
+
+
+for _method in ("is_subset", "union", "intersection", "difference"):
+    _intset_operation(_method)
+
+
+# Filters
+
+
+def _filter_probes(cls: type) -> None:
+    def filled(size):
+        approximate = cls(2 * size)
+        approximate.add_many(range(size))
+        return approximate
+
+    @probe(cls, "add")
+    def add(size):
+        approximate = filled(size)
+        return _repeat(lambda i: approximate.add(size + i))
+
+    @probe(cls, "__contains__")
+    def contains(size):
+        approximate = filled(size)
+        return _repeat(lambda i: approximate.__contains__(size - 1 - i))
+
+
+_filter_probes(BloomFilter)
+_filter_probes(CuckooFilter)
+
+
+@probe(CuckooFilter, "remove")
+def _cuckoo_remove(size):
+    cuckoo = CuckooFilter(size)
+    cuckoo.add_many(range(size))
+    return _repeat(lambda i: cuckoo.remove(size - 1 - i))
+
+
+# Sketches, where size is the number of values added
+
+
+def _sketch_probes(cls: type, add: str, query: str) -> None:
+    def filled(size):
+        sketch = cls()
+        for value in range(size):
+            getattr(sketch, add)(value)
+        return sketch
+
+    @probe(cls, add)
+    def add_setup(size):
+        sketch = filled(size)
+        return _repeat(lambda i: getattr(sketch, add)(i))
+
+    @probe(cls, query)
+    def query_setup(size):
+        sketch = filled(size)
+        return _repeat(lambda i: getattr(sketch, query)(i))
+
+
+_sketch_probes(CountMinSketch, "add", "estimate")
+_sketch_probes(SketchBag, "add", "count")
+
+
+@probe(SpaceSaving, "add")
+def _spacesaving_add(size):
+    # Monitoring size items, so that every new item evicts one
+    top = SpaceSaving(size)
+    for item in range(size):
+        top.add(item)
+    return _repeat(lambda i: top.add(size + i))
+
+
+@probe(HyperLogLog, "add")
+def _hyperloglog_add(size):
+    hll = HyperLogLog(range(size))
+    return _repeat(lambda i: hll.add(size + i))
+
+
+# Bag
+
+
+@probe(Bag, "add")
+def _bag_add(size):
+    bag = Bag(range(size))
+    return _repeat(bag.add)
+
+
+@probe(Bag, "remove")
+def _bag_remove(size):
+    bag = Bag(range(size))
+    return _repeat(lambda i: bag.remove(size - 1 - i), 10)
+
+
+@probe(Bag, "count")
+def _bag_count(size):
+    bag = Bag(range(size))
+    return _repeat(bag.count, 10)
+
+
+@probe(Bag, "pop")
+def _bag_pop(size):
+    bag = Bag(range(size))
+    return _repeat(lambda i: bag.pop())
+
+
+def _bag_operation(method: str) -> None:
+    @probe(Bag, method)
+    def setup(size):
+        # A subbag, so is_subbag has to compare every count
+        first = Bag(range(size))
+        second = Bag(range(2 * size))
+        second.add_many(range(size))
+        return lambda: getattr(first, method)(second)
+
+
+for _method in ("sum", "union", "intersection", "difference", "is_subbag"):
+    _bag_operation(_method)
+
+
+@probe(Bag, "most_common")
+def _bag_most_common(size):
+    bag = Bag(range(size))
+    bag.add_many(range(0, size, 2))
+    return lambda: bag.most_common(10)
+
+
+# Matrix, where size is the number of cells
+
+
+@probe(Matrix, "transpose")
+def _matrix_transpose(size):
+    side = isqrt(size)
+    return Matrix(side, side, 1).transpose
+
+
+@probe(Matrix, "__add__")
+def _matrix_add(size):
+    side = isqrt(size)
+    first, second = Matrix(side, side, 1), Matrix(side, side, 2)
+    return lambda: first + second
+
+
+# Stacks and queues
+
+
+def _stack_probes(cls: type) -> None:
+    @probe(cls, "push")
+    def push(size):
+        stack = cls(range(size))
+        return _repeat(stack.push)
+
+    @probe(cls, "pop")
+    def pop(size):
+        stack = cls(range(size))
+        return _repeat(lambda i: stack.pop())
+
+    @probe(cls, "top")
+    def top(size):
+        stack = cls(range(size))
+        return _repeat(lambda i: stack.top())
+
+
+_stack_probes(Stack)
+_stack_probes(AggregateStack)
+
+
+@probe(AggregateStack, "aggregate")
+def _aggstack_aggregate(size):
+    stack = AggregateStack(range(size))
+    return _repeat(lambda i: stack.aggregate("sum"))
+
+
+@probe(AggregateQueue, "aggregate")
+def _aggqueue_aggregate(size):
+    queue = AggregateQueue(range(size))
+    return _repeat(lambda i: queue.aggregate("sum"))
+
+
+@probe(Queue, "enqueue")
+def _queue_enqueue(size):
+    queue = Queue(range(size))
+    return _repeat(queue.enqueue)
+
+
+@probe(Queue, "dequeue")
+def _queue_dequeue(size):
+    queue = Queue(range(size))
+    return _repeat(lambda i: queue.dequeue())
+
+
+@probe(Queue, "front")
+def _queue_front(size):
+    queue = Queue(range(size))
+    return _repeat(lambda i: queue.front())
+
+
+# Priority queues
+
+
+def _pqueue_probes(cls: type) -> None:
+    @probe(cls, "enqueue")
+    def enqueue(size):
+        queue = cls((i, i) for i in range(size))
+        # Decreasing priorities sift every new item up to the root
+        return _repeat(lambda i: queue.enqueue(i, -i))
+
+    @probe(cls, "dequeue")
+    def dequeue(size):
+        queue = cls((i, i) for i in range(size))
+        return _repeat(lambda i: queue.dequeue())
+
+    @probe(cls, "front")
+    def front(size):
+        queue = cls((i, i) for i in range(size))
+        return _repeat(lambda i: queue.front())
+
+
+_pqueue_probes(PriorityQueue)
+_pqueue_probes(IndexedPriorityQueue)
+
+
+@probe(IndexedPriorityQueue, "update_priority")
+def _ipqueue_update_priority(size):
+    queue = IndexedPriorityQueue((i, i) for i in range(size))
+    handles = list(queue.handles())[-OPERATIONS:]
+    return _repeat(lambda i: queue.update_priority(handles[i], -i))
+
+
+@probe(IndexedPriorityQueue, "remove")
+def _ipqueue_remove(size):
+    queue = IndexedPriorityQueue((i, i) for i in range(size))
+    handles = list(queue.handles())[-OPERATIONS:]
+    return _repeat(lambda i: queue.remove(handles[i]))
+
+
+# Linked lists
+
+
+def _llist_probes(cls: type) -> None:
+    @probe(cls, "append_left")
+    def append_left(size):
+        llist = cls(list(range(size)))
+        return _repeat(llist.append_left)
+
+    @probe(cls, "append")
+    def append(size):
+        llist = cls(list(range(size)))
+        return _repeat(llist.append, 10)
+
+    @probe(cls, "insert")
+    def insert(size):
+        llist = cls(list(range(size)))
+        return _repeat(lambda i: llist.insert(size - 1, i), 10)
+
+    @probe(cls, "remove")
+    def remove(size):
+        llist = cls(list(range(size)))
+        # Values next to the tail, as removing the tail itself may be O(1)
+        return _repeat(lambda i: llist.remove(size - 2 - i), 10)
+
+
+_llist_probes(LinkedList)
+_llist_probes(DoublyLinkedList)
+
+
+@probe(LinkedList, "reverse")
+def _llist_reverse(size):
+    return LinkedList(list(range(size))).reverse
+
+
+@probe(PersistentStack, "push")
+def _pstack_push(size):
+    stack = PersistentStack(range(size))
+    return _repeat(stack.push)
+
+
+@probe(PersistentStack, "pop")
+def _pstack_pop(size):
+    stack = PersistentStack(range(size))
+    return _repeat(lambda i: stack.pop())
+
+
+@probe(PersistentLinkedList, "append_left")
+def _pllist_append_left(size):
+    llist = PersistentLinkedList(range(size))
+    return _repeat(llist.append_left)
+
+
+@probe(PersistentLinkedList, "append")
+def _pllist_append(size):
+    llist = PersistentLinkedList(range(size))
+    return _repeat(llist.append, 10)
+
+
+def _report(result: Result) -> None:
+    status = "ok" if result.passed else "FAIL"
+    print(
+        f"{result.name:<36} {result.declared:>10} {result.measured:>10}"
+        f" {result.exponent:>8.2f} {status:>6}",
+        flush=True,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pyadt.complexity")
+    parser.add_argument(
+        "--filter", default="*", help="glob pattern, e.g. 'Map.*'"
+    )
+    args = parser.parse_args(argv)
+    print(
+        f"{'method':<36} {'declared':>10} {'measured':>10}"
+        f" {'exponent':>8} {'status':>6}"
+    )
+    results = verify(args.filter, report=_report)
+    return 0 if all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
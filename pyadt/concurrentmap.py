@@ -0,0 +1,232 @@
+"""Concurrent map abstract data type."""
+
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pyadt.map import Items
+from pyadt.utils import complexity
+
+_MISSING = object()
+
+
+class _Shard:
+    __slots__ = ("lock", "data")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.data: Dict[Any, Any] = {}
+
+
+class ConcurrentMap:
+    """Implement a map that many threads can read and write at once.
+
+    Keys are spread over shards by hash, and every shard has its own lock,
+    so writers only wait for writers of keys in the same shard. Reads
+    don't take any lock, since getting a key from a dict is atomic.
+    Iteration goes shard by shard, not in insertion order.
+
+    >>> m = ConcurrentMap({2: "two"}, shards=4)
+    >>> m[1] = "one"
+    >>> m
+    ConcurrentMap({1: 'one', 2: 'two'})
+    >>> m.compute_if_absent(3, str)
+    '3'
+    >>> m.pop(2)
+    'two'
+    >>> len(m)
+    2
+    """
+
+    def __init__(
+        self, mapping: Optional[Items] = None, /, shards: int = 16, **kwargs
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        self._shards = [_Shard() for _ in range(shards)]
+        self.update(mapping, **kwargs)
+
+    def _shard(self, key: Any) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def update(self, other: Optional[Items] = None, /, **kwargs) -> None:
+        """Update map with items from other, taking every lock once.
+
+        >>> m = ConcurrentMap({1: "one"})
+        >>> m.update([(1, "uno"), (2, "two")])
+        >>> m
+        ConcurrentMap({1: 'uno', 2: 'two'})
+        """
+        batches: Dict[int, List[Tuple[Any, Any]]] = {}
+        for pairs in (other, kwargs):
+            if pairs is None:
+                continue
+            if hasattr(pairs, "items"):
+                pairs = pairs.items()
+            for key, value in pairs:
+                index = hash(key) % len(self._shards)
+                batches.setdefault(index, []).append((key, value))
+        for index, batch in batches.items():
+            shard = self._shards[index]
+            with shard.lock:
+                shard.data.update(batch)
+
+    @complexity("O(1)")
+    def get(self, key: Any, default: Optional[Any] = None) -> Any:
+        """Return the value for key, or default if key isn't in map.
+
+        >>> m = ConcurrentMap(one=1)
+        >>> m.get("one")
+        1
+        >>> m.get("two", 0)
+        0
+        """
+        return self._shard(key).data.get(key, default)
+
+    @complexity("O(1)")
+    def set_default(self, key: Any, default: Optional[Any] = None, /) -> Any:
+        """Insert key with a value of default if key isn't in map, atomically.
+
+        Return the value for key.
+
+        >>> m = ConcurrentMap()
+        >>> m.set_default("one", 1)
+        1
+        >>> m.set_default("one", 11)
+        1
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.data.setdefault(key, default)
+
+    @complexity("O(1)")
+    def compute_if_absent(
+        self, key: Any, function: Callable[[Any], Any]
+    ) -> Any:
+        """Return the value for key, computing it as function(key) if absent.
+
+        Only one thread calls function for a key, while holding the lock of
+        the key's shard. So function should be quick, and must not change
+        the map.
+
+        >>> m = ConcurrentMap()
+        >>> m.compute_if_absent("spam", str.upper)
+        'SPAM'
+        >>> m.compute_if_absent("spam", str.title)
+        'SPAM'
+        """
+        shard = self._shard(key)
+        value = shard.data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with shard.lock:
+            value = shard.data.get(key, _MISSING)
+            if value is _MISSING:
+                value = shard.data[key] = function(key)
+            return value
+
+    @complexity("O(1)")
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """Remove key and return its value, atomically.
+
+        >>> m = ConcurrentMap(one=1)
+        >>> m.pop("one")
+        1
+        >>> m.pop("one", None) is None
+        True
+        >>> m.pop("one")
+        Traceback (most recent call last):
+        KeyError: 'one'
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            value = shard.data.pop(key, default)
+        if value is _MISSING:
+            raise KeyError(f"{key}")
+        return value
+
+    def clear(self) -> None:
+        """Remove all the items from map, one shard at a time."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+
+    def shard_sizes(self) -> List[int]:
+        """Return the number of items in every shard.
+
+        A skewed distribution points at keys with poor hashes.
+
+        >>> ConcurrentMap({1: "a", 2: "b", 5: "c"}, shards=4).shard_sizes()
+        [0, 2, 1, 0]
+        """
+        return [len(shard.data) for shard in self._shards]
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Return an iterator that yields key-value tuples.
+
+        Iteration is weakly consistent: it copies one shard at a time, so
+        it never fails because of concurrent writes, and it sees every
+        shard as it was at some point during the iteration.
+
+        >>> for key, value in ConcurrentMap({2: "two", 1: "one"}).items():
+        ...     print(key, "->", value)
+        1 -> one
+        2 -> two
+        """
+        for shard in self._shards:
+            with shard.lock:
+                items = list(shard.data.items())
+            yield from items
+
+    def keys(self) -> Iterator[Any]:
+        """Return an iterator over the keys of map, as items() does."""
+        for key, _ in self.items():
+            yield key
+
+    __iter__ = keys
+
+    def values(self) -> Iterator[Any]:
+        """Return an iterator over the values of map, as items() does."""
+        for _, value in self.items():
+            yield value
+
+    @complexity("O(1)")
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._shard(key).data[key]
+        except KeyError:
+            raise KeyError(f"{key}") from None
+
+    @complexity("O(1)")
+    def __setitem__(self, key: Any, value: Any) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.data[key] = value
+
+    @complexity("O(1)")
+    def __delitem__(self, key: Any) -> None:
+        self.pop(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._shard(key).data
+
+    def __len__(self) -> int:
+        return sum(self.shard_sizes())
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def __str__(self) -> str:
+        return f"{dict(self.items())}"
+
+    def __getstate__(self) -> dict:
+        # Locks can't be pickled
+        return {"shards": len(self._shards), "items": list(self.items())}
+
+    def __setstate__(self, state: dict) -> None:
+        self._shards = [_Shard() for _ in range(state["shards"])]
+        self.update(state["items"])
@@ -0,0 +1,544 @@
+"""Disk map abstract data type."""
+
+import io
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyadt.map import Items
+from pyadt.utils import complexity, stable_hash
+
+LOG_MAGIC = b"PDML"
+INDEX_MAGIC = b"PDMI"
+VERSION = 1
+PROTOCOL = 4
+MIN_CAPACITY = 1024
+MAX_LOAD = 0.7
+
+# Magic and version
+_LOG_HEADER = struct.Struct("<4sB")
+# CRC-32 of the rest of the record, then kind, hash of the key, key size
+# and value size
+_CRC = struct.Struct("<I")
+_FIELDS = struct.Struct("<BQII")
+_RECORD_SIZE = _CRC.size + _FIELDS.size
+# Magic, version, clean flag, capacity, items, used slots, log size and
+# garbage bytes
+_INDEX_HEADER = struct.Struct("<4sB?QQQQQ")
+# Hash of the key and offset of its record in the log
+_SLOT = struct.Struct("<QQ")
+_SLOTS_START = 64
+
+SET, DELETE = 1, 2
+# Offsets that can't hold a record, since the log header is there
+EMPTY, DELETED = 0, 1
+
+# Offset, end offset, kind, key hash, pickled key and pickled value
+Record = Tuple[int, int, int, int, bytes, bytes]
+
+
+def _record(
+    kind: int, digest: int, key_data: bytes, value_data: bytes
+) -> bytes:
+    fields = _FIELDS.pack(kind, digest, len(key_data), len(value_data))
+    payload = fields + key_data + value_data
+    return _CRC.pack(zlib.crc32(payload)) + payload
+
+
+def _parse(file: IO[bytes], offset: int, stop: int) -> Iterator[Record]:
+    # Records until stop, or until one is cut short or corrupted by a crash
+    while offset < stop:
+        header = file.read(_RECORD_SIZE)
+        if len(header) < _RECORD_SIZE:
+            return
+        (crc,) = _CRC.unpack_from(header)
+        kind, digest, key_size, value_size = _FIELDS.unpack_from(
+            header, _CRC.size
+        )
+        payload = file.read(key_size + value_size)
+        if len(payload) < key_size + value_size:
+            return
+        if zlib.crc32(payload, zlib.crc32(header[_CRC.size :])) != crc:
+            return
+        end = offset + _RECORD_SIZE + len(payload)
+        yield offset, end, kind, digest, payload[:key_size], payload[key_size:]
+        offset = end
+
+
+def _digest(key: Any) -> int:
+    # The index outlives the process, so keys need a hash that doesn't
+    # depend on PYTHONHASHSEED and agrees with ==
+    if isinstance(key, tuple):
+        for element in key:
+            _digest(element)
+    elif not isinstance(key, (int, float, str, bytes)):
+        raise TypeError("int, float, str, bytes or tuple key expected")
+    return stable_hash(key)
+
+
+def _slot_position(slot: int) -> int:
+    return _SLOTS_START + slot * _SLOT.size
+
+
+def _capacity_for(count: int) -> int:
+    capacity = MIN_CAPACITY
+    while count >= capacity * MAX_LOAD / 2:
+        capacity *= 2
+    return capacity
+
+
+class DiskMap:
+    """Implement a Map stored on disk, for tables that don't fit in memory.
+
+    Every change is appended to a log file at path. An open addressing
+    hash index, in path + ".index", maps the keys to the offsets of their
+    latest records. The index is memory-mapped, so the operating system
+    keeps the hot parts of it in memory, and a lookup reads a single
+    record from the log.
+
+    Changes go through a write buffer of buffer_size bytes, which is
+    written, and fsync'ed unless fsync is False, when it's full, on
+    flush() and on close(). A map that was closed reopens without reading
+    the log. After a crash, the index is rebuilt from the log, dropping
+    any record that was cut short.
+
+    Keys must be ints, floats, strs, bytes or tuples of them, which hash
+    the same in every process. Keys and values are pickled, so, like
+    pickle, only open files that you trust. A DiskMap isn't thread-safe.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "table")
+    >>> with DiskMap(path) as m:
+    ...     m["one"] = 1
+    ...     m.update({"two": 2, "three": 3})
+    ...     del m["two"]
+    >>> with DiskMap(path) as m:
+    ...     print(dict(m.items()))
+    {'one': 1, 'three': 3}
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        /,
+        buffer_size: int = 1 << 20,
+        fsync: bool = True,
+    ) -> None:
+        self._path = os.fspath(path)
+        self._index_path = self._path + ".index"
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        self._fsync = fsync
+        self._log = open(self._path, "a+b")
+        self._size = os.fstat(self._log.fileno()).st_size
+        if not self._size:
+            self._log.write(_LOG_HEADER.pack(LOG_MAGIC, VERSION))
+            self._log.flush()
+            self._size = _LOG_HEADER.size
+        elif os.pread(self._log.fileno(), 4, 0) != LOG_MAGIC:
+            self._log.close()
+            raise ValueError("not a DiskMap log")
+        if not self._load_index():
+            self._rebuild_index()
+
+    # Index
+
+    def _load_index(self) -> bool:
+        # Reuse the index if it was saved cleanly along with the whole log
+        try:
+            file = open(self._index_path, "r+b")
+        except FileNotFoundError:
+            return False
+        with file:
+            data = file.read(_INDEX_HEADER.size)
+            if len(data) < _INDEX_HEADER.size:
+                return False
+            header = _INDEX_HEADER.unpack(data)
+            magic, _, clean, capacity, count, used, log_size, garbage = header
+            if (
+                magic != INDEX_MAGIC
+                or not clean
+                or log_size != self._size
+                or os.fstat(file.fileno()).st_size != _slot_position(capacity)
+            ):
+                return False
+            self._index = mmap.mmap(file.fileno(), 0)
+        self._capacity, self._count, self._used = capacity, count, used
+        self._garbage, self._clean = garbage, True
+        return True
+
+    def _create_index(self, path: str, capacity: int) -> mmap.mmap:
+        with open(path, "w+b") as file:
+            file.truncate(_slot_position(capacity))
+            return mmap.mmap(file.fileno(), 0)
+
+    def _write_header(self, clean: bool) -> None:
+        _INDEX_HEADER.pack_into(
+            self._index,
+            0,
+            INDEX_MAGIC,
+            VERSION,
+            clean,
+            self._capacity,
+            self._count,
+            self._used,
+            self._size,
+            self._garbage,
+        )
+
+    def _reset_index(self, capacity: int) -> None:
+        self._index = self._create_index(self._index_path, capacity)
+        self._capacity, self._count, self._used = capacity, 0, 0
+        self._garbage, self._clean = 0, False
+        self._write_header(False)
+
+    def _rebuild_index(self) -> None:
+        self._reset_index(MIN_CAPACITY)
+        end = _LOG_HEADER.size
+        for offset, end, kind, digest, key_data, value_data in self._scan():
+            slot, found, size = self._find(pickle.loads(key_data), digest)
+            # Replaced records, deleted ones and deletions are garbage
+            self._garbage += size
+            if kind == SET:
+                self._put(slot, found, digest, offset)
+            else:
+                self._garbage += end - offset
+                if found is not None:
+                    self._erase(slot)
+        if end < self._size:
+            # Drop the records cut short by a crash
+            os.ftruncate(self._log.fileno(), end)
+            self._size = end
+        self.flush()
+
+    def _touch(self) -> None:
+        # Mark the index on disk as dirty before changing it, so a crash
+        # in the middle of a change makes the next open rebuild it
+        if self._clean:
+            self._clean = False
+            self._write_header(False)
+            self._index.flush(0, mmap.PAGESIZE)
+
+    def _slot(self, slot: int) -> Tuple[int, int]:
+        return _SLOT.unpack_from(self._index, _slot_position(slot))
+
+    def _find(self, key: Any, digest: int) -> Tuple[int, Optional[int], int]:
+        # The slot of key, the offset and size of its record, or the slot
+        # where key should go, None and 0
+        mask = self._capacity - 1
+        slot, free = digest & mask, None
+        while True:
+            stored, offset = self._slot(slot)
+            if offset == EMPTY:
+                return (slot if free is None else free), None, 0
+            if offset == DELETED:
+                if free is None:
+                    free = slot
+            elif stored == digest:
+                key_data, value_data = self._read_record(offset)
+                if pickle.loads(key_data) == key:
+                    size = _RECORD_SIZE + len(key_data) + len(value_data)
+                    return slot, offset, size
+            slot = (slot + 1) & mask
+
+    def _is_live(self, digest: int, offset: int) -> bool:
+        mask = self._capacity - 1
+        slot = digest & mask
+        while True:
+            stored, stored_offset = self._slot(slot)
+            if stored_offset == offset:
+                return True
+            if stored_offset == EMPTY:
+                return False
+            slot = (slot + 1) & mask
+
+    def _put(
+        self, slot: int, found: Optional[int], digest: int, offset: int
+    ) -> None:
+        if found is None:
+            self._count += 1
+            if self._slot(slot)[1] == EMPTY:
+                self._used += 1
+        _SLOT.pack_into(self._index, _slot_position(slot), digest, offset)
+        if self._used > self._capacity * MAX_LOAD:
+            self._resize()
+
+    def _erase(self, slot: int) -> None:
+        _SLOT.pack_into(self._index, _slot_position(slot), 0, DELETED)
+        self._count -= 1
+
+    def _resize(self) -> None:
+        # Rehash the live slots into a new index, dropping the tombstones
+        capacity = _capacity_for(self._count)
+        path = self._index_path + ".tmp"
+        index = self._create_index(path, capacity)
+        mask = capacity - 1
+        for slot in range(self._capacity):
+            digest, offset = self._slot(slot)
+            if offset > DELETED:
+                new_slot = digest & mask
+                while _SLOT.unpack_from(index, _slot_position(new_slot))[1]:
+                    new_slot = (new_slot + 1) & mask
+                _SLOT.pack_into(
+                    index, _slot_position(new_slot), digest, offset
+                )
+        self._index.close()
+        os.replace(path, self._index_path)
+        self._index, self._capacity, self._used = index, capacity, self._count
+        self._write_header(False)
+
+    # Log
+
+    def _read(self, offset: int, size: int) -> bytes:
+        if offset >= self._size:
+            start = offset - self._size
+            return bytes(self._buffer[start : start + size])
+        return os.pread(self._log.fileno(), size, offset)
+
+    def _read_record(self, offset: int) -> Tuple[bytes, bytes]:
+        _, _, key_size, value_size = _FIELDS.unpack(
+            self._read(offset + _CRC.size, _FIELDS.size)
+        )
+        payload = self._read(offset + _RECORD_SIZE, key_size + value_size)
+        return payload[:key_size], payload[key_size:]
+
+    def _append(self, record: bytes) -> int:
+        offset = self._size + len(self._buffer)
+        self._buffer += record
+        return offset
+
+    def _scan(self) -> Iterator[Record]:
+        # Every record in the log, then in the buffer, as they were when
+        # the scan started
+        size, pending = self._size, bytes(self._buffer)
+        with open(self._path, "rb") as file:
+            file.seek(_LOG_HEADER.size)
+            yield from _parse(file, _LOG_HEADER.size, size)
+        yield from _parse(io.BytesIO(pending), size, size + len(pending))
+
+    def _maybe_flush(self) -> None:
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered changes to the log and save the index.
+
+        The log is fsync'ed first, unless fsync is False, so the changes
+        survive a crash once flush() returns.
+        """
+        if self._buffer:
+            self._log.write(self._buffer)
+            self._log.flush()
+            if self._fsync:
+                os.fsync(self._log.fileno())
+            self._size += len(self._buffer)
+            self._buffer.clear()
+        if not self._clean:
+            self._index.flush()
+            self._write_header(True)
+            self._index.flush(0, mmap.PAGESIZE)
+            self._clean = True
+
+    def close(self) -> None:
+        """Flush the map and close its files."""
+        self.flush()
+        self._index.close()
+        self._log.close()
+
+    def __enter__(self) -> "DiskMap":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def garbage(self) -> int:
+        """Return the size of the records of overwritten or deleted items.
+
+        compact() reclaims it.
+        """
+        return self._garbage
+
+    def compact(self) -> None:
+        """Rewrite the log with only the latest record of every key.
+
+        It writes a new log and index next to the current ones, and then
+        replaces them, so a crash in the middle leaves a usable map.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "table")
+        >>> with DiskMap(path) as m:
+        ...     for value in range(100):
+        ...         m["counter"] = value
+        ...     m.compact()
+        ...     m.garbage, m["counter"]
+        (0, 99)
+        """
+        if not self._garbage:
+            return
+        self.flush()
+        log_path = self._path + ".compact"
+        capacity = _capacity_for(self._count)
+        index = self._create_index(self._index_path + ".compact", capacity)
+        mask = capacity - 1
+        with open(log_path, "wb") as log:
+            log.write(_LOG_HEADER.pack(LOG_MAGIC, VERSION))
+            size = _LOG_HEADER.size
+            for offset, _, kind, digest, key_data, value_data in self._scan():
+                if kind != SET or not self._is_live(digest, offset):
+                    continue
+                slot = digest & mask
+                while _SLOT.unpack_from(index, _slot_position(slot))[1]:
+                    slot = (slot + 1) & mask
+                _SLOT.pack_into(index, _slot_position(slot), digest, size)
+                record = _record(SET, digest, key_data, value_data)
+                log.write(record)
+                size += len(record)
+            log.flush()
+            os.fsync(log.fileno())
+        self._index.close()
+        self._log.close()
+        # The old index doesn't match the size of the new log, so a crash
+        # between both replaces makes the next open rebuild the index
+        os.replace(log_path, self._path)
+        os.replace(self._index_path + ".compact", self._index_path)
+        self._log = open(self._path, "a+b")
+        self._index, self._capacity, self._used = index, capacity, self._count
+        self._size, self._garbage, self._clean = size, 0, False
+        self.flush()
+
+    # Map interface
+
+    def keys(self) -> Iterator[Any]:
+        """Return an iterator over the keys of map.
+
+        Keys come in the order their values were last set.
+        """
+        for offset, _, kind, digest, key_data, _ in self._scan():
+            if kind == SET and self._is_live(digest, offset):
+                yield pickle.loads(key_data)
+
+    __iter__ = keys
+
+    def values(self) -> Iterator[Any]:
+        """Return an iterator over the values of map, as keys() does."""
+        for _, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Return an iterator that yields key-value tuples, as keys() does.
+
+        It reads the log sequentially.
+        """
+        for offset, _, kind, digest, key_data, value_data in self._scan():
+            if kind == SET and self._is_live(digest, offset):
+                yield pickle.loads(key_data), pickle.loads(value_data)
+
+    def update(self, other: Optional[Items] = None, /, **kwargs) -> None:
+        """Update map with items from other.
+
+        other can be a mapping or an iterable of key-value pairs.
+        """
+        if other is not None:
+            self.set_many(other)
+        if kwargs:
+            self.set_many(kwargs)
+
+    def set_many(self, pairs: Items) -> None:
+        """Set the value of every key in pairs."""
+        if hasattr(pairs, "items"):
+            pairs = pairs.items()
+        for key, value in pairs:
+            self[key] = value
+
+    def get_many(self, keys: Iterable[Any]) -> List[Any]:
+        """Return a list with the value of every key in keys."""
+        return [self[key] for key in keys]
+
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        """Remove every key in keys, or none if a key is missing."""
+        keys = list(keys)
+        for key in keys:
+            if key not in self:
+                raise KeyError(f"{key}")
+        for key in keys:
+            del self[key]
+
+    def set_default(self, key: Any, default: Optional[Any] = None, /) -> Any:
+        """Insert a key-default pair into map if key doesn't exist.
+
+        Return the value for key if key is in the map, else default.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    @complexity("O(1)")
+    def pop(self, key: Any) -> Any:
+        """Remove a key-value pair and return the value."""
+        digest = _digest(key)
+        slot, found, size = self._find(key, digest)
+        if found is None:
+            raise KeyError(f"{key}")
+        value_data = self._read_record(found)[1]
+        record = _record(DELETE, digest, pickle.dumps(key, PROTOCOL), b"")
+        self._append(record)
+        self._touch()
+        self._erase(slot)
+        self._garbage += size + len(record)
+        self._maybe_flush()
+        return pickle.loads(value_data)
+
+    def clear(self) -> None:
+        """Remove all the items from map, truncating its files."""
+        self._buffer.clear()
+        os.ftruncate(self._log.fileno(), _LOG_HEADER.size)
+        self._size = _LOG_HEADER.size
+        self._index.close()
+        self._reset_index(MIN_CAPACITY)
+        self.flush()
+
+    @complexity("O(1)")
+    def __getitem__(self, key: Any) -> Any:
+        _, found, _ = self._find(key, _digest(key))
+        if found is None:
+            raise KeyError(f"{key}")
+        return pickle.loads(self._read_record(found)[1])
+
+    get = __getitem__
+
+    @complexity("O(1)")
+    def __setitem__(self, key: Any, value: Any) -> None:
+        digest = _digest(key)
+        slot, found, size = self._find(key, digest)
+        record = _record(
+            SET,
+            digest,
+            pickle.dumps(key, PROTOCOL),
+            pickle.dumps(value, PROTOCOL),
+        )
+        offset = self._append(record)
+        self._touch()
+        self._garbage += size
+        self._put(slot, found, digest, offset)
+        self._maybe_flush()
+
+    @complexity("O(1)")
+    def __delitem__(self, key: Any) -> None:
+        self.pop(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key, _digest(key))[1] is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path!r})"
+
+    __str__ = __repr__
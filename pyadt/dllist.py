@@ -1,7 +1,9 @@
 """Doubly Linked List abstract data type."""
 
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional
 
-from typing import Any, Iterator, Optional, Sequence
+from pyadt.utils import complexity
 
 
 class Node:
@@ -49,22 +51,33 @@ class DoublyLinkedList:
     HEAD(1) <-> 2 <-> 3 <-> None
     """
 
-    def __init__(self, iterable: Optional[Sequence[Any]] = None, /) -> None:
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, /) -> None:
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None
         self._length: int = 0
-        if iterable is not None and (length := len(iterable)) > 0:
-            head, *rest = iterable
-            self._length = length
-            self.head = Node(data=head)
-            current = self.head
-            for value in rest:
-                current.next = Node(data=value)
-                previous = current
-                current = current.next
-                current.previous = previous
-            self.tail = current
+        if iterable is not None:
+            for value in iterable:
+                node = Node(data=value)
+                if self.tail is None:
+                    self.head = node
+                else:
+                    self.tail.next = node
+                    node.previous = self.tail
+                self.tail = node
+                self._length += 1
+
+    @classmethod
+    def from_iterable(
+        cls, chunks: Iterable[Iterable[Any]], /
+    ) -> "DoublyLinkedList":
+        """Return a new list built from an iterable of chunks of values.
+
+        >>> DoublyLinkedList.from_iterable([[1, 2], [3]])
+        DoublyLinkedList([1, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
 
+    @complexity("O(1)")
     def append_left(self, value: Any) -> None:
         """Add a node holding value to the left end of the doubly linked list.
 
@@ -88,6 +101,7 @@ class DoublyLinkedList:
 
     __append_left = append_left
 
+    @complexity("O(1)")
     def append(self, value: Any) -> None:
         """Add a node holding value to the right end of the linked list.
 
@@ -119,6 +133,7 @@ class DoublyLinkedList:
         self.tail = node
         self._length += 1
 
+    @complexity("O(n)")
     def remove(self, value: Any) -> None:
         """Remove the node holding value.
 
@@ -169,6 +184,7 @@ class DoublyLinkedList:
 
         raise IndexError(f"{value} doesn't exist")
 
+    @complexity("O(n)")
     def insert(self, index: int, value: Any) -> None:
         """Insert a node holding value at index.
 
@@ -0,0 +1,471 @@
+"""Bloom and cuckoo filter abstract data types.
+
+Filters answer membership queries approximately, in a fraction of the
+memory of a Set. They never miss an item that was added, but they may
+report an item that wasn't, with a probability close to error_rate.
+Items are hashed with pyadt.utils.stable_hash(), so a filter serialized
+by one process gives the same answers in any other. Items must be of
+the types stable_hash() supports.
+"""
+
+import struct
+from math import ceil, log
+from random import Random
+from typing import Any, Iterable, List, Optional, Tuple
+
+from pyadt.utils import complexity, stable_hash
+
+# Cuckoo filter buckets stay below this load, so insertions rarely fail
+MAX_LOAD = 0.95
+# Evictions tried before a cuckoo filter gives up on an insertion
+MAX_KICKS = 500
+
+_BLOOM_HEADER = struct.Struct("<4sQd")
+_CUCKOO_HEADER = struct.Struct("<4sQdBQ?QI")
+
+
+def _check_parameters(capacity: int, error_rate: float) -> None:
+    if capacity < 1:
+        raise ValueError("capacity must be positive")
+    if not 0 < error_rate < 1:
+        raise ValueError("error_rate must be between 0 and 1")
+
+
+class BloomFilter:
+    """Implement a Bloom filter with a configurable false positive rate.
+
+    A Bloom filter sets a few bits per item in a bit array. It answers
+    with the given error_rate as long as it holds at most capacity items.
+
+    >>> bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    >>> bloom
+    BloomFilter(capacity=1000, error_rate=0.01)
+    >>> bloom.add("python")
+    >>> "python" in bloom
+    True
+    >>> "java" in bloom
+    False
+    >>> bloom.size, bloom.hashes
+    (9586, 7)
+    """
+
+    MAGIC = b"PBLM"
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        _check_parameters(capacity, error_rate)
+        self._capacity = capacity
+        self._error_rate = error_rate
+        # The optimal number of bits, and of bits set per item
+        self._size = ceil(-capacity * log(error_rate) / log(2) ** 2)
+        self._hashes = max(1, round(self._size / capacity * log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def error_rate(self) -> float:
+        return self._error_rate
+
+    @property
+    def size(self) -> int:
+        """Return the number of bits of the filter."""
+        return self._size
+
+    @property
+    def hashes(self) -> int:
+        """Return the number of bits set per item."""
+        return self._hashes
+
+    def _positions(self, item: Any) -> List[int]:
+        # Double hashing, the bits of item are h1 + i * h2 for i < hashes
+        digest = stable_hash(item, 16)
+        first, second = digest & (2**64 - 1), digest >> 64 | 1
+        return [(first + i * second) % self._size for i in range(self._hashes)]
+
+    @complexity("O(1)")
+    def add(self, item: Any) -> None:
+        """Add item to filter.
+
+        >>> bloom = BloomFilter(100)
+        >>> bloom.add(42)
+        >>> 42 in bloom
+        True
+        """
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Add every item of items to filter.
+
+        >>> bloom = BloomFilter(100)
+        >>> bloom.add_many(range(10))
+        >>> all(bloom.contains_many(range(10)))
+        True
+        """
+        bits, positions = self._bits, self._positions
+        for item in items:
+            for position in positions(item):
+                bits[position >> 3] |= 1 << (position & 7)
+
+    @complexity("O(1)")
+    def __contains__(self, item: Any) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] >> (position & 7) & 1
+            for position in self._positions(item)
+        )
+
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        """Return whether filter may contain each item of items.
+
+        >>> bloom = BloomFilter(100)
+        >>> bloom.add_many(["a", "b"])
+        >>> bloom.contains_many(["a", "b", "c"])
+        [True, True, False]
+        """
+        return [item in self for item in items]
+
+    def _validate_other(self, other: "BloomFilter") -> None:
+        if other.__class__ is not self.__class__:
+            raise TypeError("BloomFilter object expected")
+        if (other._size, other._hashes) != (self._size, self._hashes):
+            raise ValueError("filters must have the same size and hashes")
+
+    def union(self, other: "BloomFilter") -> "BloomFilter":
+        """Return a new filter holding the items of filter and other.
+
+        Both filters must have the same capacity and error_rate.
+
+        >>> first, second = BloomFilter(100), BloomFilter(100)
+        >>> first.add("a")
+        >>> second.add("b")
+        >>> both = first.union(second)
+        >>> both.contains_many(["a", "b"])
+        [True, True]
+        >>> first.union(BloomFilter(200))
+        Traceback (most recent call last):
+        ValueError: filters must have the same size and hashes
+        """
+        self._validate_other(other)
+        new_filter = type(self)(self._capacity, self._error_rate)
+        bits = int.from_bytes(self._bits, "little") | int.from_bytes(
+            other._bits, "little"
+        )
+        new_filter._bits[:] = bits.to_bytes(len(self._bits), "little")
+        return new_filter
+
+    def to_bytes(self) -> bytes:
+        """Return filter serialized as bytes.
+
+        >>> bloom = BloomFilter(100)
+        >>> bloom.add("a")
+        >>> "a" in BloomFilter.from_bytes(bloom.to_bytes())
+        True
+        """
+        header = _BLOOM_HEADER.pack(
+            self.MAGIC, self._capacity, self._error_rate
+        )
+        return header + self._bits
+
+    @classmethod
+    def from_bytes(cls, data: bytes, /) -> "BloomFilter":
+        """Return the filter serialized in data by to_bytes().
+
+        >>> BloomFilter.from_bytes(b"nope")
+        Traceback (most recent call last):
+        ValueError: not a BloomFilter serialization
+        """
+        if data[:4] != cls.MAGIC or len(data) < _BLOOM_HEADER.size:
+            raise ValueError("not a BloomFilter serialization")
+        _, capacity, error_rate = _BLOOM_HEADER.unpack_from(data)
+        new_filter = cls(capacity, error_rate)
+        bits = data[_BLOOM_HEADER.size :]
+        if len(bits) != len(new_filter._bits):
+            raise EOFError("unexpected end of data")
+        new_filter._bits[:] = bits
+        return new_filter
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_bytes() == other.to_bytes()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(capacity={self._capacity},"
+            f" error_rate={self._error_rate})"
+        )
+
+    __str__ = __repr__
+
+    def __reduce__(self) -> tuple:
+        return self.from_bytes, (self.to_bytes(),)
+
+
+class CuckooFilter:
+    """Implement a cuckoo filter with a configurable false positive rate.
+
+    A cuckoo filter stores a short fingerprint of every item in one of two
+    buckets. Unlike a Bloom filter, it supports removing items, and it
+    knows how many items it holds.
+
+    >>> cuckoo = CuckooFilter(capacity=1000, error_rate=0.01)
+    >>> cuckoo.add("python")
+    >>> "python" in cuckoo
+    True
+    >>> cuckoo.remove("python")
+    >>> "python" in cuckoo
+    False
+    >>> len(cuckoo)
+    0
+    """
+
+    MAGIC = b"PCKO"
+
+    def __init__(
+        self, capacity: int, error_rate: float = 0.01, bucket_size: int = 4
+    ) -> None:
+        _check_parameters(capacity, error_rate)
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be positive")
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._bucket_size = bucket_size
+        # A lookup compares 2 * bucket_size fingerprints of this many bits
+        bits = min(ceil(log(2 * bucket_size / error_rate, 2)), 32)
+        self._fingerprints = 2**bits - 1
+        self._code = "B" if bits <= 8 else "H" if bits <= 16 else "I"
+        # A power of two number of buckets, so the alternate bucket of a
+        # fingerprint can be found with xor
+        buckets = ceil(capacity / bucket_size / MAX_LOAD)
+        self._buckets = 1 << max(0, (buckets - 1).bit_length())
+        # Slots hold a fingerprint, or 0 if empty. The table is never
+        # resized, so a typed view of it can stay around
+        slots = self._buckets * bucket_size
+        self._table = bytearray(slots * struct.calcsize(self._code))
+        self._slots = memoryview(self._table).cast(self._code)
+        self._length = 0
+        # A fingerprint evicted by a failed insertion, and its bucket
+        self._victim: Optional[Tuple[int, int]] = None
+        self._random = Random(0)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def error_rate(self) -> float:
+        return self._error_rate
+
+    @property
+    def bucket_size(self) -> int:
+        return self._bucket_size
+
+    def _locate(self, item: Any) -> Tuple[int, int, int]:
+        digest = stable_hash(item)
+        fingerprint = (digest >> 32) % self._fingerprints + 1
+        first = digest & (self._buckets - 1)
+        return fingerprint, first, self._alternate(first, fingerprint)
+
+    def _alternate(self, bucket: int, fingerprint: int) -> int:
+        # Multiply by the MurmurHash2 constant to spread small fingerprints
+        return (bucket ^ fingerprint * 0x5BD1E995) & (self._buckets - 1)
+
+    def _bucket(self, bucket: int) -> range:
+        start = bucket * self._bucket_size
+        return range(start, start + self._bucket_size)
+
+    def _insert(self, bucket: int, fingerprint: int) -> bool:
+        slots = self._slots
+        for slot in self._bucket(bucket):
+            if not slots[slot]:
+                slots[slot] = fingerprint
+                return True
+        return False
+
+    @complexity("O(1)")
+    def add(self, item: Any) -> None:
+        """Add item to filter.
+
+        Raise OverflowError if the filter is too full to take item.
+
+        >>> cuckoo = CuckooFilter(100)
+        >>> cuckoo.add(42)
+        >>> 42 in cuckoo
+        True
+        """
+        if self._victim is not None:
+            raise OverflowError("cuckoo filter is full")
+        fingerprint, first, second = self._locate(item)
+        self._length += 1
+        if self._insert(first, fingerprint) or self._insert(
+            second, fingerprint
+        ):
+            return
+        # Evict a random fingerprint to its other bucket, and so on
+        bucket = self._random.choice((first, second))
+        for _ in range(MAX_KICKS):
+            slot = self._random.choice(self._bucket(bucket))
+            fingerprint, self._slots[slot] = self._slots[slot], fingerprint
+            bucket = self._alternate(bucket, fingerprint)
+            if self._insert(bucket, fingerprint):
+                return
+        # Keep the last evicted fingerprint, so no item is lost
+        self._victim = bucket, fingerprint
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Add every item of items to filter.
+
+        >>> cuckoo = CuckooFilter(100)
+        >>> cuckoo.add_many(range(10))
+        >>> len(cuckoo)
+        10
+        """
+        for item in items:
+            self.add(item)
+
+    @complexity("O(1)")
+    def remove(self, item: Any) -> None:
+        """Remove item from filter.
+
+        Only remove items that were added, or the filter may lose the
+        fingerprint of another item that collides with it.
+
+        >>> cuckoo = CuckooFilter(100)
+        >>> cuckoo.add("a")
+        >>> cuckoo.remove("a")
+        >>> cuckoo.remove("a")
+        Traceback (most recent call last):
+        KeyError: 'a not in filter'
+        """
+        fingerprint, first, second = self._locate(item)
+        if self._victim is not None and self._victim[1] == fingerprint:
+            if self._victim[0] in (first, second):
+                self._victim = None
+                self._length -= 1
+                return
+        slots = self._slots
+        for bucket in (first, second):
+            for slot in self._bucket(bucket):
+                if slots[slot] == fingerprint:
+                    slots[slot] = 0
+                    self._length -= 1
+                    if self._victim is not None:
+                        # There may be room for the victim now
+                        bucket, victim = self._victim
+                        self._victim = None
+                        if not self._insert(bucket, victim):
+                            self._add_victim(bucket, victim)
+                    return
+        raise KeyError(f"{item} not in filter")
+
+    def _add_victim(self, bucket: int, fingerprint: int) -> None:
+        other = self._alternate(bucket, fingerprint)
+        if not self._insert(other, fingerprint):
+            self._victim = bucket, fingerprint
+
+    @complexity("O(1)")
+    def __contains__(self, item: Any) -> bool:
+        fingerprint, first, second = self._locate(item)
+        if self._victim is not None and self._victim[1] == fingerprint:
+            if self._victim[0] in (first, second):
+                return True
+        slots = self._slots
+        return any(
+            slots[slot] == fingerprint
+            for bucket in (first, second)
+            for slot in self._bucket(bucket)
+        )
+
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        """Return whether filter may contain each item of items.
+
+        >>> cuckoo = CuckooFilter(100)
+        >>> cuckoo.add_many(["a", "b"])
+        >>> cuckoo.contains_many(["a", "b", "c"])
+        [True, True, False]
+        """
+        return [item in self for item in items]
+
+    def to_bytes(self) -> bytes:
+        """Return filter serialized as bytes.
+
+        Every slot takes the bytes needed for a fingerprint, so the size
+        depends on error_rate.
+
+        >>> cuckoo = CuckooFilter(1000, error_rate=0.01)
+        >>> len(cuckoo.to_bytes())
+        4138
+        """
+        victim_bucket, victim = self._victim or (0, 0)
+        header = _CUCKOO_HEADER.pack(
+            self.MAGIC,
+            self._capacity,
+            self._error_rate,
+            self._bucket_size,
+            self._length,
+            self._victim is not None,
+            victim_bucket,
+            victim,
+        )
+        slots = self._slots
+        return header + struct.pack(f"<{len(slots)}{self._code}", *slots)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, /) -> "CuckooFilter":
+        """Return the filter serialized in data by to_bytes().
+
+        >>> cuckoo = CuckooFilter(100)
+        >>> cuckoo.add("a")
+        >>> restored = CuckooFilter.from_bytes(cuckoo.to_bytes())
+        >>> "a" in restored, len(restored)
+        (True, 1)
+        """
+        if data[:4] != cls.MAGIC or len(data) < _CUCKOO_HEADER.size:
+            raise ValueError("not a CuckooFilter serialization")
+        (
+            _,
+            capacity,
+            error_rate,
+            bucket_size,
+            length,
+            has_victim,
+            victim_bucket,
+            victim,
+        ) = _CUCKOO_HEADER.unpack_from(data)
+        new_filter = cls(capacity, error_rate, bucket_size)
+        payload = data[_CUCKOO_HEADER.size :]
+        if len(payload) != len(new_filter._table):
+            raise EOFError("unexpected end of data")
+        # Slots are stored little-endian, and held in native order
+        code = f"{len(new_filter._slots)}{new_filter._code}"
+        new_filter._table[:] = struct.pack(
+            f"={code}", *struct.unpack(f"<{code}", payload)
+        )
+        new_filter._length = length
+        if has_victim:
+            new_filter._victim = victim_bucket, victim
+        return new_filter
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_bytes() == other.to_bytes()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(capacity={self._capacity},"
+            f" error_rate={self._error_rate},"
+            f" bucket_size={self._bucket_size})"
+        )
+
+    __str__ = __repr__
+
+    def __reduce__(self) -> tuple:
+        return self.from_bytes, (self.to_bytes(),)
@@ -0,0 +1,293 @@
+"""HyperLogLog abstract data type."""
+
+import struct
+from bisect import bisect_left
+from itertools import chain
+from math import log, sqrt
+from typing import Any, Iterable, List, Optional
+
+from pyadt.utils import complexity, stable_hash
+
+MIN_PRECISION = 4
+MAX_PRECISION = 16
+# Precision of the sparse representation, where collisions are so rare
+# that linear counting over its registers is close to exact
+SPARSE_PRECISION = 25
+HASH_BITS = 64
+
+_ENTRY = struct.Struct("=I")
+_HEADER = struct.Struct("<4sBB")
+MAGIC = b"PHLL"
+
+# 2 ** -rank for every possible register value
+_INVERSE_POWERS = tuple(2.0**-rank for rank in range(HASH_BITS + 1))
+
+
+def _rank(bits: int, width: int) -> int:
+    # Position of the leftmost 1 in a width bits value, starting at 1
+    return width - bits.bit_length() + 1
+
+
+def _alpha(registers: int) -> float:
+    if registers == 16:
+        return 0.673
+    if registers == 32:
+        return 0.697
+    if registers == 64:
+        return 0.709
+    return 0.7213 / (1 + 1.079 / registers)
+
+
+class HyperLogLog:
+    """Implement a HyperLogLog estimator of the number of distinct items.
+
+    It takes 2 ** precision bytes at most, however many items it sees.
+    The relative error of len() is about 1.04 / sqrt(2 ** precision),
+    0.8% with the default precision. Small cardinalities are kept in a
+    sparse representation, which is both smaller and more accurate.
+
+    >>> users = HyperLogLog(["ana", "bob", "ana", "eve"])
+    >>> len(users)
+    3
+    >>> users.add("dan")
+    >>> len(users)
+    4
+    >>> users.is_sparse
+    True
+    """
+
+    def __init__(
+        self, iterable: Optional[Iterable[Any]] = None, /, precision: int = 14
+    ) -> None:
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(
+                f"precision must be between {MIN_PRECISION}"
+                f" and {MAX_PRECISION}"
+            )
+        self._precision = precision
+        # Sorted uint32 entries of a sparse register index and its rank,
+        # until they'd take more space than the dense registers
+        self._sparse: Optional[bytearray] = bytearray()
+        self._registers: Optional[bytearray] = None
+        if iterable is not None:
+            self.add_many(iterable)
+
+    @classmethod
+    def from_iterable(
+        cls, chunks: Iterable[Iterable[Any]], /, **options: Any
+    ) -> "HyperLogLog":
+        """Return a new HyperLogLog fed with an iterable of chunks of items.
+
+        >>> len(HyperLogLog.from_iterable([[1, 2], [2, 3]]))
+        3
+        """
+        return cls(chain.from_iterable(chunks), **options)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def is_sparse(self) -> bool:
+        """Return True while the sparse representation is in use."""
+        return self._sparse is not None
+
+    @property
+    def relative_error(self) -> float:
+        """Return the standard error of the estimate, relative to it."""
+        return 1.04 / sqrt(1 << self._precision)
+
+    def _add_hash(self, digest: int) -> None:
+        if self._sparse is None:
+            index = digest >> (HASH_BITS - self._precision)
+            rest = digest & ((1 << (HASH_BITS - self._precision)) - 1)
+            rank = _rank(rest, HASH_BITS - self._precision)
+            if rank > self._registers[index]:
+                self._registers[index] = rank
+            return
+        width = HASH_BITS - SPARSE_PRECISION
+        index = digest >> width
+        rank = _rank(digest & ((1 << width) - 1), width)
+        self._set_sparse(index, rank)
+        if len(self._sparse) > 1 << self._precision:
+            self._densify()
+
+    def _set_sparse(self, index: int, rank: int) -> None:
+        sparse = self._sparse
+        with memoryview(sparse) as raw, raw.cast("I") as entries:
+            position = bisect_left(entries, index << 6)
+            found = position < len(entries) and entries[position] >> 6 == index
+            current = entries[position] & 63 if found else 0
+        if not found:
+            offset = 4 * position
+            sparse[offset:offset] = _ENTRY.pack(index << 6 | rank)
+        elif rank > current:
+            _ENTRY.pack_into(sparse, 4 * position, index << 6 | rank)
+
+    def _entries(self) -> List[int]:
+        with memoryview(self._sparse) as raw, raw.cast("I") as entries:
+            return entries.tolist()
+
+    def _densify(self) -> None:
+        # Fold every sparse register into the dense register it falls in
+        registers = bytearray(1 << self._precision)
+        extra = SPARSE_PRECISION - self._precision
+        for entry in self._entries():
+            index, rank = entry >> 6, entry & 63
+            low = index & ((1 << extra) - 1)
+            if low:
+                rank = _rank(low, extra)
+            else:
+                rank += extra
+            index >>= extra
+            if rank > registers[index]:
+                registers[index] = rank
+        self._registers, self._sparse = registers, None
+
+    @complexity("O(1)")
+    def add(self, item: Any) -> None:
+        """Add item to the estimator.
+
+        Items are hashed with pyadt.utils.stable_hash(), so estimators
+        built in different processes can be merged.
+        """
+        self._add_hash(stable_hash(item))
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Add every item of items to the estimator.
+
+        >>> hll = HyperLogLog(precision=10)
+        >>> hll.add_many(range(100_000))
+        >>> abs(len(hll) - 100_000) < 3 * 100_000 * hll.relative_error
+        True
+        """
+        for item in items:
+            self._add_hash(stable_hash(item))
+
+    def estimate(self) -> float:
+        """Return the estimated number of distinct items."""
+        if self._sparse is not None:
+            # Linear counting over the 2 ** 25 sparse registers
+            registers = 1 << SPARSE_PRECISION
+            used = len(self._sparse) // 4
+            return registers * log(registers / (registers - used))
+        registers = len(self._registers)
+        raw = (
+            _alpha(registers)
+            * registers**2
+            / sum(map(_INVERSE_POWERS.__getitem__, self._registers))
+        )
+        zeros = self._registers.count(0)
+        if raw <= 2.5 * registers and zeros:
+            return registers * log(registers / zeros)
+        return raw
+
+    def _validate_other(self, other: "HyperLogLog") -> None:
+        if other.__class__ is not self.__class__:
+            raise TypeError("HyperLogLog object expected")
+        if other._precision != self._precision:
+            raise ValueError("estimators must have the same precision")
+
+    def union(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Return a new estimator of the items of estimator and other.
+
+        >>> first, second = HyperLogLog([1, 2, 3]), HyperLogLog([3, 4])
+        >>> len(first.union(second))
+        4
+        >>> first.union(HyperLogLog(precision=10))
+        Traceback (most recent call last):
+        ValueError: estimators must have the same precision
+        """
+        self._validate_other(other)
+        merged = type(self)(precision=self._precision)
+        if self._sparse is not None and other._sparse is not None:
+            merged._sparse = bytearray(self._sparse)
+            for entry in other._entries():
+                merged._set_sparse(entry >> 6, entry & 63)
+            if len(merged._sparse) > 1 << self._precision:
+                merged._densify()
+            return merged
+        first, second = self._dense(), other._dense()
+        merged._registers = bytearray(map(max, first, second))
+        merged._sparse = None
+        return merged
+
+    def _dense(self) -> bytearray:
+        if self._sparse is None:
+            return self._registers
+        copy = type(self)(precision=self._precision)
+        copy._sparse = bytearray(self._sparse)
+        copy._densify()
+        return copy._registers
+
+    def intersection_count(self, other: "HyperLogLog") -> int:
+        """Return the estimated number of items in both estimators.
+
+        The estimate uses inclusion-exclusion, |A| + |B| - |A | B|, so its
+        error is relative to the union rather than to the intersection.
+
+        >>> first = HyperLogLog(range(1000))
+        >>> second = HyperLogLog(range(500, 1500))
+        >>> abs(first.intersection_count(second) - 500) < 25
+        True
+        """
+        union = self.union(other).estimate()
+        return max(0, round(self.estimate() + other.estimate() - union))
+
+    def to_bytes(self) -> bytes:
+        """Return the estimator serialized as bytes.
+
+        >>> hll = HyperLogLog(["a", "b"])
+        >>> len(hll.to_bytes())
+        14
+        >>> len(HyperLogLog.from_bytes(hll.to_bytes()))
+        2
+        """
+        sparse = self._sparse is not None
+        header = _HEADER.pack(MAGIC, self._precision, sparse)
+        if not sparse:
+            return header + self._registers
+        entries = self._entries()
+        return header + struct.pack(f"<{len(entries)}I", *entries)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, /) -> "HyperLogLog":
+        """Return the estimator serialized in data by to_bytes().
+
+        >>> HyperLogLog.from_bytes(b"nope")
+        Traceback (most recent call last):
+        ValueError: not a HyperLogLog serialization
+        """
+        if data[:4] != MAGIC or len(data) < _HEADER.size:
+            raise ValueError("not a HyperLogLog serialization")
+        _, precision, sparse = _HEADER.unpack_from(data)
+        new_hll = cls(precision=precision)
+        payload = data[_HEADER.size :]
+        if sparse:
+            if len(payload) % 4:
+                raise EOFError("unexpected end of data")
+            entries = struct.unpack(f"<{len(payload) // 4}I", payload)
+            new_hll._sparse = bytearray(
+                struct.pack(f"={len(entries)}I", *entries)
+            )
+        else:
+            if len(payload) != 1 << precision:
+                raise EOFError("unexpected end of data")
+            new_hll._registers, new_hll._sparse = bytearray(payload), None
+        return new_hll
+
+    def __len__(self) -> int:
+        return round(self.estimate())
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_bytes() == other.to_bytes()
+
+    def __reduce__(self) -> tuple:
+        return self.from_bytes, (self.to_bytes(),)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(precision={self._precision})"
+
+    __str__ = __repr__
@@ -0,0 +1,284 @@
+"""Indexed map abstract data type."""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pyadt.map import Items, Map
+from pyadt.sortedmap import SortedMap
+from pyadt.utils import complexity
+
+
+class _Index:
+    # buckets maps every indexed value to a dict with the items that have
+    # it, and entries maps every key to its indexed value, so an item
+    # leaves its bucket without calling function again
+    __slots__ = ("function", "buckets", "entries")
+
+    def __init__(self, function: Callable[[Any], Any], sorted: bool) -> None:
+        self.function = function
+        self.buckets: Any = SortedMap() if sorted else {}
+        self.entries: Dict[Any, Any] = {}
+
+    @property
+    def sorted(self) -> bool:
+        return isinstance(self.buckets, SortedMap)
+
+    def set(self, key: Any, value: Any, indexed: Any) -> None:
+        if key in self.entries and self.entries[key] == indexed:
+            # Same bucket, keep the key in place
+            self.buckets[indexed][key] = value
+            return
+        self.remove(key)
+        bucket = self.buckets.get(indexed)
+        if bucket is None:
+            bucket = self.buckets[indexed] = {}
+        bucket[key] = value
+        self.entries[key] = indexed
+
+    def remove(self, key: Any) -> None:
+        if key not in self.entries:
+            return
+        indexed = self.entries.pop(key)
+        bucket = self.buckets[indexed]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[indexed]
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.entries.clear()
+
+
+def _from_buckets(buckets: Iterable[Dict[Any, Any]]) -> Map:
+    mapping = Map()
+    for bucket in buckets:
+        mapping._keys.extend(bucket)
+        mapping._values.extend(bucket.values())
+    return mapping
+
+
+class IndexedMap(Map):
+    """Implement a Map with secondary indexes over its values.
+
+    An index is named, and groups the items by function(value), in a
+    hash table or, to also answer range queries, in a sorted map. Every
+    change to the map updates its indexes, so find_by() takes O(1) with
+    a hash index and O(log n) with a sorted one, plus the time to copy
+    the items found, instead of a scan of every value.
+
+    Values must not change in place in a way that changes what the index
+    functions return, as with the keys of a dict.
+
+    >>> sessions = IndexedMap()
+    >>> sessions.add_index("user", lambda session: session[0])
+    >>> sessions.add_index("started", lambda session: session[1], sorted=True)
+    >>> sessions.update(s1=("ana", 9), s2=("bob", 10), s3=("ana", 12))
+    >>> sessions.find_by("user", "ana")
+    Map({'s1': ('ana', 9), 's3': ('ana', 12)})
+    >>> sessions.find_range("started", 10, 12)
+    Map({'s2': ('bob', 10)})
+    >>> del sessions["s1"]
+    >>> sessions.find_by("user", "ana")
+    Map({'s3': ('ana', 12)})
+    """
+
+    def __init__(self, mapping: Optional[Items] = None, /, **kwargs) -> None:
+        self._indexes: Dict[str, _Index] = {}
+        super().__init__(mapping, **kwargs)
+
+    def add_index(
+        self, name: str, function: Callable[[Any], Any], sorted: bool = False
+    ) -> None:
+        """Index the items of map by function(value), under name.
+
+        A sorted index also supports find_range(), so its values must be
+        comparable with each other.
+
+        >>> m = IndexedMap(one=1, two=2, three=3)
+        >>> m.add_index("odd", lambda value: value % 2 == 1)
+        >>> m.find_by("odd", True)
+        Map({'one': 1, 'three': 3})
+        >>> m.add_index("odd", abs)
+        Traceback (most recent call last):
+        ValueError: odd index already exists
+        """
+        if name in self._indexes:
+            raise ValueError(f"{name} index already exists")
+        index = _Index(function, sorted)
+        for key, value in zip(self._keys, self._values):
+            index.set(key, value, function(value))
+        self._indexes[name] = index
+
+    def drop_index(self, name: str) -> None:
+        """Remove the index called name.
+
+        >>> m = IndexedMap(one=1)
+        >>> m.add_index("value", abs)
+        >>> m.drop_index("value")
+        >>> m.find_by("value", 1)
+        Traceback (most recent call last):
+        KeyError: 'value'
+        """
+        try:
+            del self._indexes[name]
+        except KeyError:
+            raise KeyError(f"{name}") from None
+
+    def _index(self, name: str) -> _Index:
+        try:
+            return self._indexes[name]
+        except KeyError:
+            raise KeyError(f"{name}") from None
+
+    @complexity("O(log n)")
+    def find_by(self, name: str, value: Any) -> Map:
+        """Return a Map with the items whose indexed value is value.
+
+        Items come in the order they were added to the index.
+
+        >>> m = IndexedMap(apple="red", cherry="red", lime="green")
+        >>> m.add_index("color", str.upper)
+        >>> m.find_by("color", "RED")
+        Map({'apple': 'red', 'cherry': 'red'})
+        >>> m.find_by("color", "BLUE")
+        Map({})
+        """
+        bucket = self._index(name).buckets.get(value)
+        return _from_buckets([] if bucket is None else [bucket])
+
+    @complexity("O(log n)")
+    def find_range(
+        self, name: str, low: Optional[Any] = None, high: Optional[Any] = None
+    ) -> Map:
+        """Return a Map with the items whose low <= indexed value < high.
+
+        The index must be sorted. A bound of None leaves that end of the
+        range open. Items come sorted by their indexed value.
+
+        >>> m = IndexedMap(ana=31, bob=25, eve=42)
+        >>> m.add_index("age", int, sorted=True)
+        >>> m.find_range("age", 30)
+        Map({'ana': 31, 'eve': 42})
+        >>> m.find_range("age", high=40)
+        Map({'bob': 25, 'ana': 31})
+        """
+        index = self._index(name)
+        if not index.sorted:
+            raise ValueError(f"{name} index isn't sorted")
+        return _from_buckets(
+            bucket for _, bucket in index.buckets.range(low, high)
+        )
+
+    def _indexed(self, value: Any) -> List[Tuple[_Index, Any]]:
+        # Call every function before changing anything, so an exception
+        # leaves the map and its indexes as they were
+        return [
+            (index, index.function(value)) for index in self._indexes.values()
+        ]
+
+    def _unindex(self, keys: Iterable[Any]) -> None:
+        for index in self._indexes.values():
+            for key in keys:
+                index.remove(key)
+
+    def _assign(
+        self,
+        pairs: Items,
+        resolver: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> None:
+        if not self._indexes:
+            super()._assign(pairs, resolver)
+            return
+        if hasattr(pairs, "items"):
+            pairs = pairs.items()
+        positions = self._positions()
+        keys, values = self._keys, self._values
+        for key, value in pairs:
+            position = positions.get(key)
+            if position is not None and resolver is not None:
+                value = resolver(values[position], value)
+            indexed = self._indexed(value)
+            if position is None:
+                positions[key] = len(keys)
+                keys.append(key)
+                values.append(value)
+            else:
+                values[position] = value
+            for index, item in indexed:
+                index.set(key, value, item)
+
+    @complexity("O(n log n)")
+    def set_many(self, pairs: Items) -> None:
+        """Set the value of every key in pairs, updating the indexes.
+
+        >>> m = IndexedMap()
+        >>> m.add_index("length", len)
+        >>> m.set_many({"a": "x", "b": "yy", "c": "zz"})
+        >>> m.find_by("length", 2)
+        Map({'b': 'yy', 'c': 'zz'})
+        """
+        self._assign(pairs)
+
+    @complexity("O(n log n)")
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        """Remove every key in keys, or none of them if one is missing."""
+        keys = list(keys)
+        super().delete_many(keys)
+        self._unindex(keys)
+
+    @complexity("O(n log n)")
+    def merge(
+        self,
+        other: Items,
+        resolver: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> "IndexedMap":
+        """Return a new map with the items of map and other, and its indexes.
+
+        >>> m = IndexedMap(one=1)
+        >>> m.add_index("odd", lambda value: value % 2 == 1)
+        >>> m.merge({"three": 3}).find_by("odd", True)
+        Map({'one': 1, 'three': 3})
+        """
+        merged = super().merge(other, resolver)
+        for name, index in self._indexes.items():
+            merged.add_index(name, index.function, index.sorted)
+        return merged
+
+    @complexity("O(n)")
+    def pop(self, key: Any) -> Any:
+        """Remove a key-value pair and return the value.
+
+        >>> m = IndexedMap(one=1)
+        >>> m.add_index("value", abs)
+        >>> m.pop("one")
+        1
+        >>> m.find_by("value", 1)
+        Map({})
+        """
+        value = super().pop(key)
+        self._unindex([key])
+        return value
+
+    @complexity("O(log n)")
+    def popitem(self) -> Any:
+        """Remove and return the last key-value pair as a tuple."""
+        key, value = super().popitem()
+        self._unindex([key])
+        return key, value
+
+    def clear(self) -> None:
+        """Remove all the items from map, keeping its indexes empty."""
+        super().clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    @complexity("O(n)")
+    def __setitem__(self, key: Any, value: Any) -> None:
+        indexed = self._indexed(value)
+        super().__setitem__(key, value)
+        for index, item in indexed:
+            index.set(key, value, item)
+
+    @complexity("O(n)")
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._unindex([key])
@@ -0,0 +1,214 @@
+"""Opt-in instrumentation of the pyadt abstract data types.
+
+Enabling instrumentation replaces the methods of the ADT classes with
+wrappers that record call counts, cumulative time and the largest size
+seen per class. Disabling it puts the original methods back, so there's
+no overhead at all while it's off.
+
+>>> from pyadt import Map
+>>> from pyadt import instrument
+>>> instrument.enable(Map)
+>>> m = Map()
+>>> m["one"] = 1
+>>> m["two"] = 2
+>>> instrument.disable()
+>>> stats = instrument.snapshot()["Map"]
+>>> stats["methods"]["__setitem__"]["calls"]
+2
+>>> stats["max_size"]
+2
+>>> instrument.reset()
+"""
+
+import inspect
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from types import FunctionType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Special methods worth counting. Public methods are always included.
+SPECIAL_METHODS = frozenset(
+    {
+        "__getitem__",
+        "__setitem__",
+        "__delitem__",
+        "__contains__",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__eq__",
+    }
+)
+
+_MISSING = object()
+
+_lock = threading.Lock()
+_local = threading.local()
+_stats: Dict[str, Dict[str, Any]] = {}
+# Patched (class, name, original attribute or _MISSING) triples
+_patches: List[Tuple[type, str, Any]] = []
+
+
+def _default_classes() -> List[type]:
+    import pyadt
+
+    classes = []
+    for name in dir(pyadt):
+        value = getattr(pyadt, name)
+        if isinstance(value, type) and value.__module__.startswith("pyadt."):
+            classes.append(value)
+    return classes
+
+
+def _methods(cls: type) -> Iterator[Tuple[str, FunctionType]]:
+    for name in dir(cls):
+        if name.startswith("_") and name not in SPECIAL_METHODS:
+            continue
+        attribute = inspect.getattr_static(cls, name)
+        if isinstance(attribute, FunctionType):
+            yield name, attribute
+
+
+def _record(cls_name: str, method: str, seconds: float, obj: Any) -> None:
+    try:
+        size: Optional[int] = len(obj)
+    except Exception:  # Not sized, or not in a state to report its size
+        size = None
+    with _lock:
+        stats = _stats.setdefault(cls_name, {"methods": {}, "max_size": 0})
+        counters = stats["methods"].setdefault(
+            method, {"calls": 0, "seconds": 0.0}
+        )
+        counters["calls"] += 1
+        counters["seconds"] += seconds
+        if size is not None and size > stats["max_size"]:
+            stats["max_size"] = size
+
+
+def _wrap(name: str, function: FunctionType) -> Callable:
+    @wraps(function)
+    def wrapper(self, *args, **kwargs):
+        # Calls made through super() or from other instrumented methods of
+        # the same object are accounted for by the outermost call only
+        active = _local.__dict__.setdefault("active", set())
+        key = (id(self), name)
+        if key in active:
+            return function(self, *args, **kwargs)
+        active.add(key)
+        start = perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            active.discard(key)
+            _record(type(self).__name__, name, elapsed, self)
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def enable(*classes: type) -> None:
+    """Instrument classes, or every pyadt ADT if no class is given."""
+    with _lock:
+        patched = {(cls, name) for cls, name, _ in _patches}
+        for cls in classes or _default_classes():
+            for name, function in list(_methods(cls)):
+                if (cls, name) in patched:
+                    continue
+                if getattr(function, "__instrumented__", False):
+                    continue
+                original = cls.__dict__.get(name, _MISSING)
+                setattr(cls, name, _wrap(name, function))
+                _patches.append((cls, name, original))
+
+
+def disable() -> None:
+    """Restore the original methods of every instrumented class."""
+    with _lock:
+        while _patches:
+            cls, name, original = _patches.pop()
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+
+def is_enabled() -> bool:
+    """Return True if any class is instrumented, False otherwise."""
+    return bool(_patches)
+
+
+@contextmanager
+def instrumented(*classes: type) -> Iterator[None]:
+    """Instrument classes for the duration of a with block."""
+    enable(*classes)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset() -> None:
+    """Discard the collected statistics."""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Return a copy of the statistics collected so far.
+
+    The result maps class names to a dict with a "methods" dict of
+    {"calls": int, "seconds": float} per method and a "max_size" int.
+    """
+    with _lock:
+        return {
+            cls_name: {
+                "methods": {
+                    method: dict(counters)
+                    for method, counters in stats["methods"].items()
+                },
+                "max_size": stats["max_size"],
+            }
+            for cls_name, stats in _stats.items()
+        }
+
+
+def to_prometheus(stats: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """Return statistics in the Prometheus text exposition format.
+
+    >>> print(to_prometheus({"Set": {"methods": {}, "max_size": 3}}))
+    # HELP pyadt_calls_total Number of calls to pyadt methods.
+    # TYPE pyadt_calls_total counter
+    # HELP pyadt_call_seconds_total Time spent in pyadt methods.
+    # TYPE pyadt_call_seconds_total counter
+    # HELP pyadt_size_max Largest size seen per pyadt class.
+    # TYPE pyadt_size_max gauge
+    pyadt_size_max{class="Set"} 3
+    """
+    if stats is None:
+        stats = snapshot()
+    calls = [
+        "# HELP pyadt_calls_total Number of calls to pyadt methods.",
+        "# TYPE pyadt_calls_total counter",
+    ]
+    seconds = [
+        "# HELP pyadt_call_seconds_total Time spent in pyadt methods.",
+        "# TYPE pyadt_call_seconds_total counter",
+    ]
+    sizes = [
+        "# HELP pyadt_size_max Largest size seen per pyadt class.",
+        "# TYPE pyadt_size_max gauge",
+    ]
+    for cls_name, class_stats in sorted(stats.items()):
+        for method, counters in sorted(class_stats["methods"].items()):
+            labels = f'{{class="{cls_name}",method="{method}"}}'
+            calls.append(f"pyadt_calls_total{labels} {counters['calls']}")
+            seconds.append(
+                f"pyadt_call_seconds_total{labels} {counters['seconds']!r}"
+            )
+        sizes.append(
+            f'pyadt_size_max{{class="{cls_name}"}} {class_stats["max_size"]}'
+        )
+    return "\n".join(calls + seconds + sizes)
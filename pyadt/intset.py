@@ -0,0 +1,514 @@
+"""Integer Set abstract data type."""
+
+import struct
+from bisect import bisect_left
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyadt.utils import complexity
+
+# Values split into a 16 bit low part, stored in a container, and a high
+# part, the key of that container
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+# Containers with up to this many values are arrays, larger ones bitmaps.
+# Past this point, the 2 bytes per value of an array outweigh the 8 KiB
+# of a bitmap
+ARRAY_MAX = 4096
+MAX_VALUE = 2**64
+
+# A sorted bytearray of native uint16 values, or the bits of a Python int
+Container = Union[bytearray, int]
+
+_UINT16 = struct.Struct("=H")
+_HEADER = struct.Struct("<4sI")
+_CONTAINER = struct.Struct("<QI")
+MAGIC = b"PINT"
+
+# Positions of the set bits of every byte value
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def _search(array: bytearray, low: int) -> Tuple[int, bool]:
+    # Release the views before returning, a bytearray with live views
+    # can't be resized
+    with memoryview(array) as raw, raw.cast("H") as view:
+        index = bisect_left(view, low)
+        return index, index < len(view) and view[index] == low
+
+
+def _values(container: Container) -> List[int]:
+    if isinstance(container, int):
+        data = container.to_bytes(CHUNK_SIZE // 8, "little")
+        return [
+            8 * index + bit
+            for index, byte in enumerate(data)
+            if byte
+            for bit in _BYTE_BITS[byte]
+        ]
+    with memoryview(container) as raw, raw.cast("H") as view:
+        return view.tolist()
+
+
+def _bitmap(container: Container) -> int:
+    if isinstance(container, int):
+        return container
+    data = bytearray(CHUNK_SIZE // 8)
+    for low in _values(container):
+        data[low >> 3] |= 1 << (low & 7)
+    return int.from_bytes(data, "little")
+
+
+def _array(values: List[int]) -> bytearray:
+    return bytearray(struct.pack(f"={len(values)}H", *values))
+
+
+def _container(values: List[int]) -> Container:
+    # The smallest container for sorted values
+    if len(values) <= ARRAY_MAX:
+        return _array(values)
+    if values[-1] - values[0] + 1 == len(values):  # A run, such as a range
+        return ((1 << len(values)) - 1) << values[0]
+    return _bitmap(_array(values))
+
+
+def _from_bitmap(bits: int) -> Tuple[Container, int]:
+    size = _popcount(bits)
+    if size <= ARRAY_MAX:
+        return _array(_values(bits)), size
+    return bits, size
+
+
+class IntSet:
+    """Implement a compressed set of non-negative integers.
+
+    Values are grouped in chunks of 65536 consecutive integers, like in a
+    roaring bitmap. Sparse chunks are stored as sorted arrays of 16 bit
+    values, and dense chunks as bitmaps, so dense ranges take a bit per
+    value. Set operations on bitmaps use the bitwise operators of Python
+    ints, which work on whole machine words at a time, and the ones on two
+    arrays only touch their values.
+
+    >>> s = IntSet([3, 1, 2, 70000])
+    >>> s
+    IntSet([1, 2, 3, 70000])
+    >>> len(s)
+    4
+    >>> 70000 in s
+    True
+    >>> s.union(IntSet(range(5)))
+    IntSet([0, 1, 2, 3, 4, 70000])
+    >>> IntSet([-1])
+    Traceback (most recent call last):
+    ValueError: -1 out of range for IntSet
+    """
+
+    def __init__(self, iterable: Optional[Iterable[int]] = None, /) -> None:
+        self._keys: List[int] = []
+        self._containers: List[Container] = []
+        self._sizes: List[int] = []
+        if iterable is not None:
+            values = set(iterable)
+            # Check the types once, rather than every value
+            for kind in set(map(type, values)) - {int, bool}:
+                if not issubclass(kind, int):
+                    self._check(next(v for v in values if type(v) is kind))
+            values = sorted(values)
+            if values:
+                self._check(values[0])
+                self._check(values[-1])
+            start = 0
+            while start < len(values):
+                key = values[start] >> CHUNK_BITS
+                end = bisect_left(values, (key + 1) << CHUNK_BITS, start)
+                base = key << CHUNK_BITS
+                lows = [value - base for value in values[start:end]]
+                self._append(key, _container(lows), len(lows))
+                start = end
+
+    @staticmethod
+    def _check(value: int) -> int:
+        if not isinstance(value, int):
+            raise TypeError(
+                f"IntSet values must be integers, not {type(value).__name__}"
+            )
+        if not 0 <= value < MAX_VALUE:
+            raise ValueError(f"{value} out of range for IntSet")
+        return value
+
+    def _append(self, key: int, container: Container, size: int) -> None:
+        if size:
+            self._keys.append(key)
+            self._containers.append(container)
+            self._sizes.append(size)
+
+    def _find(self, key: int) -> Tuple[int, bool]:
+        index = bisect_left(self._keys, key)
+        return index, index < len(self._keys) and self._keys[index] == key
+
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[int]], /) -> "IntSet":
+        """Return a new IntSet built from an iterable of chunks of values.
+
+        >>> IntSet.from_iterable([[1, 2], [2, 3]])
+        IntSet([1, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
+
+    @complexity("O(log n)")
+    def add(self, value: int) -> None:
+        """Add value to set.
+
+        >>> s = IntSet()
+        >>> s.add(2)
+        >>> s.add(1)
+        >>> s
+        IntSet([1, 2])
+        >>> s.add("3")
+        Traceback (most recent call last):
+        TypeError: IntSet values must be integers, not str
+        """
+        self._check(value)
+        key, low = value >> CHUNK_BITS, value & (CHUNK_SIZE - 1)
+        index, found = self._find(key)
+        if not found:
+            self._keys.insert(index, key)
+            self._containers.insert(index, _array([low]))
+            self._sizes.insert(index, 1)
+            return
+        container = self._containers[index]
+        if isinstance(container, int):
+            bits = container | 1 << low
+            if bits == container:
+                return
+            self._containers[index] = bits
+        else:
+            position, present = _search(container, low)
+            if present:
+                return
+            container[2 * position : 2 * position] = _UINT16.pack(low)
+            if self._sizes[index] == ARRAY_MAX:
+                self._containers[index] = _bitmap(container)
+        self._sizes[index] += 1
+
+    def _discard(self, value: int) -> bool:
+        if not isinstance(value, int) or not 0 <= value < MAX_VALUE:
+            return False
+        key, low = value >> CHUNK_BITS, value & (CHUNK_SIZE - 1)
+        index, found = self._find(key)
+        if not found:
+            return False
+        container = self._containers[index]
+        if isinstance(container, int):
+            if not container >> low & 1:
+                return False
+            container &= ~(1 << low)
+            if self._sizes[index] == ARRAY_MAX + 1:
+                container = _array(_values(container))
+            self._containers[index] = container
+        else:
+            position, present = _search(container, low)
+            if not present:
+                return False
+            del container[2 * position : 2 * position + 2]
+        self._sizes[index] -= 1
+        if not self._sizes[index]:
+            del self._keys[index]
+            del self._containers[index]
+            del self._sizes[index]
+        return True
+
+    @complexity("O(log n)")
+    def remove(self, value: int) -> None:
+        """Remove value from set.
+
+        >>> s = IntSet([1, 2])
+        >>> s.remove(2)
+        >>> s
+        IntSet([1])
+        >>> s.remove(42)
+        Traceback (most recent call last):
+        KeyError: '42 not in set'
+        """
+        if not self._discard(value):
+            raise KeyError(f"{value} not in set")
+
+    def discard(self, value: int) -> None:
+        """Remove value from set if present.
+
+        >>> s = IntSet([1, 2])
+        >>> s.discard(1)
+        >>> s.discard(100)
+        >>> s
+        IntSet([2])
+        """
+        self._discard(value)
+
+    @complexity("O(1)")
+    def pop(self) -> int:
+        """Remove and return the largest value.
+
+        >>> s = IntSet([1, 2])
+        >>> s.pop()
+        2
+        >>> s.pop()
+        1
+        >>> s.pop()
+        Traceback (most recent call last):
+        KeyError: 'pop from an empty set'
+        """
+        if not self._keys:
+            raise KeyError("pop from an empty set")
+        container = self._containers[-1]
+        if isinstance(container, int):
+            low = container.bit_length() - 1
+        else:
+            (low,) = _UINT16.unpack(container[-2:])
+        value = self._keys[-1] << CHUNK_BITS | low
+        self._discard(value)
+        return value
+
+    def clear(self) -> None:
+        """Remove all the values from set.
+
+        >>> s = IntSet([1, 2, 3])
+        >>> s.clear()
+        >>> s
+        IntSet([])
+        """
+        self._keys.clear()
+        self._containers.clear()
+        self._sizes.clear()
+
+    def update(self, other: "IntSet") -> None:
+        """Update set with values from other.
+
+        >>> s = IntSet([1, 2])
+        >>> s.update(IntSet([3]))
+        >>> s
+        IntSet([1, 2, 3])
+        >>> s.update([4])
+        Traceback (most recent call last):
+        TypeError: IntSet object expected
+        """
+        result = self.union(other)
+        self._keys = result._keys
+        self._containers = result._containers
+        self._sizes = result._sizes
+
+    def _validate_other(self, other) -> None:
+        if other.__class__ is not self.__class__:
+            raise TypeError("IntSet object expected")
+
+    def _combine(
+        self, other: "IntSet", keys: Iterable[int], both: bool, operation
+    ) -> "IntSet":
+        # Apply operation to the containers at every key, as bitmaps if
+        # either one is a bitmap, or else as Python sets of the values of
+        # both arrays. If both is False, keys missing from other use an
+        # empty container
+        self._validate_other(other)
+        mine = dict(zip(self._keys, self._containers))
+        theirs = dict(zip(other._keys, other._containers))
+        empty = bytearray()
+        new_set = type(self)()
+        for key in keys:
+            first, second = mine.get(key, empty), theirs.get(key, empty)
+            if both and not (key in mine and key in theirs):
+                continue
+            if isinstance(first, int) or isinstance(second, int):
+                bits = operation(_bitmap(first), _bitmap(second))
+                container, size = _from_bitmap(bits)
+            else:
+                values = sorted(
+                    operation(set(_values(first)), set(_values(second)))
+                )
+                container, size = _container(values), len(values)
+            new_set._append(key, container, size)
+        return new_set
+
+    @complexity("O(n)")
+    def union(self, other: "IntSet") -> "IntSet":
+        """Return a new set that is the union of set and other.
+
+        >>> IntSet([1, 2, 3]).union(IntSet([1, 4, 5]))
+        IntSet([1, 2, 3, 4, 5])
+        """
+        self._validate_other(other)
+        keys = sorted({*self._keys, *other._keys})
+        return self._combine(other, keys, False, lambda a, b: a | b)
+
+    @complexity("O(n)")
+    def intersection(self, other: "IntSet") -> "IntSet":
+        """Return a new set that is the intersection of set with other.
+
+        >>> IntSet([1, 2, 3]).intersection(IntSet([2, 4, 3, 6]))
+        IntSet([2, 3])
+        """
+        return self._combine(other, self._keys, True, lambda a, b: a & b)
+
+    @complexity("O(n)")
+    def difference(self, other: "IntSet") -> "IntSet":
+        """Return a new set with the difference between set and other.
+
+        >>> IntSet([1, 2, 3]).difference(IntSet([2, 4, 3, 6]))
+        IntSet([1])
+        """
+        # a ^ (a & b) is a & ~b for ints, and a - b for sets
+        return self._combine(
+            other, self._keys, False, lambda a, b: a ^ (a & b)
+        )
+
+    def symmetric_difference(self, other: "IntSet") -> "IntSet":
+        """Return a new set with the values in exactly one of the sets.
+
+        >>> IntSet([1, 2, 3]).symmetric_difference(IntSet([3, 4]))
+        IntSet([1, 2, 4])
+        """
+        self._validate_other(other)
+        keys = sorted({*self._keys, *other._keys})
+        return self._combine(other, keys, False, lambda a, b: a ^ b)
+
+    @complexity("O(n)")
+    def is_subset(self, other: "IntSet") -> bool:
+        """Return True if set is subset of other, False otherwise.
+
+        >>> s = IntSet([1, 2, 3])
+        >>> s.is_subset(IntSet([1, 2, 3, 4, 5]))
+        True
+        >>> IntSet([2, 4, 6]).is_subset(s)
+        False
+        """
+        self._validate_other(other)
+        if len(self) > len(other):
+            return False
+        theirs = dict(zip(other._keys, other._containers))
+        for key, container in zip(self._keys, self._containers):
+            if key not in theirs:
+                return False
+            their = theirs[key]
+            if isinstance(container, int) or isinstance(their, int):
+                if _bitmap(container) & ~_bitmap(their):
+                    return False
+            elif not set(_values(container)).issubset(_values(their)):
+                return False
+        return True
+
+    def is_superset(self, other: "IntSet") -> bool:
+        """Return True if set is superset of other, False otherwise.
+
+        >>> IntSet([1, 2, 3]).is_superset(IntSet([1, 3]))
+        True
+        """
+        self._validate_other(other)
+        return other.is_subset(self)
+
+    def is_disjoint(self, other: "IntSet") -> bool:
+        """Return True if set has no values in common with other.
+
+        >>> s = IntSet([1, 2, 3])
+        >>> s.is_disjoint(IntSet([4, 5, 6]))
+        True
+        >>> s.is_disjoint(IntSet([2, 4, 6]))
+        False
+        """
+        return not self.intersection(other)
+
+    def to_bytes(self) -> bytes:
+        """Return the set serialized as bytes.
+
+        Arrays take 2 bytes per value and bitmaps 8 KiB, both little-endian.
+
+        >>> data = IntSet([1, 2, 3]).to_bytes()
+        >>> len(data)
+        26
+        >>> IntSet.from_bytes(data)
+        IntSet([1, 2, 3])
+        """
+        parts = [_HEADER.pack(MAGIC, len(self._keys))]
+        for key, container, size in zip(
+            self._keys, self._containers, self._sizes
+        ):
+            parts.append(_CONTAINER.pack(key, size))
+            if isinstance(container, int):
+                parts.append(container.to_bytes(CHUNK_SIZE // 8, "little"))
+            else:
+                parts.append(struct.pack(f"<{size}H", *_values(container)))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, /) -> "IntSet":
+        """Return the set serialized in data by to_bytes().
+
+        >>> IntSet.from_bytes(b"nope")
+        Traceback (most recent call last):
+        ValueError: not an IntSet serialization
+        """
+        if data[:4] != MAGIC or len(data) < _HEADER.size:
+            raise ValueError("not an IntSet serialization")
+        _, count = _HEADER.unpack_from(data)
+        offset = _HEADER.size
+        new_set = cls()
+        try:
+            for _ in range(count):
+                key, size = _CONTAINER.unpack_from(data, offset)
+                offset += _CONTAINER.size
+                if size <= ARRAY_MAX:
+                    end = offset + 2 * size
+                    values = list(struct.unpack(f"<{size}H", data[offset:end]))
+                    container: Container = _array(values)
+                else:
+                    end = offset + CHUNK_SIZE // 8
+                    container = int.from_bytes(data[offset:end], "little")
+                if end > len(data):
+                    raise EOFError("unexpected end of data")
+                new_set._append(key, container, size)
+                offset = end
+        except struct.error:
+            raise EOFError("unexpected end of data") from None
+        return new_set
+
+    @complexity("O(log n)")
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int) or not 0 <= value < MAX_VALUE:
+            return False
+        index, found = self._find(value >> CHUNK_BITS)
+        if not found:
+            return False
+        container, low = self._containers[index], value & (CHUNK_SIZE - 1)
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        return _search(container, low)[1]
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Containers have a single form for each size, so they compare as is
+        return (
+            self._keys == other._keys
+            and self._sizes == other._sizes
+            and self._containers == other._containers
+        )
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    def __iter__(self) -> Iterator[int]:
+        for key, container in zip(self._keys, self._containers):
+            base = key << CHUNK_BITS
+            for low in _values(container):
+                yield base | low
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    __str__ = __repr__
+
+    def __reduce__(self) -> tuple:
+        return self.from_bytes, (self.to_bytes(),)
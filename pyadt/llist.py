@@ -1,7 +1,9 @@
 """Linked list abstract data type."""
 
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional
 
-from typing import Any, Iterator, List, Optional
+from pyadt.utils import complexity
 
 
 class Node:
@@ -18,7 +20,7 @@ class Node:
 class LinkedList:
     """Linked list abstract data type."""
 
-    def __init__(self, data: Optional[List[Any]] = None) -> None:
+    def __init__(self, data: Optional[Iterable[Any]] = None) -> None:
         """Initialize the LinkedList with data.
 
         >>> ll = LinkedList([1, 2, 3])
@@ -40,15 +42,27 @@ class LinkedList:
         self.head: Optional[Node] = None
         self._length: int = 0
 
-        if data is not None and (length := len(data)) > 0:
-            head, *rest = data
-            self._length = length
-            self.head = Node(data=head)
-            node = self.head
-            for value in rest:
-                node.next = Node(data=value)
-                node = node.next
+        if data is not None:
+            last_node = None
+            for value in data:
+                node = Node(data=value)
+                if last_node is None:
+                    self.head = node
+                else:
+                    last_node.next = node
+                last_node = node
+                self._length += 1
+
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[Any]], /) -> "LinkedList":
+        """Return a new LinkedList built from an iterable of chunks of values.
+
+        >>> LinkedList.from_iterable([[1, 2], [3]])
+        LinkedList([1, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
 
+    @complexity("O(1)")
     def append_left(self, value: Any) -> None:
         """Add a node holding value to the left end of the linked list.
 
@@ -66,6 +80,7 @@ class LinkedList:
         self.head = node
         self._length += 1
 
+    @complexity("O(n)")
     def append(self, value: Any) -> None:
         """Add a node holding value to the right end of the linked list.
 
@@ -86,6 +101,7 @@ class LinkedList:
 
         self._length += 1
 
+    @complexity("O(n)")
     def insert(self, index: int, value: Any) -> None:
         """Insert a node holding value at index.
 
@@ -118,6 +134,7 @@ class LinkedList:
 
         raise IndexError("index out of range")
 
+    @complexity("O(n)")
     def remove(self, value: Any) -> None:
         """Remove the node holding value.
 
@@ -162,6 +179,7 @@ class LinkedList:
 
         raise IndexError(f"{value} doesn't exist")
 
+    @complexity("O(n)")
     def reverse(self) -> None:
         """Reverse the list in place.
 
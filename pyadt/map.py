@@ -1,6 +1,23 @@
 """Map abstract data type."""
 
-from typing import Any, Iterator, List, Mapping, Optional, Sequence, Tuple
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pyadt.utils import complexity
+
+# A mapping or an iterable of key-value pairs, like dict() accepts
+Items = Union[Mapping[Any, Any], Iterable[Tuple[Any, Any]]]
 
 
 class Map:
@@ -44,9 +61,7 @@ class Map:
     TypeError: unhashable type: 'list'
     """
 
-    def __init__(
-        self, mapping: Optional[Mapping[Any, Any]] = None, /, **kwargs
-    ) -> None:
+    def __init__(self, mapping: Optional[Items] = None, /, **kwargs) -> None:
         self._keys: List[Any] = []
         self._values: List[Any] = []
         self.__update(mapping, **kwargs)
@@ -88,27 +103,138 @@ class Map:
 
     __items = items
 
-    def update(
-        self, other: Optional[Mapping[Any, Any]] = None, /, **kwargs
-    ) -> None:
+    def update(self, other: Optional[Items] = None, /, **kwargs) -> None:
         """Update map with items from other.
 
+        other can be a mapping or an iterable of key-value pairs.
+
         >>> m = Map(one=1, two=2)
         >>> m
         Map({'one': 1, 'two': 2})
         >>> m.update({"two": 22, "three": 3})
         >>> m
         Map({'one': 1, 'two': 22, 'three': 3})
+        >>> m.update((key, 0) for key in ["one", "four"])
+        >>> m
+        Map({'one': 0, 'two': 22, 'three': 3, 'four': 0})
         """
         if other is not None:
-            for key, value in other.items():
-                self[key] = value
+            self.set_many(other)
         if kwargs:
-            for key, value in kwargs.items():
-                self[key] = value
+            self.set_many(kwargs)
 
     __update = update
 
+    def _positions(self) -> Dict[Any, int]:
+        # Index of every key, so bulk operations look keys up in O(1)
+        return {key: index for index, key in enumerate(self._keys)}
+
+    @complexity("O(n)")
+    def get_many(self, keys: Iterable[Any]) -> List[Any]:
+        """Return a list with the value of every key in keys.
+
+        >>> m = Map(one=1, two=2, three=3)
+        >>> m.get_many(["three", "one"])
+        [3, 1]
+        >>> m.get_many(["one", "four"])
+        Traceback (most recent call last):
+        KeyError: 'four'
+        """
+        positions = self._positions()
+        values = self._values
+        try:
+            return [values[positions[key]] for key in keys]
+        except KeyError as error:
+            raise KeyError(f"{error.args[0]}") from None
+
+    @complexity("O(n)")
+    def set_many(self, pairs: Items) -> None:
+        """Set the value of every key in pairs, in a single pass.
+
+        pairs can be a mapping or an iterable of key-value pairs.
+
+        >>> m = Map(one=1)
+        >>> m.set_many([("two", 2), ("one", 11), ("two", 22)])
+        >>> m
+        Map({'one': 11, 'two': 22})
+        """
+        self._assign(pairs)
+
+    def _assign(
+        self,
+        pairs: Items,
+        resolver: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> None:
+        if hasattr(pairs, "items"):
+            pairs = pairs.items()
+        positions = self._positions()
+        keys, values = self._keys, self._values
+        for key, value in pairs:
+            index = positions.get(key)
+            if index is None:
+                positions[key] = len(keys)
+                keys.append(key)
+                values.append(value)
+            elif resolver is None:
+                values[index] = value
+            else:
+                values[index] = resolver(values[index], value)
+
+    @complexity("O(n)")
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        """Remove every key in keys and its value, in a single pass.
+
+        If a key is missing, it raises KeyError and removes nothing.
+
+        >>> m = Map(one=1, two=2, three=3)
+        >>> m.delete_many(["one", "three"])
+        >>> m
+        Map({'two': 2})
+        >>> m.delete_many(["two", "four"])
+        Traceback (most recent call last):
+        KeyError: 'four'
+        >>> m
+        Map({'two': 2})
+        """
+        positions = self._positions()
+        removed = set()
+        for key in keys:
+            try:
+                removed.add(positions.pop(key))
+            except KeyError:
+                raise KeyError(f"{key}") from None
+        if not removed:
+            return
+        kept = [
+            index for index in range(len(self._keys)) if index not in removed
+        ]
+        self._keys[:] = map(self._keys.__getitem__, kept)
+        self._values[:] = map(self._values.__getitem__, kept)
+
+    @complexity("O(n)")
+    def merge(
+        self,
+        other: Items,
+        resolver: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> "Map":
+        """Return a new map with the items of map and other.
+
+        For keys in both, the value is resolver(value, other_value), or
+        the value in other if there's no resolver.
+
+        >>> m = Map(apples=2, pears=1)
+        >>> m.merge({"pears": 3, "plums": 5})
+        Map({'apples': 2, 'pears': 3, 'plums': 5})
+        >>> from operator import add
+        >>> m.merge({"pears": 3, "plums": 5}, add)
+        Map({'apples': 2, 'pears': 4, 'plums': 5})
+        """
+        merged = type(self)()
+        merged._keys.extend(self._keys)
+        merged._values.extend(self._values)
+        merged._assign(other, resolver)
+        return merged
+
     def set_default(self, key, default: Optional[Any] = None, /) -> Any:
         """Insert a key-default pair into map if key doesn't exist.
 
@@ -127,6 +253,7 @@ class Map:
             self[key] = default
             return default
 
+    @complexity("O(n)")
     def pop(self, key: Any) -> Any:
         """Remove a key-value pair and return the value.
 
@@ -148,6 +275,7 @@ class Map:
         self._keys.remove(key)
         return self._values.pop(index)
 
+    @complexity("O(1)")
     def popitem(self) -> Any:
         """Remove and return a key-value as a tuple.
 
@@ -180,9 +308,20 @@ class Map:
         self._keys.clear()
         self._values.clear()
 
+    @classmethod
+    def from_iterable(
+        cls, chunks: Iterable[Iterable[Tuple[Any, Any]]], /
+    ) -> "Map":
+        """Return a new Map built from an iterable of chunks of pairs.
+
+        >>> Map.from_iterable([[("one", 1), ("two", 2)], [("three", 3)]])
+        Map({'one': 1, 'two': 2, 'three': 3})
+        """
+        return cls(chain.from_iterable(chunks))
+
     @classmethod
     def fromkeys(
-        cls, iterable: Sequence, value: Optional[Any] = None, /
+        cls, iterable: Iterable, value: Optional[Any] = None, /
     ) -> "Map":
         """Return a new Map with keys from iterable and values from value.
 
@@ -192,10 +331,12 @@ class Map:
         Map({'cats': 0, 'dogs': 0, 'pythons': 0})
         """
         mapping = cls()
-        mapping._keys.extend(iterable)
-        mapping._values.extend(value for _ in iterable)
+        for key in iterable:
+            mapping._keys.append(key)
+            mapping._values.append(value)
         return mapping
 
+    @complexity("O(n)")
     def __getitem__(self, key: Any) -> Any:
         try:
             index = self._keys.index(key)
@@ -205,6 +346,7 @@ class Map:
 
     get = __getitem__
 
+    @complexity("O(n)")
     def __setitem__(self, key: Any, value: Any) -> None:
         hash(key)
         if key in self._keys:
@@ -214,14 +356,16 @@ class Map:
             self._keys.append(key)
             self._values.append(value)
 
+    @complexity("O(n)")
     def __eq__(self, other: "Map") -> bool:
         if other.__class__ is not self.__class__:
             raise TypeError("Map object expected")
         if len(self) != len(other):
             return False
-        other_items = list(other.__items())
-        for item in self.__items():
-            if item not in other_items:
+        positions = other._positions()
+        for key, value in self.__items():
+            index = positions.get(key)
+            if index is None or other._values[index] != value:
                 return False
         return True
 
@@ -239,6 +383,7 @@ class Map:
     def __str__(self) -> str:
         return f"{dict(zip(self._keys, self._values))}"
 
+    @complexity("O(n)")
     def __delitem__(self, key):
         try:
             index = self._keys.index(key)
@@ -249,3 +394,9 @@ class Map:
 
     def __reversed__(self):
         yield from reversed(self._keys)
+
+    def __reduce__(self) -> tuple:
+        # Imported here, pyadt.serialize imports this module
+        from pyadt.serialize import reduce
+
+        return reduce(self)
@@ -1,9 +1,10 @@
 """Matrix abstract data type."""
 
+from itertools import chain
 from operator import add, sub
-from typing import Any, Callable, List, NamedTuple, Tuple
+from typing import Any, Callable, Iterable, NamedTuple, Tuple
 
-from pyadt.utils import validate_index
+from pyadt.utils import complexity, validate_index
 
 
 class Size(NamedTuple):
@@ -84,6 +85,7 @@ class Matrix:
             for j, _ in enumerate(row):
                 self[i, j] *= scalar
 
+    @complexity("O(n)")
     def transpose(self) -> "Matrix":
         """Return the transposed version of the current matrix.
 
@@ -110,6 +112,7 @@ class Matrix:
         """
         return self.__add__(other)
 
+    @complexity("O(n)")
     def __add__(self, other: "Matrix") -> "Matrix":
         return self._compute(other, operation=add)
 
@@ -172,23 +175,43 @@ class Matrix:
         return matrix
 
     @classmethod
-    def from_list_of_lists(cls, iterable: List[List[Any]], /) -> "Matrix":
+    def from_list_of_lists(
+        cls, iterable: Iterable[Iterable[Any]], /
+    ) -> "Matrix":
         """Return a new matrix built from a list of lists.
 
+        Any iterable of rows works, and rows can be any iterable as well.
+
         >>> m = Matrix.from_list_of_lists([[1, 2], [3, 4], [5, 6]])
         >>> print(m)
         Matrix([1, 2] [3, 4] [5, 6])
+        >>> m = Matrix.from_list_of_lists(range(i, i + 2) for i in (1, 3))
+        >>> print(m)
+        Matrix([1, 2] [3, 4])
+        >>> Matrix.from_list_of_lists([[1, 2], [3]])
+        Traceback (most recent call last):
+        ValueError: invalid matrix size
         """
-        if len(set(len(row) for row in iterable)) > 1:
-            raise ValueError("invalid matrix size")
-
-        matrix = cls(rows=len(iterable), cols=len(iterable[0]))
+        data = []
+        for row in iterable:
+            data.append(list(row))
+            if len(data[-1]) != len(data[0]):
+                raise ValueError("invalid matrix size")
+
+        matrix = cls(rows=0, cols=0)
+        matrix._data = data
+        matrix._rows = len(data)
+        matrix._cols = len(data[0]) if data else 0
+        return matrix
 
-        for i, rows in enumerate(iterable):
-            for j, value in enumerate(rows):
-                matrix[i, j] = value
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[Any]], /) -> "Matrix":
+        """Return a new matrix built from an iterable of chunks of rows.
 
-        return matrix
+        >>> print(Matrix.from_iterable([[[1, 2], [3, 4]], [[5, 6]]]))
+        Matrix([1, 2] [3, 4] [5, 6])
+        """
+        return cls.from_list_of_lists(chain.from_iterable(chunks))
 
     def __getitem__(self, index: Tuple[int, int]) -> Any:
         row, col = validate_index(index, self.rows, self.cols)
@@ -208,3 +231,9 @@ class Matrix:
             f"{self.__class__.__name__}"
             f"({' '.join(str(row) for row in self._data)})"
         )
+
+    def __reduce__(self) -> tuple:
+        # Imported here, pyadt.serialize imports this module
+        from pyadt.serialize import reduce
+
+        return reduce(self)
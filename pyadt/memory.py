@@ -0,0 +1,232 @@
+"""Measure the memory footprint of the pyadt abstract data types.
+
+deep_sizeof() follows the references of a container with sys.getsizeof()
+and measure() traces the allocations that building one leaves behind
+with tracemalloc.
+
+>>> from pyadt import Stack
+>>> items = list(range(1000, 1010))
+>>> footprint = measure(lambda: Stack(items), items)
+>>> footprint.length
+10
+>>> footprint.name
+'Stack'
+>>> footprint.size < deep_sizeof(Stack(items))
+True
+
+Compare every ADT holding N elements from the command line with:
+
+    python -m pyadt.memory -n 10000
+"""
+
+import argparse
+import ctypes
+import sys
+import tracemalloc
+from collections import deque
+from math import isqrt
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+# Objects shared by the whole interpreter, which no container owns
+_SHARED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+class Footprint(NamedTuple):
+    name: str
+    length: int
+    size: int
+    allocated: int
+    allocations: int
+
+    @property
+    def per_element(self) -> float:
+        return self.size / self.length if self.length else 0.0
+
+
+def _references(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        yield from obj
+    elif isinstance(obj, ctypes.Array):
+        # ctypes keeps the objects stored in py_object arrays alive here
+        yield obj._objects
+    if hasattr(obj, "__dict__") and not isinstance(obj, _SHARED):
+        yield obj.__dict__
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                yield getattr(obj, name)
+
+
+def deep_sizeof(obj: Any, exclude: Iterable[Any] = ()) -> int:
+    """Return the size in bytes of obj and everything it references.
+
+    Objects in exclude aren't counted, so passing the items stored in a
+    container returns just the container's own overhead. Every object is
+    counted once, no matter how many references point to it.
+
+    >>> import sys
+    >>> items = [1000, 2000]
+    >>> deep_sizeof(items) == sys.getsizeof(items) + 2 * sys.getsizeof(1000)
+    True
+    >>> deep_sizeof(items, items) == sys.getsizeof(items)
+    True
+    """
+    seen = {id(item) for item in exclude}
+    pending = [obj]
+    size = 0
+    # Walk the references iteratively, linked lists can be very deep
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if current is None or isinstance(current, (bool,) + _SHARED):
+            continue
+        size += sys.getsizeof(current)
+        if isinstance(current, ctypes.Array):
+            # getsizeof() doesn't count the buffer ctypes allocates apart
+            size += ctypes.sizeof(current)
+        pending.extend(_references(current))
+    return size
+
+
+def measure(
+    factory: Callable[[], Any],
+    items: Iterable[Any] = (),
+    name: Optional[str] = None,
+) -> Footprint:
+    """Build a container with factory and return its Footprint.
+
+    items are the elements stored in the container. They give its length
+    and are excluded from its size. Build them before calling measure so
+    that they don't count as allocations either.
+    """
+    items = list(items)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        container = factory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    statistics = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "lineno"
+    )
+    return Footprint(
+        name or type(container).__name__,
+        len(items) if items else len(container),
+        deep_sizeof(container, items),
+        sum(stat.size_diff for stat in statistics),
+        sum(stat.count_diff for stat in statistics),
+    )
+
+
+def _factories(items: List[Any]) -> Dict[str, Callable[[], Any]]:
+    from pyadt import (
+        AggregateStack,
+        Array,
+        Bag,
+        BloomFilter,
+        CuckooFilter,
+        HyperLogLog,
+        IntSet,
+        LinkedList,
+        Map,
+        Matrix,
+        PersistentStack,
+        PriorityQueue,
+        Queue,
+        Set,
+        Stack,
+    )
+    from pyadt.dllist import DoublyLinkedList
+
+    def array():
+        array = Array(len(items))
+        for i, item in enumerate(items):
+            array[i] = item
+        return array
+
+    def matrix():
+        side = isqrt(len(items))
+        values = iter(items)
+        rows = [[next(values) for _ in range(side)] for _ in range(side)]
+        return Matrix.from_list_of_lists(rows)
+
+    def approximate(cls):
+        # Filters hold a fingerprint of the items, not the items
+        def build():
+            approximate = cls(max(1, len(items)))
+            approximate.add_many(items)
+            return approximate
+
+        return build
+
+    return {
+        "list": lambda: list(items),
+        "Array": array,
+        "Map": lambda: Map(dict(zip(items, items))),
+        "Set": lambda: Set(items),
+        "IntSet": lambda: IntSet(items),
+        "BloomFilter": approximate(BloomFilter),
+        "CuckooFilter": approximate(CuckooFilter),
+        "HyperLogLog": lambda: HyperLogLog(items),
+        "Bag": lambda: Bag(items),
+        "Matrix": matrix,
+        "Stack": lambda: Stack(items),
+        "AggregateStack": lambda: AggregateStack(items),
+        "Queue": lambda: Queue(items),
+        "PriorityQueue": lambda: PriorityQueue((i, i) for i in items),
+        "LinkedList": lambda: LinkedList(items),
+        "DoublyLinkedList": lambda: DoublyLinkedList(items),
+        "PersistentStack": lambda: PersistentStack(items),
+    }
+
+
+def compare(length: int) -> List[Footprint]:
+    """Return the Footprint of every ADT holding length elements.
+
+    Set is built in quadratic time, so keep length moderate.
+    """
+    # Large ints are distinct objects, none of them cached by the
+    # interpreter, so every container holds the same excluded items
+    items = list(range(2**32, 2**32 + length))
+    return [
+        measure(factory, items, name)
+        for name, factory in _factories(items).items()
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pyadt.memory")
+    parser.add_argument(
+        "-n",
+        type=int,
+        default=1000,
+        help="number of elements per container (default: 1000)",
+    )
+    args = parser.parse_args(argv)
+    print(
+        f"{'ADT':<18} {'elements':>9} {'bytes':>11} {'bytes/elem':>10}"
+        f" {'allocated':>11} {'allocations':>11}"
+    )
+    for footprint in compare(args.n):
+        print(
+            f"{footprint.name:<18} {footprint.length:>9} {footprint.size:>11}"
+            f" {footprint.per_element:>10.1f} {footprint.allocated:>11}"
+            f" {footprint.allocations:>11}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
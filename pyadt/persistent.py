@@ -0,0 +1,271 @@
+"""Persistent Stack and Linked List abstract data types."""
+
+from typing import Any, Iterable, Iterator, List, Optional
+
+from pyadt.utils import complexity
+
+
+class Node:
+    """Immutable node of a persistent linked structure."""
+
+    __slots__ = ("data", "next")
+
+    def __init__(self, data: Any, next: Optional["Node"] = None) -> None:
+        self.data = data
+        self.next = next
+
+    def __repr__(self) -> str:
+        return str(self.data)
+
+
+def _nodes(node: Optional[Node]) -> Iterator[Node]:
+    while node is not None:
+        yield node
+        node = node.next
+
+
+def _build(values: List[Any], next: Optional[Node] = None) -> Optional[Node]:
+    # Chain values in order in front of next
+    for value in reversed(values):
+        next = Node(value, next)
+    return next
+
+
+class PersistentStack:
+    """Implement a persistent (immutable) Stack abstract data type.
+
+    Pushing and popping return a new stack and leave the original one
+    untouched. Versions share their common items, so keeping a snapshot
+    of a stack takes O(1) time and memory.
+
+    >>> s = PersistentStack([1, 2])
+    >>> t = s.push(3)
+    >>> s
+    PersistentStack([1, 2])
+    >>> t
+    PersistentStack([1, 2, 3])
+    >>> t.pop() is not s
+    True
+    >>> t.pop()
+    PersistentStack([1, 2])
+    """
+
+    __slots__ = ("_top", "_length")
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, /) -> None:
+        self._top: Optional[Node] = None
+        self._length = 0
+        if iterable is not None:
+            for item in iterable:
+                self._top = Node(item, self._top)
+                self._length += 1
+
+    @classmethod
+    def _from_node(cls, top: Optional[Node], length: int) -> "PersistentStack":
+        stack = cls.__new__(cls)
+        stack._top = top
+        stack._length = length
+        return stack
+
+    @complexity("O(1)")
+    def push(self, item: Any) -> "PersistentStack":
+        """Return a new stack with item on top.
+
+        >>> s = PersistentStack()
+        >>> s.push(42)
+        PersistentStack([42])
+        >>> s
+        PersistentStack([])
+        """
+        return self._from_node(Node(item, self._top), self._length + 1)
+
+    @complexity("O(1)")
+    def pop(self) -> "PersistentStack":
+        """Return a new stack without the item at the top.
+
+        >>> s = PersistentStack([1, 2])
+        >>> s.pop()
+        PersistentStack([1])
+        >>> PersistentStack().pop()
+        Traceback (most recent call last):
+        IndexError: pop from an empty stack
+        """
+        if self._top is None:
+            raise IndexError("pop from an empty stack")
+        return self._from_node(self._top.next, self._length - 1)
+
+    def top(self) -> Any:
+        """Return the item at the top of the stack.
+
+        >>> s = PersistentStack([1, 2, 3])
+        >>> s.top()
+        3
+        >>> PersistentStack().top()
+        Traceback (most recent call last):
+        IndexError: top from an empty stack
+        """
+        if self._top is None:
+            raise IndexError("top from an empty stack")
+        return self._top.data
+
+    def is_empty(self) -> bool:
+        """Return True if the stack is empty, False otherwise.
+
+        >>> PersistentStack().is_empty()
+        True
+        >>> PersistentStack([1]).is_empty()
+        False
+        """
+        return self._top is None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, item: Any) -> bool:
+        return any(node.data == item for node in _nodes(self._top))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    __str__ = __repr__
+
+    def __iter__(self) -> Iterator:
+        # Iterate from the bottom to the top, like Stack does
+        yield from reversed([node.data for node in _nodes(self._top)])
+
+    def __reversed__(self) -> Iterator:
+        for node in _nodes(self._top):
+            yield node.data
+
+
+class PersistentLinkedList:
+    """Implement a persistent (immutable) linked list abstract data type.
+
+    Every update returns a new list that shares the unchanged nodes with
+    the original one. Adding to the left end takes O(1), while updates at
+    index i copy only the first i nodes.
+
+    >>> ll = PersistentLinkedList([2, 3])
+    >>> new = ll.append_left(1)
+    >>> new
+    PersistentLinkedList([1, 2, 3])
+    >>> ll
+    PersistentLinkedList([2, 3])
+    >>> new.head.next is ll.head
+    True
+    >>> print(new)
+    HEAD(1) -> 2 -> 3 -> None
+    """
+
+    __slots__ = ("head", "_length")
+
+    def __init__(self, data: Optional[Iterable[Any]] = None) -> None:
+        self.head: Optional[Node] = None
+        self._length = 0
+        if data is not None:
+            last = None
+            # Nodes can be linked in place while nobody else sees them yet
+            for value in data:
+                node = Node(value)
+                if last is None:
+                    self.head = node
+                else:
+                    last.next = node
+                last = node
+                self._length += 1
+
+    @classmethod
+    def _from_node(
+        cls, head: Optional[Node], length: int
+    ) -> "PersistentLinkedList":
+        llist = cls.__new__(cls)
+        llist.head = head
+        llist._length = length
+        return llist
+
+    @complexity("O(1)")
+    def append_left(self, value: Any) -> "PersistentLinkedList":
+        """Return a new list with value added to the left end.
+
+        >>> PersistentLinkedList().append_left(1)
+        PersistentLinkedList([1])
+        """
+        return self._from_node(Node(value, self.head), self._length + 1)
+
+    @complexity("O(n)")
+    def append(self, value: Any) -> "PersistentLinkedList":
+        """Return a new list with value added to the right end.
+
+        >>> ll = PersistentLinkedList([1, 2])
+        >>> ll.append(3)
+        PersistentLinkedList([1, 2, 3])
+        """
+        values = [node.data for node in self]
+        values.append(value)
+        return self._from_node(_build(values), self._length + 1)
+
+    def insert(self, index: int, value: Any) -> "PersistentLinkedList":
+        """Return a new list with value inserted at index.
+
+        >>> ll = PersistentLinkedList([1, 3])
+        >>> ll.insert(1, 2)
+        PersistentLinkedList([1, 2, 3])
+        >>> ll.insert(3, 4)
+        Traceback (most recent call last):
+        IndexError: index out of range
+        """
+        if index == 0:
+            return self.append_left(value)
+        prefix = []
+        for i, node in enumerate(self):
+            if i == index:
+                head = _build(prefix, Node(value, node))
+                return self._from_node(head, self._length + 1)
+            prefix.append(node.data)
+        raise IndexError("index out of range")
+
+    def remove(self, value: Any) -> "PersistentLinkedList":
+        """Return a new list without the first node holding value.
+
+        >>> ll = PersistentLinkedList([1, 2, 3])
+        >>> ll.remove(2)
+        PersistentLinkedList([1, 3])
+        >>> ll.remove(4)
+        Traceback (most recent call last):
+        IndexError: 4 doesn't exist
+        """
+        prefix = []
+        for node in self:
+            if node.data == value:
+                head = _build(prefix, node.next)
+                return self._from_node(head, self._length - 1)
+            prefix.append(node.data)
+        raise IndexError(f"{value} doesn't exist")
+
+    def reverse(self) -> "PersistentLinkedList":
+        """Return a new list with the nodes in reverse order.
+
+        >>> PersistentLinkedList([1, 2, 3]).reverse()
+        PersistentLinkedList([3, 2, 1])
+        """
+        head = None
+        for node in self:
+            head = Node(node.data, head)
+        return self._from_node(head, self._length)
+
+    def __iter__(self) -> Iterator:
+        yield from _nodes(self.head)
+
+    def __repr__(self) -> str:
+        data = [node.data for node in self]
+        return f"{self.__class__.__name__}({data})"
+
+    def __str__(self) -> str:
+        data = [str(node.data) for node in self]
+        data.append("None")
+        if len(data) == 1:
+            return f"HEAD({data[0]})"
+        return f"HEAD({data[0]}) -> " + " -> ".join(data[1:])
+
+    def __len__(self) -> int:
+        return self._length
@@ -0,0 +1,285 @@
+"""Priority Queue abstract data type."""
+
+from itertools import count
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pyadt.utils import complexity
+
+
+class PriorityQueue:
+    """Implement a Priority Queue abstract data type based on a d-ary heap.
+
+    Items with a lower priority value are dequeued first. Items with equal
+    priority are dequeued in insertion order.
+
+    >>> pq = PriorityQueue([("b", 2), ("a", 1), ("c", 3)])
+    >>> pq
+    PriorityQueue([('a', 1), ('b', 2), ('c', 3)])
+    >>> len(pq)
+    3
+    >>> "a" in pq
+    True
+    >>> pq.enqueue("z", 0)
+    >>> pq.dequeue()
+    'z'
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Tuple[Any, Any]]] = None,
+        /,
+        arity: int = 4,
+    ) -> None:
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self._arity = arity
+        self._counter = count()
+        self._heap: List[List[Any]] = []
+        if iterable is not None:
+            for item, priority in iterable:
+                entry = [priority, next(self._counter), item]
+                self._moved(entry, len(self._heap))
+                self._heap.append(entry)
+            self._heapify()
+
+    def _heapify(self) -> None:
+        # Bottom-up construction: sift down every internal node, O(n)
+        for index in reversed(range(self._parent(len(self._heap) - 1) + 1)):
+            self._sift_down(index)
+
+    @complexity("O(log n)")
+    def enqueue(self, item: Any, priority: Any) -> None:
+        """Add item to the queue with the given priority.
+
+        >>> pq = PriorityQueue()
+        >>> pq.enqueue("low", 10)
+        >>> pq.enqueue("high", 1)
+        >>> pq
+        PriorityQueue([('high', 1), ('low', 10)])
+        """
+        self._push(item, priority)
+
+    def _push(self, item: Any, priority: Any) -> List[Any]:
+        entry = [priority, next(self._counter), item]
+        self._heap.append(entry)
+        self._sift_up(len(self._heap) - 1)
+        return entry
+
+    @complexity("O(log n)")
+    def dequeue(self) -> Any:
+        """Remove and return the item with the lowest priority value.
+
+        >>> pq = PriorityQueue([("a", 1), ("b", 1), ("c", 0)])
+        >>> pq.dequeue()
+        'c'
+        >>> pq.dequeue()
+        'a'
+        >>> pq.dequeue()
+        'b'
+        >>> pq.dequeue()
+        Traceback (most recent call last):
+        IndexError: dequeue from an empty priority queue
+        """
+        if not self._heap:
+            raise IndexError("dequeue from an empty priority queue")
+        return self._remove_at(0)[2]
+
+    @complexity("O(1)")
+    def front(self) -> Any:
+        """Return the item with the lowest priority value.
+
+        >>> pq = PriorityQueue([("a", 2), ("b", 1)])
+        >>> pq.front()
+        'b'
+        >>> len(pq)
+        2
+        """
+        try:
+            return self._heap[0][2]
+        except IndexError:
+            raise IndexError("front from an empty priority queue") from None
+
+    def is_empty(self) -> bool:
+        """Return True if the queue is empty, False otherwise.
+
+        >>> pq = PriorityQueue()
+        >>> pq.is_empty()
+        True
+        >>> pq.enqueue("a", 1)
+        >>> pq.is_empty()
+        False
+        """
+        return len(self._heap) == 0
+
+    def _remove_at(self, index: int) -> List[Any]:
+        entry = self._heap[index]
+        last = self._heap.pop()
+        if index < len(self._heap):
+            self._heap[index] = last
+            self._moved(last, index)
+            self._sift_up(index)
+            self._sift_down(index)
+        return entry
+
+    def _parent(self, index: int) -> int:
+        return (index - 1) // self._arity
+
+    def _moved(self, entry: List[Any], index: int) -> None:
+        """Hook called when entry lands at index in the heap."""
+
+    # Entries are [priority, sequence, item] lists. Sequence numbers are
+    # unique, so comparing entries never falls through to the items and
+    # equal priorities keep their insertion order.
+
+    def _sift_up(self, index: int) -> None:
+        heap = self._heap
+        entry = heap[index]
+        while index > 0:
+            parent = self._parent(index)
+            if heap[parent] < entry:
+                break
+            heap[index] = heap[parent]
+            self._moved(heap[index], index)
+            index = parent
+        heap[index] = entry
+        self._moved(entry, index)
+
+    def _sift_down(self, index: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = self._arity * index + 1
+            if child >= size:
+                break
+            for sibling in range(child + 1, min(child + self._arity, size)):
+                if heap[sibling] < heap[child]:
+                    child = sibling
+            if entry < heap[child]:
+                break
+            heap[index] = heap[child]
+            self._moved(heap[index], index)
+            index = child
+        heap[index] = entry
+        self._moved(entry, index)
+
+    def _ordered(self) -> List[List[Any]]:
+        return sorted(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: Any) -> bool:
+        return any(entry[2] == item for entry in self._heap)
+
+    def __iter__(self) -> Iterator:
+        for _, _, item in self._ordered():
+            yield item
+
+    def __repr__(self) -> str:
+        items = [(item, priority) for priority, _, item in self._ordered()]
+        return f"{self.__class__.__name__}({items})"
+
+    __str__ = __repr__
+
+
+class IndexedPriorityQueue(PriorityQueue):
+    """Implement a Priority Queue that hands out a handle for each item.
+
+    Handles allow changing the priority of an item or removing it from
+    the queue in O(log n).
+
+    >>> pq = IndexedPriorityQueue()
+    >>> a = pq.enqueue("a", 5)
+    >>> b = pq.enqueue("b", 3)
+    >>> pq.front()
+    'b'
+    >>> pq.update_priority(a, 1)
+    >>> pq.front()
+    'a'
+    >>> pq.remove(a)
+    'a'
+    >>> pq
+    IndexedPriorityQueue([('b', 3)])
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Tuple[Any, Any]]] = None,
+        /,
+        arity: int = 4,
+    ) -> None:
+        self._positions: Dict[int, int] = {}
+        super().__init__(iterable, arity=arity)
+
+    @complexity("O(log n)")
+    def enqueue(self, item: Any, priority: Any) -> int:
+        """Add item to the queue and return its handle.
+
+        >>> pq = IndexedPriorityQueue([("a", 1)])
+        >>> pq.enqueue("b", 2)
+        1
+        """
+        return self._push(item, priority)[1]
+
+    def handles(self) -> Iterator[int]:
+        """Return an iterator over the handles in priority order.
+
+        >>> pq = IndexedPriorityQueue([("a", 2), ("b", 1)])
+        >>> list(pq.handles())
+        [1, 0]
+        """
+        for _, handle, _ in self._ordered():
+            yield handle
+
+    def priority(self, handle: int) -> Any:
+        """Return the priority of the item identified by handle.
+
+        >>> pq = IndexedPriorityQueue([("a", 2)])
+        >>> pq.priority(0)
+        2
+        """
+        return self._heap[self._position(handle)][0]
+
+    @complexity("O(log n)")
+    def update_priority(self, handle: int, priority: Any) -> None:
+        """Change the priority of the item identified by handle.
+
+        >>> pq = IndexedPriorityQueue([("a", 1), ("b", 2)])
+        >>> pq.update_priority(0, 3)
+        >>> pq
+        IndexedPriorityQueue([('b', 2), ('a', 3)])
+        >>> pq.update_priority(42, 1)
+        Traceback (most recent call last):
+        KeyError: 'invalid handle: 42'
+        """
+        index = self._position(handle)
+        self._heap[index][0] = priority
+        self._sift_up(index)
+        self._sift_down(self._positions[handle])
+
+    @complexity("O(log n)")
+    def remove(self, handle: int) -> Any:
+        """Remove the item identified by handle and return it.
+
+        >>> pq = IndexedPriorityQueue([("a", 1), ("b", 2)])
+        >>> pq.remove(1)
+        'b'
+        >>> pq
+        IndexedPriorityQueue([('a', 1)])
+        """
+        return self._remove_at(self._position(handle))[2]
+
+    def _remove_at(self, index: int) -> List[Any]:
+        entry = super()._remove_at(index)
+        self._positions.pop(entry[1], None)
+        return entry
+
+    def _position(self, handle: int) -> int:
+        try:
+            return self._positions[handle]
+        except KeyError:
+            raise KeyError(f"invalid handle: {handle}") from None
+
+    def _moved(self, entry: List[Any], index: int) -> None:
+        self._positions[entry[1]] = index
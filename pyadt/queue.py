@@ -1,8 +1,11 @@
 """Queue abstract data type."""
 
 from collections import deque
+from itertools import chain
 from typing import Any, Iterable, Iterator, Optional
 
+from pyadt.utils import complexity
+
 
 class Queue:
     """Implement a Queue (FIFO) abstract data type.
@@ -30,6 +33,16 @@ class Queue:
         if iterable is not None:
             self._data.extend(iterable)
 
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[Any]], /) -> "Queue":
+        """Return a new Queue built from an iterable of chunks of values.
+
+        >>> Queue.from_iterable([[1, 2], [3]])
+        Queue([1, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
+
+    @complexity("O(1)")
     def enqueue(self, item: Any) -> None:
         """Add items to the right end of the queue.
 
@@ -41,6 +54,7 @@ class Queue:
         """
         self._data.append(item)
 
+    @complexity("O(1)")
     def dequeue(self) -> Any:
         """Remove and return an item from the left end of the queue.
 
@@ -66,6 +80,7 @@ class Queue:
         except IndexError:
             raise IndexError("dequeue from an empty queue") from None
 
+    @complexity("O(1)")
     def front(self) -> Any:
         """Return the item at the beginning of the queue.
 
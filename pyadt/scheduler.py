@@ -0,0 +1,197 @@
+"""Work-stealing thread pool scheduler."""
+
+import os
+import threading
+from random import Random
+from typing import Any, Callable, List, Optional
+
+from pyadt.wsdeque import WorkStealingDeque
+
+
+class Task:
+    """Unit of work scheduled on a WorkStealingPool."""
+
+    def __init__(
+        self,
+        pool: "WorkStealingPool",
+        function: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> None:
+        self._pool = pool
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self._done = threading.Event()
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        """Return True if the task has finished, False otherwise."""
+        return self._done.is_set()
+
+    def join(self) -> Any:
+        """Wait for the task to finish and return its result.
+
+        A worker thread that joins a task runs other pending tasks while
+        it waits, so fork/join recursion never blocks the pool.
+        """
+        worker = self._pool._current_worker()
+        while not self._done.is_set():
+            if worker is None:
+                self._done.wait()
+                break
+            task = self._pool._find_task(worker)
+            if task is None:
+                self._done.wait(self._pool._idle_timeout)
+            else:
+                task._run()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def _run(self) -> None:
+        try:
+            self._result = self._function(*self._args, **self._kwargs)
+        except BaseException as exception:
+            self._exception = exception
+        finally:
+            self._done.set()
+
+    def _cancel(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._done.set()
+
+    def __repr__(self) -> str:
+        state = "done" if self.done() else "pending"
+        # Partials and callable instances have no __name__
+        name = getattr(self._function, "__name__", repr(self._function))
+        return f"{self.__class__.__name__}({name}, {state})"
+
+
+class WorkStealingPool:
+    """Implement a thread pool that schedules tasks by work stealing.
+
+    Each worker owns a WorkStealingDeque. Tasks spawned by a worker go to
+    the bottom of its own deque, and the worker pops the newest task
+    first. Idle workers steal the oldest tasks from other deques. Tasks
+    spawned from outside the pool go to a shared injection deque.
+
+    >>> def fib(pool, n):
+    ...     if n < 2:
+    ...         return n
+    ...     left = pool.spawn(fib, pool, n - 1)
+    ...     return fib(pool, n - 2) + left.join()
+    >>> with WorkStealingPool(4) as pool:
+    ...     pool.run(fib, pool, 15)
+    610
+    """
+
+    _idle_timeout = 0.01
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._deques = [WorkStealingDeque() for _ in range(workers)]
+        self._injected = WorkStealingDeque()
+        self._local = threading.local()
+        self._work_available = threading.Event()
+        self._shutdown = False
+        self._threads: List[threading.Thread] = []
+        for worker in range(workers):
+            thread = threading.Thread(
+                target=self._work, args=(worker,), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def workers(self) -> int:
+        """Return the number of worker threads."""
+        return len(self._deques)
+
+    def spawn(self, function: Callable, /, *args: Any, **kwargs: Any) -> Task:
+        """Schedule function(*args, **kwargs) and return its Task."""
+        if self._shutdown:
+            raise RuntimeError("spawn on a closed pool")
+        task = Task(self, function, args, kwargs)
+        worker = self._current_worker()
+        if worker is None:
+            self._injected.push(task)
+        else:
+            self._deques[worker].push(task)
+        self._work_available.set()
+        return task
+
+    def run(self, function: Callable, /, *args: Any, **kwargs: Any) -> Any:
+        """Run function(*args, **kwargs) on the pool and return its result."""
+        return self.spawn(function, *args, **kwargs).join()
+
+    def close(self) -> None:
+        """Stop the workers once they finish their current task.
+
+        Tasks that haven't started yet are discarded, and joining them
+        raises RuntimeError.
+        """
+        self._shutdown = True
+        self._work_available.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        for deque in (*self._deques, self._injected):
+            while True:
+                try:
+                    task = deque.steal()
+                except IndexError:
+                    break
+                task._cancel(RuntimeError("pool closed"))
+
+    def _current_worker(self) -> Optional[int]:
+        return getattr(self._local, "worker", None)
+
+    def _find_task(self, worker: int) -> Optional[Task]:
+        try:
+            return self._deques[worker].pop()
+        except IndexError:
+            pass
+        try:
+            return self._injected.steal()
+        except IndexError:
+            pass
+        count = len(self._deques)
+        start = self._local.random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim == worker:
+                continue
+            try:
+                return self._deques[victim].steal()
+            except IndexError:
+                continue
+        return None
+
+    def _work(self, worker: int) -> None:
+        self._local.worker = worker
+        self._local.random = Random(worker)
+        while not self._shutdown:
+            task = self._find_task(worker)
+            if task is not None:
+                task._run()
+                continue
+            self._work_available.clear()
+            task = self._find_task(worker)
+            if task is None:
+                self._work_available.wait(self._idle_timeout)
+            else:
+                task._run()
+
+    def __enter__(self) -> "WorkStealingPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(workers={self.workers})"
@@ -0,0 +1,277 @@
+"""Binary serialization of the pyadt containers.
+
+dump() writes Map, Set, Bag, Matrix and Array objects in a compact
+versioned format and load() reads them back:
+
+>>> from pyadt import Matrix
+>>> m = Matrix.from_list_of_lists([[1, 2], [3, 4]])
+>>> data = dumps(m)
+>>> data[:4]
+b'PADT'
+>>> print(loads(data))
+Matrix([1, 2] [3, 4])
+
+The format starts with a header holding a magic number, the format
+version and a type tag. The contents of a container follow as one or
+more sequences. Sequences of floats, or of ints that fit in 64 bits, are
+written as raw little-endian buffers of the narrowest type that holds
+them. Any other values are pickled one by one with a length prefix.
+Containers are written in chunks, so dumping a large one to a file
+doesn't build the whole byte string in memory. Like pickle, only load
+data that you trust.
+"""
+
+import copyreg
+import io
+import pickle
+import struct
+from itertools import chain
+from typing import IO, Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+from pyadt.array import Array
+from pyadt.bag import Bag
+from pyadt.map import Map
+from pyadt.matrix import Matrix
+from pyadt.set import Set
+
+MAGIC = b"PADT"
+VERSION = 1
+# Number of values written or read at a time
+CHUNK_SIZE = 65536
+
+OBJECTS, INT8, INT16, INT32, INT64, FLOAT64 = range(6)
+_FORMATS = {INT8: "b", INT16: "h", INT32: "i", INT64: "q", FLOAT64: "d"}
+_SIZES = {kind: struct.calcsize(f"<{code}") for kind, code in _FORMATS.items()}
+
+_HEADER = struct.Struct("<4sBB")
+_SEQUENCE = struct.Struct("<BQ")
+_LENGTH = struct.Struct("<Q")
+
+# Values of the sequences of a container, given as a list of segments
+Segments = List[Sequence[Any]]
+Dimensions = Tuple[int, ...]
+
+
+class Codec(NamedTuple):
+    tag: int
+    dimensions: Callable[[Any], Dimensions]
+    segments: Callable[[Any], List[Segments]]
+    build: Callable[[Dimensions, List[list]], Any]
+
+
+def _build_map(dimensions: Dimensions, sequences: List[list]) -> Map:
+    mapping = Map()
+    mapping._keys, mapping._values = sequences
+    return mapping
+
+
+def _build_set(dimensions: Dimensions, sequences: List[list]) -> Set:
+    elements = Set()
+    (elements._data,) = sequences
+    return elements
+
+
+def _build_bag(dimensions: Dimensions, sequences: List[list]) -> Bag:
+    (values,) = sequences
+    return Bag(values)
+
+
+def _build_matrix(dimensions: Dimensions, sequences: List[list]) -> Matrix:
+    rows, cols = dimensions
+    (values,) = sequences
+    matrix = Matrix(0, 0)
+    matrix._rows, matrix._cols = rows, cols
+    matrix._data = [values[i * cols : (i + 1) * cols] for i in range(rows)]
+    return matrix
+
+
+def _build_array(dimensions: Dimensions, sequences: List[list]) -> Array:
+    (values,) = sequences
+    array = Array(len(values))
+    array._data[:] = values
+    return array
+
+
+_CODECS: Dict[type, Codec] = {
+    Map: Codec(
+        1, lambda m: (), lambda m: [[m._keys], [m._values]], _build_map
+    ),
+    Set: Codec(2, lambda s: (), lambda s: [[s._data]], _build_set),
+    Bag: Codec(3, lambda b: (), lambda b: [[b._data]], _build_bag),
+    Matrix: Codec(
+        4, lambda m: (m.rows, m.cols), lambda m: [m._data], _build_matrix
+    ),
+    Array: Codec(5, lambda a: (), lambda a: [[a._data]], _build_array),
+}
+_TAGS = {codec.tag: codec for codec in _CODECS.values()}
+
+
+def _kind(segments: Segments) -> int:
+    # The narrowest typed kind that holds every value, or OBJECTS
+    types = set(map(type, chain.from_iterable(segments)))
+    if types == {float}:
+        return FLOAT64
+    if types - {int}:
+        return OBJECTS
+    low = min((min(segment) for segment in segments if segment), default=0)
+    high = max((max(segment) for segment in segments if segment), default=0)
+    for kind in (INT8, INT16, INT32, INT64):
+        limit = 2 ** (8 * _SIZES[kind] - 1)
+        if -limit <= low and high < limit:
+            return kind
+    return OBJECTS
+
+
+def _codec(obj: Any) -> Codec:
+    try:
+        return _CODECS[type(obj)]
+    except KeyError:
+        raise TypeError(
+            f"cannot serialize {type(obj).__name__} objects"
+        ) from None
+
+
+def _encode(kind: int, values: Sequence[Any]) -> bytes:
+    return struct.pack(f"<{len(values)}{_FORMATS[kind]}", *values)
+
+
+def _decode(kind: int, data: bytes) -> list:
+    count = len(data) // _SIZES[kind]
+    return list(struct.unpack(f"<{count}{_FORMATS[kind]}", data))
+
+
+def _read(file: IO[bytes], size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise EOFError("unexpected end of data")
+    return data
+
+
+def _write_sequence(file: IO[bytes], segments: Segments) -> None:
+    kind = _kind(segments)
+    count = sum(len(segment) for segment in segments)
+    file.write(_SEQUENCE.pack(kind, count))
+    for segment in segments:
+        for start in range(0, len(segment), CHUNK_SIZE):
+            chunk = segment[start : start + CHUNK_SIZE]
+            if kind == OBJECTS:
+                for value in chunk:
+                    payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                    file.write(_LENGTH.pack(len(payload)))
+                    file.write(payload)
+                continue
+            file.write(_encode(kind, chunk))
+
+
+def _read_sequence(file: IO[bytes]) -> list:
+    kind, count = _SEQUENCE.unpack(_read(file, _SEQUENCE.size))
+    if kind == OBJECTS:
+        values = []
+        for _ in range(count):
+            (length,) = _LENGTH.unpack(_read(file, _LENGTH.size))
+            values.append(pickle.loads(_read(file, length)))
+        return values
+    if kind not in _FORMATS:
+        raise ValueError(f"unknown sequence kind: {kind}")
+    values = []
+    # Read in chunks, so a corrupt count can't allocate a huge buffer
+    for start in range(0, count, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, count - start) * _SIZES[kind]
+        values.extend(_decode(kind, _read(file, size)))
+    return values
+
+
+def dump(obj: Any, file: IO[bytes]) -> None:
+    """Write obj to the binary file object file.
+
+    >>> import io
+    >>> file = io.BytesIO()
+    >>> dump(Set([1, 2, 3]), file)
+    >>> _ = file.seek(0)
+    >>> load(file)
+    Set([1, 2, 3])
+    >>> dump({1, 2}, file)
+    Traceback (most recent call last):
+    TypeError: cannot serialize set objects
+    """
+    codec = _codec(obj)
+    dimensions, sequences = codec.dimensions(obj), codec.segments(obj)
+    file.write(_HEADER.pack(MAGIC, VERSION, codec.tag))
+    file.write(bytes([len(dimensions)]))
+    for dimension in dimensions:
+        file.write(_LENGTH.pack(dimension))
+    file.write(bytes([len(sequences)]))
+    for segments in sequences:
+        _write_sequence(file, segments)
+
+
+def dumps(obj: Any) -> bytes:
+    """Return obj serialized as bytes.
+
+    >>> len(dumps(Bag([1.5, 2.5])))
+    33
+    """
+    file = io.BytesIO()
+    dump(obj, file)
+    return file.getvalue()
+
+
+def load(file: IO[bytes]) -> Any:
+    """Read a container from the binary file object file."""
+    magic, version, tag = _HEADER.unpack(_read(file, _HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("not a pyadt serialization")
+    if version != VERSION:
+        raise ValueError(f"unsupported format version: {version}")
+    try:
+        codec = _TAGS[tag]
+    except KeyError:
+        raise ValueError(f"unknown type tag: {tag}") from None
+    dimensions = tuple(
+        _LENGTH.unpack(_read(file, _LENGTH.size))[0]
+        for _ in range(_read(file, 1)[0])
+    )
+    sequences = [_read_sequence(file) for _ in range(_read(file, 1)[0])]
+    return codec.build(dimensions, sequences)
+
+
+def loads(data: bytes) -> Any:
+    """Return the container serialized in data.
+
+    >>> loads(dumps(Map(one=1, two=2.0)))
+    Map({'one': 1, 'two': 2.0})
+    >>> loads(b"nope")
+    Traceback (most recent call last):
+    EOFError: unexpected end of data
+    """
+    return load(io.BytesIO(data))
+
+
+def _pack(segments: Segments) -> Any:
+    kind = _kind(segments)
+    values = list(chain.from_iterable(segments))
+    if kind == OBJECTS:
+        return values
+    return kind, _encode(kind, values)
+
+
+def _rebuild(tag: int, dimensions: Dimensions, sequences: List[Any]) -> Any:
+    sequences = [
+        _decode(*values) if isinstance(values, tuple) else values
+        for values in sequences
+    ]
+    return _TAGS[tag].build(dimensions, sequences)
+
+
+def reduce(obj: Any) -> Tuple[Any, ...]:
+    """Return the value of obj.__reduce__() for pickle and copy.
+
+    Numeric sequences travel as raw buffers, any other values are left to
+    pickle itself. Subclasses may hold more state, so they're reduced like
+    plain objects instead.
+    """
+    codec = _CODECS.get(type(obj))
+    if codec is None:
+        return copyreg.__newobj__, (type(obj),), obj.__dict__.copy()
+    sequences = [_pack(segments) for segments in codec.segments(obj)]
+    return _rebuild, (codec.tag, codec.dimensions(obj), sequences)
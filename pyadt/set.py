@@ -1,6 +1,44 @@
 """Set abstract data type."""
 
-from typing import Any, Iterator, List, Optional, Sequence
+from itertools import chain, repeat
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyadt.utils import complexity
+
+# Total number of elements from which union(), intersection(), difference()
+# and is_disjoint() use the processes they're given. Below it, starting
+# them costs more than comparing the sets serially
+PARALLEL_MIN_SIZE = 50_000
+
+# Positions of the elements of a partition, and the elements
+Partition = Tuple[List[int], List[Any]]
+
+
+def _partition(data: List[Any], partitions: int) -> List[Partition]:
+    # Equal elements have equal hashes, so they land in the same partition
+    positions: List[List[int]] = [[] for _ in range(partitions)]
+    elements: List[List[Any]] = [[] for _ in range(partitions)]
+    for position, element in enumerate(data):
+        part = hash(element) % partitions
+        positions[part].append(position)
+        elements[part].append(element)
+    return list(zip(positions, elements))
+
+
+def _compare(
+    keep_common: Optional[bool], first: Partition, second: Partition
+) -> Union[bool, List[int]]:
+    # Positions of the elements of first that are (or aren't) in second,
+    # or whether first and second are disjoint if keep_common is None
+    (positions, elements), (_, others) = first, second
+    lookup = set(others)
+    if keep_common is None:
+        return lookup.isdisjoint(elements)
+    return [
+        position
+        for position, element in zip(positions, elements)
+        if (element in lookup) == keep_common
+    ]
 
 
 class Set:
@@ -25,12 +63,22 @@ class Set:
     3
     """
 
-    def __init__(self, iterable: Optional[Sequence[Any]] = None, /) -> None:
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, /) -> None:
         self._data: List[Any] = []
-        if iterable is not None and len(iterable) > 0:
+        if iterable is not None:
             for element in iterable:
                 self.__add(element)
 
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[Any]], /) -> "Set":
+        """Return a new Set built from an iterable of chunks of values.
+
+        >>> Set.from_iterable([[1, 2], [2, 3]])
+        Set([1, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
+
+    @complexity("O(n)")
     def add(self, element: Any) -> None:
         """Add element to set.
 
@@ -51,6 +99,7 @@ class Set:
 
     __add = add  # Avoid breaking the class by a subclasser
 
+    @complexity("O(n)")
     def remove(self, element: Any) -> None:
         """Remove an element from set.
 
@@ -83,6 +132,7 @@ class Set:
         except ValueError:
             pass
 
+    @complexity("O(1)")
     def pop(self) -> Any:
         """Pop an element from set.
 
@@ -131,6 +181,43 @@ class Set:
         if other.__class__ is not self.__class__:
             raise TypeError("Set object expected")
 
+    def _compare_by_hash(
+        self, other: "Set", keep_common: Optional[bool], workers: Optional[int]
+    ) -> Union[bool, List[int]]:
+        # Elements are hashable, so looking them up in a set of the other's
+        # elements gives the same result as scanning its list
+        if workers is None:
+            workers = 1
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if workers > 1 and len(self) + len(other) >= PARALLEL_MIN_SIZE:
+            return self._compare_in_parallel(other, keep_common, workers)
+        first = (list(range(len(self._data))), self._data)
+        return _compare(keep_common, first, ([], other._data))
+
+    def _compare_in_parallel(
+        self, other: "Set", keep_common: Optional[bool], workers: int
+    ) -> Union[bool, List[int]]:
+        # Compare one hash partition of both sets per worker process.
+        # Imported here, it loads most of multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        first = _partition(self._data, workers)
+        second = _partition(other._data, workers)
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(
+                pool.map(_compare, repeat(keep_common), first, second)
+            )
+        if keep_common is None:
+            return all(results)
+        return sorted(chain.from_iterable(results))
+
+    def _from_positions(self, data: List[Any], positions: List[int]) -> "Set":
+        new_set = type(self)()
+        new_set._data.extend(map(data.__getitem__, positions))
+        return new_set
+
+    @complexity("O(n^2)")
     def is_subset(self, other: "Set") -> bool:
         """Return True if set is subset of other, False otherwise.
 
@@ -164,9 +251,19 @@ class Set:
                 return False
         return True
 
-    def is_disjoint(self, other: "Set") -> bool:
+    def is_disjoint(
+        self, other: "Set", *, workers: Optional[int] = None
+    ) -> bool:
         """Return True if set has no elements in common with other.
 
+        Like union(), intersection() and difference(), it looks elements
+        up by hash, so it takes O(n). Parallelism is opt-in: with
+        workers=n, sets of PARALLEL_MIN_SIZE elements or more in total are
+        split in hash partitions and compared in n processes, with the
+        same result. The processes may be started with the spawn method,
+        which imports the __main__ module again, so only pass workers
+        from code under an if __name__ == "__main__" guard.
+
         >>> s = Set([1, 2, 3])
         >>> o = Set([4, 5, 6])
         >>> s.is_disjoint(o)
@@ -176,29 +273,36 @@ class Set:
         False
         """
         self._validate_other(other)
-        for element in self:
-            if element in other:
-                return False
-        return True
+        return self._compare_by_hash(other, None, workers)
 
-    def union(self, other: "Set") -> "Set":
+    @complexity("O(n)")
+    def union(self, other: "Set", *, workers: Optional[int] = None) -> "Set":
         """Return a new set that is the union of set and other.
 
+        Pass workers to compare large sets in that many processes, as
+        is_disjoint() describes.
+
         >>> s = Set([1, 2, 3])
         >>> o = Set([1, 4, 5])
         >>> s.union(o)
         Set([1, 2, 3, 4, 5])
         """
         self._validate_other(other)
-        new_set = type(self)()
-        new_set._data.extend(self._data)
-        for element in other:
-            new_set.__add(element)
+        # The elements of other that aren't in set
+        positions = other._compare_by_hash(self, False, workers)
+        new_set = other._from_positions(other._data, positions)
+        new_set._data[:0] = self._data
         return new_set
 
-    def intersection(self, other: "Set") -> "Set":
+    @complexity("O(n)")
+    def intersection(
+        self, other: "Set", *, workers: Optional[int] = None
+    ) -> "Set":
         """Return a new set that is the intersection of set with other.
 
+        Pass workers to compare large sets in that many processes, as
+        is_disjoint() describes.
+
         >>> s = Set([1, 2, 3])
         >>> o = Set([2, 4, 3, 6])
         >>> s.intersection(o)
@@ -207,15 +311,18 @@ class Set:
         Set([2, 3])
         """
         self._validate_other(other)
-        new_set = type(self)()
-        for element in self:
-            if element in other:
-                new_set.__add(element)
-        return new_set
+        positions = self._compare_by_hash(other, True, workers)
+        return self._from_positions(self._data, positions)
 
-    def difference(self, other: "Set") -> "Set":
+    @complexity("O(n)")
+    def difference(
+        self, other: "Set", *, workers: Optional[int] = None
+    ) -> "Set":
         """Return a new set with the difference between set and other.
 
+        Pass workers to compare large sets in that many processes, as
+        is_disjoint() describes.
+
         >>> s = Set([1, 2, 3])
         >>> o = Set([2, 4, 3, 6])
         >>> s.difference(o)
@@ -224,11 +331,8 @@ class Set:
         Set([4, 6])
         """
         self._validate_other(other)
-        new_set = type(self)()
-        for element in self:
-            if element not in other:
-                new_set.__add(element)
-        return new_set
+        positions = self._compare_by_hash(other, False, workers)
+        return self._from_positions(self._data, positions)
 
     def __eq__(self, other: "Set") -> bool:
         self._validate_other(other)
@@ -247,3 +351,9 @@ class Set:
         return f"{self.__class__.__name__}({self._data})"
 
     __str__ = __repr__
+
+    def __reduce__(self) -> tuple:
+        # Imported here, pyadt.serialize imports this module
+        from pyadt.serialize import reduce
+
+        return reduce(self)
@@ -0,0 +1,309 @@
+"""Shared memory Queue abstract data type."""
+
+import struct
+from multiprocessing import shared_memory
+from typing import Any, Iterable, List, Optional
+
+# Header layout. The producer and the consumer counters live on separate
+# cache lines so that the two processes don't keep invalidating each
+# other's cache.
+_META = struct.Struct("<QQ")  # capacity, record size (0 if variable)
+_COUNTERS = struct.Struct("<QQ")  # byte position, number of records
+_META_OFFSET = 0
+_TAIL_OFFSET = 64  # Written by the producer only
+_HEAD_OFFSET = 128  # Written by the consumer only
+_DATA_OFFSET = 192
+_LENGTH = struct.Struct("<I")
+
+
+class SharedQueue:
+    """Implement a Queue (FIFO) of bytes records living in shared memory.
+
+    The queue is a ring buffer in a multiprocessing.shared_memory block.
+    Processes exchange records through the buffer without pickling them
+    through a pipe. Records are either length-prefixed byte strings of
+    any size or fixed-size records when record_size is given.
+
+    Without locks, the queue is lock-free and safe for a single producer
+    and a single consumer. Pass producer_lock and consumer_lock (for
+    example, multiprocessing.Lock objects) to allow multiple producers and
+    multiple consumers.
+
+    >>> q = SharedQueue(64)
+    >>> q.enqueue(b"hello")
+    >>> q.enqueue(b"world")
+    >>> len(q)
+    2
+    >>> q.dequeue()
+    b'hello'
+    >>> q.close()
+    >>> q.unlink()
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        /,
+        record_size: Optional[int] = None,
+        *,
+        name: Optional[str] = None,
+        producer_lock: Optional[Any] = None,
+        consumer_lock: Optional[Any] = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if record_size is not None and not 0 < record_size <= capacity:
+            raise ValueError("invalid record size")
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_DATA_OFFSET + capacity
+        )
+        _META.pack_into(
+            self._shm.buf, _META_OFFSET, capacity, record_size or 0
+        )
+        _COUNTERS.pack_into(self._shm.buf, _TAIL_OFFSET, 0, 0)
+        _COUNTERS.pack_into(self._shm.buf, _HEAD_OFFSET, 0, 0)
+        self._setup(producer_lock, consumer_lock)
+
+    @classmethod
+    def attach(
+        cls,
+        name: str,
+        /,
+        *,
+        producer_lock: Optional[Any] = None,
+        consumer_lock: Optional[Any] = None,
+    ) -> "SharedQueue":
+        """Return a queue attached to the existing shared memory block name.
+
+        >>> q = SharedQueue(64)
+        >>> q.enqueue(b"hello")
+        >>> other = SharedQueue.attach(q.name)
+        >>> other.dequeue()
+        b'hello'
+        >>> other.close()
+        >>> q.close()
+        >>> q.unlink()
+        """
+        queue = cls.__new__(cls)
+        queue._shm = shared_memory.SharedMemory(name=name)
+        queue._setup(producer_lock, consumer_lock)
+        return queue
+
+    def _setup(self, producer_lock: Any, consumer_lock: Any) -> None:
+        capacity, record_size = _META.unpack_from(self._shm.buf, _META_OFFSET)
+        self._capacity: int = capacity
+        self._record_size: Optional[int] = record_size or None
+        self._producer_lock = producer_lock
+        self._consumer_lock = consumer_lock
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Return the size in bytes of the ring buffer."""
+        return self._capacity
+
+    def enqueue(self, record: bytes) -> None:
+        """Add a record to the right end of the queue.
+
+        >>> q = SharedQueue(8, record_size=4)
+        >>> q.enqueue(b"abcd")
+        >>> q.enqueue(b"efgh")
+        >>> q.enqueue(b"ijkl")
+        Traceback (most recent call last):
+        IndexError: enqueue to a full queue
+        >>> q.enqueue(b"ab")
+        Traceback (most recent call last):
+        ValueError: record size must be 4
+        >>> q.close()
+        >>> q.unlink()
+        """
+        if self.enqueue_many([record]) == 0:
+            raise IndexError("enqueue to a full queue")
+
+    def enqueue_many(self, records: Iterable[bytes]) -> int:
+        """Add records to the queue until it's full.
+
+        Return the number of records added. The records are published to
+        the consumer all at once. If a record can never fit in the queue,
+        or has the wrong size, it raises ValueError and adds none of them.
+
+        >>> q = SharedQueue(16)
+        >>> q.enqueue_many([b"one", b"two", b"three"])
+        2
+        >>> q.close()
+        >>> q.unlink()
+        """
+        if self._producer_lock is None:
+            return self._enqueue_many(records)
+        with self._producer_lock:
+            return self._enqueue_many(records)
+
+    def _enqueue_many(self, records: Iterable[bytes]) -> int:
+        buf = self._shm.buf
+        tail, count = _COUNTERS.unpack_from(buf, _TAIL_OFFSET)
+        head, _ = _COUNTERS.unpack_from(buf, _HEAD_OFFSET)
+        free = self._capacity - (tail - head)
+        # Encode the whole batch first, so an invalid record doesn't leave
+        # records written but never published
+        encoded = [self._encode(record) for record in records]
+        added = 0
+        for record in encoded:
+            if len(record) > free:
+                break
+            self._write(tail, record)
+            tail += len(record)
+            free -= len(record)
+            added += 1
+        if added:
+            _COUNTERS.pack_into(buf, _TAIL_OFFSET, tail, count + added)
+        return added
+
+    def _encode(self, record: bytes) -> bytes:
+        if self._record_size is None:
+            encoded = _LENGTH.pack(len(record)) + bytes(record)
+            if len(encoded) > self._capacity:
+                raise ValueError("record larger than the queue capacity")
+            return encoded
+        if len(record) != self._record_size:
+            raise ValueError(f"record size must be {self._record_size}")
+        return bytes(record)
+
+    def dequeue(self) -> bytes:
+        """Remove and return a record from the left end of the queue.
+
+        >>> q = SharedQueue(16)
+        >>> q.enqueue(b"spam")
+        >>> q.dequeue()
+        b'spam'
+        >>> q.dequeue()
+        Traceback (most recent call last):
+        IndexError: dequeue from an empty queue
+        >>> q.close()
+        >>> q.unlink()
+        """
+        records = self.dequeue_many(1)
+        if not records:
+            raise IndexError("dequeue from an empty queue")
+        return records[0]
+
+    def dequeue_many(self, max_records: Optional[int] = None) -> List[bytes]:
+        """Remove and return up to max_records records from the queue.
+
+        Return all the available records if max_records is None.
+
+        >>> q = SharedQueue(64)
+        >>> q.enqueue_many([b"one", b"two", b"three"])
+        3
+        >>> q.dequeue_many(2)
+        [b'one', b'two']
+        >>> q.dequeue_many()
+        [b'three']
+        >>> q.dequeue_many()
+        []
+        >>> q.close()
+        >>> q.unlink()
+        """
+        if self._consumer_lock is None:
+            return self._dequeue_many(max_records)
+        with self._consumer_lock:
+            return self._dequeue_many(max_records)
+
+    def _dequeue_many(self, max_records: Optional[int]) -> List[bytes]:
+        buf = self._shm.buf
+        head, count = _COUNTERS.unpack_from(buf, _HEAD_OFFSET)
+        tail, _ = _COUNTERS.unpack_from(buf, _TAIL_OFFSET)
+        records: List[bytes] = []
+        while head < tail and (
+            max_records is None or len(records) < max_records
+        ):
+            if self._record_size is None:
+                (size,) = _LENGTH.unpack(self._read(head, _LENGTH.size))
+                head += _LENGTH.size
+            else:
+                size = self._record_size
+            records.append(self._read(head, size))
+            head += size
+        if records:
+            _COUNTERS.pack_into(buf, _HEAD_OFFSET, head, count + len(records))
+        return records
+
+    def _write(self, position: int, data: bytes) -> None:
+        buf = self._shm.buf
+        start = position % self._capacity
+        first = min(len(data), self._capacity - start)
+        offset = _DATA_OFFSET + start
+        buf[offset : offset + first] = data[:first]
+        if first < len(data):
+            rest = len(data) - first
+            buf[_DATA_OFFSET : _DATA_OFFSET + rest] = data[first:]
+
+    def _read(self, position: int, size: int) -> bytes:
+        buf = self._shm.buf
+        start = position % self._capacity
+        first = min(size, self._capacity - start)
+        offset = _DATA_OFFSET + start
+        data = bytes(buf[offset : offset + first])
+        if first < size:
+            data += bytes(buf[_DATA_OFFSET : _DATA_OFFSET + size - first])
+        return data
+
+    def is_empty(self) -> bool:
+        """Return True if the queue is empty, False otherwise.
+
+        >>> q = SharedQueue(16)
+        >>> q.is_empty()
+        True
+        >>> q.enqueue(b"spam")
+        >>> q.is_empty()
+        False
+        >>> q.close()
+        >>> q.unlink()
+        """
+        return len(self) == 0
+
+    def close(self) -> None:
+        """Detach the queue from the shared memory block."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block.
+
+        Call it once, from one process, when the queue is no longer needed.
+        """
+        self._shm.unlink()
+
+    def __len__(self) -> int:
+        _, enqueued = _COUNTERS.unpack_from(self._shm.buf, _TAIL_OFFSET)
+        _, dequeued = _COUNTERS.unpack_from(self._shm.buf, _HEAD_OFFSET)
+        return enqueued - dequeued
+
+    def __enter__(self) -> "SharedQueue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Child processes attach to the block by name instead of copying it
+        return (
+            _attach,
+            (type(self), self.name, self._producer_lock, self._consumer_lock),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(name={self.name!r}, capacity={self._capacity})"
+        )
+
+    __str__ = __repr__
+
+
+def _attach(cls, name, producer_lock, consumer_lock):
+    return cls.attach(
+        name, producer_lock=producer_lock, consumer_lock=consumer_lock
+    )
@@ -0,0 +1,408 @@
+"""Sketch Bag abstract data type.
+
+A SketchBag counts the values of a stream approximately, in memory that
+doesn't depend on the length of the stream. It combines two sketches:
+
+- A CountMinSketch, which estimates how many times any value was added.
+- A SpaceSaving summary, which tracks the most common values.
+
+Sketches built from parts of a stream, say by different workers, can be
+merged into the sketch of the whole stream.
+"""
+
+import struct
+from heapq import heapify, heapreplace
+from itertools import chain
+from math import ceil, e, log
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pyadt.utils import complexity, stable_hash
+
+
+def _check_rate(name: str, value: float) -> None:
+    if not 0 < value < 1:
+        raise ValueError(f"{name} must be between 0 and 1")
+
+
+class CountMinSketch:
+    """Implement a Count-Min Sketch for approximate counting.
+
+    Estimates are never below the true count. With probability 1 - delta,
+    they're at most epsilon * total above it, where total is the sum of
+    every count added.
+
+    >>> sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    >>> sketch.add("a", 3)
+    >>> sketch.add("b")
+    >>> sketch.estimate("a"), sketch.estimate("b"), sketch.estimate("c")
+    (3, 1, 0)
+    >>> sketch.width, sketch.depth
+    (272, 5)
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01) -> None:
+        _check_rate("epsilon", epsilon)
+        _check_rate("delta", delta)
+        self._epsilon = epsilon
+        self._delta = delta
+        self._width = ceil(e / epsilon)
+        self._depth = ceil(log(1 / delta))
+        self._total = 0
+        # A row of width uint64 counters per hash function
+        self._table = bytearray(8 * self._width * self._depth)
+        self._counters = memoryview(self._table).cast("Q")
+
+    @property
+    def epsilon(self) -> float:
+        return self._epsilon
+
+    @property
+    def delta(self) -> float:
+        return self._delta
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def total(self) -> int:
+        """Return the sum of every count added."""
+        return self._total
+
+    def _positions(self, item: Any) -> List[int]:
+        # Double hashing gives an independent enough column per row
+        digest = stable_hash(item, 16)
+        first, second = digest & (2**64 - 1), digest >> 64 | 1
+        width = self._width
+        return [
+            row * width + (first + row * second) % width
+            for row in range(self._depth)
+        ]
+
+    @complexity("O(1)")
+    def add(self, item: Any, count: int = 1) -> None:
+        """Add count occurrences of item.
+
+        >>> sketch = CountMinSketch()
+        >>> sketch.add("a", -1)
+        Traceback (most recent call last):
+        ValueError: count must be non-negative
+        """
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        counters = self._counters
+        for position in self._positions(item):
+            counters[position] += count
+        self._total += count
+
+    @complexity("O(1)")
+    def estimate(self, item: Any) -> int:
+        """Return an estimate of the number of occurrences of item."""
+        counters = self._counters
+        return min(counters[position] for position in self._positions(item))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        """Return a new sketch counting the items of sketch and other.
+
+        >>> first, second = CountMinSketch(), CountMinSketch()
+        >>> first.add("a")
+        >>> second.add("a", 2)
+        >>> first.merge(second).estimate("a")
+        3
+        >>> first.merge(CountMinSketch(epsilon=0.1))
+        Traceback (most recent call last):
+        ValueError: sketches must have the same epsilon and delta
+        """
+        if other.__class__ is not self.__class__:
+            raise TypeError("CountMinSketch object expected")
+        if (other._epsilon, other._delta) != (self._epsilon, self._delta):
+            raise ValueError("sketches must have the same epsilon and delta")
+        merged = type(self)(self._epsilon, self._delta)
+        merged._table[:] = struct.pack(
+            f"={len(self._counters)}Q",
+            *map(sum, zip(self._counters, other._counters)),
+        )
+        merged._total = self._total + other._total
+        return merged
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self._epsilon == other._epsilon
+            and self._delta == other._delta
+            and self._table == other._table
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(epsilon={self._epsilon},"
+            f" delta={self._delta})"
+        )
+
+    __str__ = __repr__
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Memory views can't be pickled, the table itself can
+        state = self.__dict__.copy()
+        del state["_counters"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._counters = memoryview(self._table).cast("Q")
+
+
+class SpaceSaving:
+    """Implement the Space-Saving summary of the most common items.
+
+    It monitors at most capacity items. A new item replaces the least
+    counted one and inherits its count, so counts are never below the true
+    count. Every item that occurs more than total / capacity times is
+    monitored.
+
+    >>> top = SpaceSaving(capacity=2)
+    >>> for item in "abacada":
+    ...     top.add(item)
+    >>> top.most_common(1)
+    [('a', 4)]
+    >>> len(top)
+    2
+    """
+
+    def __init__(self, capacity: int = 100) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._counts: Dict[Any, int] = {}
+        # How much each count may be above the true count
+        self._errors: Dict[Any, int] = {}
+        # [count, sequence, item] entries. Counts only grow, so an entry
+        # may be stale, but it's never above the current count of its item
+        self._heap: List[List[Any]] = []
+        self._sequence = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def _entry(self, count: int, item: Any) -> List[Any]:
+        self._sequence += 1
+        return [count, self._sequence, item]
+
+    @complexity("O(log n)")
+    def add(self, item: Any, count: int = 1) -> None:
+        """Add count occurrences of item."""
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+            return
+        if len(counts) < self._capacity:
+            counts[item] = count
+            self._errors[item] = 0
+            self._heap.append(self._entry(count, item))
+            if len(self._heap) == self._capacity:
+                heapify(self._heap)
+            return
+        heap = self._heap
+        # Refresh stale entries until the smallest one is up to date
+        while heap[0][0] != counts[heap[0][2]]:
+            heapreplace(heap, self._entry(counts[heap[0][2]], heap[0][2]))
+        minimum, _, evicted = heap[0]
+        del counts[evicted], self._errors[evicted]
+        counts[item] = minimum + count
+        self._errors[item] = minimum
+        heapreplace(heap, self._entry(minimum + count, item))
+
+    def count(self, item: Any) -> int:
+        """Return the estimated count of a monitored item, or 0.
+
+        >>> top = SpaceSaving(capacity=2)
+        >>> top.add("a", 5)
+        >>> top.count("a"), top.count("b")
+        (5, 0)
+        """
+        return self._counts.get(item, 0)
+
+    def error(self, item: Any) -> int:
+        """Return how much the count of a monitored item may be too high."""
+        return self._errors.get(item, 0)
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """Return the n items with the highest counts, or every item."""
+        ranked = sorted(
+            self._counts.items(), key=lambda pair: pair[1], reverse=True
+        )
+        return ranked if n is None else ranked[:n]
+
+    def _floor(self) -> int:
+        # The count that an unmonitored item may have
+        if len(self._counts) < self._capacity:
+            return 0
+        return min(self._counts.values())
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Return a new summary of the items of summary and other.
+
+        >>> first, second = SpaceSaving(2), SpaceSaving(2)
+        >>> for item in "aab":
+        ...     first.add(item)
+        >>> for item in "acc":
+        ...     second.add(item)
+        >>> first.merge(second).most_common()
+        [('a', 3), ('c', 3)]
+        """
+        if other.__class__ is not self.__class__:
+            raise TypeError("SpaceSaving object expected")
+        if other._capacity != self._capacity:
+            raise ValueError("summaries must have the same capacity")
+        mine, theirs = self._floor(), other._floor()
+        counts, errors = {}, {}
+        for item in chain(self._counts, other._counts):
+            counts[item] = self._counts.get(item, mine) + other._counts.get(
+                item, theirs
+            )
+            errors[item] = self._errors.get(item, mine) + other._errors.get(
+                item, theirs
+            )
+        merged = type(self)(self._capacity)
+        kept = sorted(counts, key=counts.__getitem__, reverse=True)
+        for item in kept[: self._capacity]:
+            merged._counts[item] = counts[item]
+            merged._errors[item] = errors[item]
+            merged._heap.append(merged._entry(counts[item], item))
+        heapify(merged._heap)
+        return merged
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(capacity={self._capacity})"
+
+    __str__ = __repr__
+
+
+class SketchBag:
+    """Implement a Bag that counts its values approximately.
+
+    It doesn't store the values, only a CountMinSketch of their counts and
+    a SpaceSaving summary of the top_k most common ones. count() is never
+    below the true count and, with probability 1 - delta, at most
+    error_bound above it.
+
+    >>> b = SketchBag("abracadabra")
+    >>> len(b)
+    11
+    >>> b.count("a"), b.count("z")
+    (5, 0)
+    >>> b.most_common(2)
+    [('a', 5), ('b', 2)]
+    >>> "r" in b
+    True
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[Any]] = None,
+        /,
+        epsilon: float = 0.001,
+        delta: float = 0.01,
+        top_k: int = 100,
+    ) -> None:
+        self._sketch = CountMinSketch(epsilon, delta)
+        self._top = SpaceSaving(top_k)
+        if iterable is not None:
+            self.add_many(iterable)
+
+    @classmethod
+    def from_iterable(
+        cls, chunks: Iterable[Iterable[Any]], /, **options: Any
+    ) -> "SketchBag":
+        """Return a new SketchBag built from an iterable of chunks of values.
+
+        >>> SketchBag.from_iterable([[1, 2], [2, 3]]).count(2)
+        2
+        """
+        return cls(chain.from_iterable(chunks), **options)
+
+    @property
+    def error_bound(self) -> float:
+        """Return how much count() may be above the true count."""
+        return self._sketch.epsilon * self._sketch.total
+
+    @complexity("O(1)")
+    def add(self, value: Any, count: int = 1) -> None:
+        """Add count occurrences of value to the Bag.
+
+        >>> b = SketchBag()
+        >>> b.add("a")
+        >>> b.add("b", 10)
+        >>> len(b)
+        11
+        """
+        self._sketch.add(value, count)
+        self._top.add(value, count)
+
+    def add_many(self, values: Iterable[Any]) -> None:
+        """Add every value of values to the Bag."""
+        sketch, top = self._sketch, self._top
+        for value in values:
+            sketch.add(value)
+            top.add(value)
+
+    @complexity("O(1)")
+    def count(self, value: Any) -> int:
+        """Return an estimate of the number of times value was added."""
+        estimate = self._sketch.estimate(value)
+        if value in self._top:
+            # Both are overestimates, so the smaller one is closer
+            return min(estimate, self._top.count(value))
+        return estimate
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """Return up to n of the most common values and their counts.
+
+        Only the top_k values monitored by the Bag are candidates.
+        """
+        pairs = [
+            (value, self.count(value)) for value, _ in self._top.most_common()
+        ]
+        pairs.sort(key=lambda pair: pair[1], reverse=True)
+        return pairs if n is None else pairs[:n]
+
+    def merge(self, other: "SketchBag") -> "SketchBag":
+        """Return a new Bag counting the values of Bag and other.
+
+        >>> first, second = SketchBag("aab"), SketchBag("acc")
+        >>> merged = first.merge(second)
+        >>> merged.count("a"), len(merged)
+        (3, 6)
+        """
+        if other.__class__ is not self.__class__:
+            raise TypeError("SketchBag object expected")
+        merged = type(self)()
+        merged._sketch = self._sketch.merge(other._sketch)
+        merged._top = self._top.merge(other._top)
+        return merged
+
+    def __len__(self) -> int:
+        return self._sketch.total
+
+    def __contains__(self, value: Any) -> bool:
+        return self.count(value) > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(epsilon={self._sketch.epsilon},"
+            f" delta={self._sketch.delta}, top_k={self._top.capacity})"
+        )
+
+    __str__ = __repr__
@@ -0,0 +1,473 @@
+"""Sorted Map abstract data type."""
+
+from itertools import chain
+from random import Random
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from pyadt.map import Items
+from pyadt.utils import complexity
+
+# Probability that a node also appears on the next level up, and the
+# number of levels, enough for 4**32 keys
+P = 0.25
+MAX_LEVEL = 32
+
+
+class _Node:
+    # next[i] is the following node on level i, and width[i] the number of
+    # positions it skips. The last node of a level points to None, its
+    # width spans up to the position right after the last key
+    __slots__ = ("key", "value", "next", "width")
+
+    def __init__(self, key: Any, value: Any, level: int) -> None:
+        self.key = key
+        self.value = value
+        self.next: List[Optional["_Node"]] = [None] * level
+        self.width: List[int] = [1] * level
+
+
+class SortedMap:
+    """Implement a Sorted Map abstract data type based on a skip list.
+
+    Keys are kept in ascending order, so they must be comparable with
+    each other. Every node knows how many keys its links skip, which
+    gives rank() and select() in O(log n) expected time.
+
+    >>> m = SortedMap({"b": 2, "c": 3, "a": 1})
+    >>> m
+    SortedMap({'a': 1, 'b': 2, 'c': 3})
+    >>> print(m)
+    {'a': 1, 'b': 2, 'c': 3}
+    >>> m["b"]
+    2
+    >>> m["z"]
+    Traceback (most recent call last):
+    KeyError: 'z'
+    >>> m["aa"] = 11
+    >>> list(m)
+    ['a', 'aa', 'b', 'c']
+    >>> del m["c"]
+    >>> len(m)
+    3
+    >>> "aa" in m
+    True
+    """
+
+    def __init__(self, mapping: Optional[Items] = None, /, **kwargs) -> None:
+        self._random = Random()
+        self.clear()
+        self.update(mapping, **kwargs)
+
+    def _level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self._random.random() < P:
+            level += 1
+        return level
+
+    def _path(self, key: Any) -> Tuple[List[_Node], List[int]]:
+        # The last node before key on every level, and its position. The
+        # head is at position 0 and the keys at positions 1 to len(self)
+        path = [self._head] * len(self._head.next)
+        positions = [0] * len(self._head.next)
+        node, position = self._head, 0
+        for level in reversed(range(self._height)):
+            while (following := node.next[level]) is not None and (
+                following.key < key
+            ):
+                position += node.width[level]
+                node = following
+            path[level], positions[level] = node, position
+        return path, positions
+
+    def _find(self, key: Any) -> Optional[_Node]:
+        node = self._head
+        for level in reversed(range(self._height)):
+            while (following := node.next[level]) is not None and (
+                following.key < key
+            ):
+                node = following
+        node = node.next[0]
+        if node is not None and node.key == key:
+            return node
+        return None
+
+    def _node_at(self, index: int) -> _Node:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("SortedMap index out of range")
+        node, position = self._head, 0
+        for level in reversed(range(self._height)):
+            while (
+                node.next[level] is not None
+                and position + node.width[level] <= index + 1
+            ):
+                position += node.width[level]
+                node = node.next[level]
+        return node
+
+    def _unlink(self, key: Any) -> _Node:
+        path, _ = self._path(key)
+        node = path[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(f"{key}")
+        for level in range(self._height):
+            previous = path[level]
+            if previous.next[level] is node:
+                previous.width[level] += node.width[level] - 1
+                previous.next[level] = node.next[level]
+            else:
+                previous.width[level] -= 1
+        while self._height > 1 and self._head.next[self._height - 1] is None:
+            self._height -= 1
+        self._length -= 1
+        return node
+
+    def keys(self) -> Iterator[Any]:
+        """Return an iterator over the keys of map in ascending order.
+
+        >>> m = SortedMap(two=2, one=1)
+        >>> for key in m.keys():
+        ...     print(key)
+        one
+        two
+        """
+        node = self._head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    __iter__ = keys
+
+    def values(self) -> Iterator[Any]:
+        """Return an iterator over the values of map in key order.
+
+        >>> m = SortedMap(two=2, one=1)
+        >>> for value in m.values():
+        ...     print(value)
+        1
+        2
+        """
+        node = self._head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Return an iterator that yields key-value tuples in key order.
+
+        >>> m = SortedMap(two=2, one=1)
+        >>> for key, value in m.items():
+        ...     print(key, "->", value)
+        one -> 1
+        two -> 2
+        """
+        node = self._head.next[0]
+        while node is not None:
+            yield node.key, node.value
+            node = node.next[0]
+
+    def range(
+        self, low: Optional[Any] = None, high: Optional[Any] = None
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Return an iterator over the items with low <= key < high.
+
+        A bound of None leaves that end of the range open. Finding the
+        first item takes O(log n), each following item O(1).
+
+        >>> m = SortedMap((year, str(year)) for year in range(2018, 2024))
+        >>> list(m.range(2020, 2022))
+        [(2020, '2020'), (2021, '2021')]
+        >>> [key for key, _ in m.range(high=2020)]
+        [2018, 2019]
+        >>> [key for key, _ in m.range(2022)]
+        [2022, 2023]
+        """
+        if low is None:
+            node = self._head.next[0]
+        else:
+            path, _ = self._path(low)
+            node = path[0].next[0]
+        while node is not None and (high is None or node.key < high):
+            yield node.key, node.value
+            node = node.next[0]
+
+    def update(self, other: Optional[Items] = None, /, **kwargs) -> None:
+        """Update map with items from other.
+
+        other can be a mapping or an iterable of key-value pairs.
+
+        >>> m = SortedMap(one=1)
+        >>> m.update({"two": 2, "one": 11})
+        >>> m
+        SortedMap({'one': 11, 'two': 2})
+        """
+        if other is not None:
+            pairs = other.items() if hasattr(other, "items") else other
+            for key, value in pairs:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def set_default(self, key, default: Optional[Any] = None, /) -> Any:
+        """Insert a key-default pair into map if key doesn't exist.
+
+        Return the value for key if key is in the map, else default.
+
+        >>> m = SortedMap()
+        >>> m.set_default("one", 1)
+        1
+        >>> m.set_default("one", 2)
+        1
+        """
+        node = self._find(key)
+        if node is not None:
+            return node.value
+        self[key] = default
+        return default
+
+    def get(self, key: Any, default: Optional[Any] = None, /) -> Any:
+        """Return the value for key if key is in map, else default.
+
+        >>> m = SortedMap(one=1)
+        >>> m.get("one")
+        1
+        >>> m.get("two", 0)
+        0
+        """
+        node = self._find(key)
+        return default if node is None else node.value
+
+    @complexity("O(log n)")
+    def pop(self, key: Any) -> Any:
+        """Remove a key-value pair and return the value.
+
+        >>> m = SortedMap(one=1, two=2)
+        >>> m.pop("one")
+        1
+        >>> m.pop("missing")
+        Traceback (most recent call last):
+        KeyError: 'missing'
+        """
+        return self._unlink(key).value
+
+    @complexity("O(log n)")
+    def pop_first(self) -> Tuple[Any, Any]:
+        """Remove and return the item with the smallest key.
+
+        >>> m = SortedMap({1: "a", 2: "b"})
+        >>> m.pop_first()
+        (1, 'a')
+        >>> m.pop_first()
+        (2, 'b')
+        >>> m.pop_first()
+        Traceback (most recent call last):
+        KeyError: 'pop from an empty SortedMap'
+        """
+        node = self._head.next[0]
+        if node is None:
+            raise KeyError("pop from an empty SortedMap")
+        self._unlink(node.key)
+        return node.key, node.value
+
+    @complexity("O(log n)")
+    def pop_last(self) -> Tuple[Any, Any]:
+        """Remove and return the item with the largest key.
+
+        >>> m = SortedMap({1: "a", 2: "b"})
+        >>> m.pop_last()
+        (2, 'b')
+        >>> m
+        SortedMap({1: 'a'})
+        """
+        if not self._length:
+            raise KeyError("pop from an empty SortedMap")
+        node = self._node_at(-1)
+        self._unlink(node.key)
+        return node.key, node.value
+
+    @complexity("O(log n)")
+    def floor(self, key: Any) -> Any:
+        """Return the largest key less than or equal to key.
+
+        >>> m = SortedMap({10: "a", 20: "b"})
+        >>> m.floor(15)
+        10
+        >>> m.floor(20)
+        20
+        >>> m.floor(5)
+        Traceback (most recent call last):
+        KeyError: 'no key <= 5'
+        """
+        path, _ = self._path(key)
+        node = path[0].next[0]
+        if node is not None and node.key == key:
+            return key
+        if path[0] is self._head:
+            raise KeyError(f"no key <= {key}")
+        return path[0].key
+
+    @complexity("O(log n)")
+    def ceiling(self, key: Any) -> Any:
+        """Return the smallest key greater than or equal to key.
+
+        >>> m = SortedMap({10: "a", 20: "b"})
+        >>> m.ceiling(15)
+        20
+        >>> m.ceiling(10)
+        10
+        >>> m.ceiling(25)
+        Traceback (most recent call last):
+        KeyError: 'no key >= 25'
+        """
+        path, _ = self._path(key)
+        node = path[0].next[0]
+        if node is None:
+            raise KeyError(f"no key >= {key}")
+        return node.key
+
+    @complexity("O(log n)")
+    def rank(self, key: Any) -> int:
+        """Return the number of keys less than key.
+
+        key doesn't need to be in map, like bisect.bisect_left().
+
+        >>> m = SortedMap({10: "a", 20: "b", 30: "c"})
+        >>> m.rank(20)
+        1
+        >>> m.rank(25)
+        2
+        """
+        _, positions = self._path(key)
+        return positions[0]
+
+    @complexity("O(log n)")
+    def select(self, index: int) -> Any:
+        """Return the key at index in sorted order.
+
+        >>> m = SortedMap({10: "a", 20: "b", 30: "c"})
+        >>> m.select(0)
+        10
+        >>> m.select(-1)
+        30
+        >>> m.select(3)
+        Traceback (most recent call last):
+        IndexError: SortedMap index out of range
+        """
+        return self._node_at(index).key
+
+    def clear(self) -> None:
+        """Remove all the items from map.
+
+        >>> m = SortedMap(one=1)
+        >>> m.clear()
+        >>> m
+        SortedMap({})
+        """
+        self._head = _Node(None, None, MAX_LEVEL)
+        self._height = 1
+        self._length = 0
+
+    @classmethod
+    def from_iterable(
+        cls, chunks: Iterable[Iterable[Tuple[Any, Any]]], /
+    ) -> "SortedMap":
+        """Return a new SortedMap built from an iterable of chunks of pairs.
+
+        >>> SortedMap.from_iterable([[(2, "b")], [(1, "a")]])
+        SortedMap({1: 'a', 2: 'b'})
+        """
+        return cls(chain.from_iterable(chunks))
+
+    @classmethod
+    @complexity("O(n)")
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]], /) -> "SortedMap":
+        """Return a new SortedMap built from pairs in strictly ascending order.
+
+        The skip list is linked in a single pass, with no searches.
+
+        >>> SortedMap.from_sorted([(1, "a"), (2, "b")])
+        SortedMap({1: 'a', 2: 'b'})
+        >>> SortedMap.from_sorted([(2, "b"), (1, "a")])
+        Traceback (most recent call last):
+        ValueError: keys must be in strictly ascending order
+        """
+        mapping = cls()
+        head = mapping._head
+        # The last node linked on every level and its position
+        last = [head] * MAX_LEVEL
+        positions = [0] * MAX_LEVEL
+        position = 0
+        for key, value in items:
+            if position and not last[0].key < key:
+                raise ValueError("keys must be in strictly ascending order")
+            position += 1
+            node = _Node(key, value, mapping._level())
+            for level in range(len(node.next)):
+                last[level].next[level] = node
+                last[level].width[level] = position - positions[level]
+                last[level], positions[level] = node, position
+            mapping._height = max(mapping._height, len(node.next))
+        for level in range(mapping._height):
+            last[level].width[level] = position + 1 - positions[level]
+        mapping._length = position
+        return mapping
+
+    @complexity("O(log n)")
+    def __getitem__(self, key: Any) -> Any:
+        node = self._find(key)
+        if node is None:
+            raise KeyError(f"{key}")
+        return node.value
+
+    @complexity("O(log n)")
+    def __setitem__(self, key: Any, value: Any) -> None:
+        path, positions = self._path(key)
+        node = path[0].next[0]
+        if node is not None and node.key == key:
+            node.value = value
+            return
+        node = _Node(key, value, self._level())
+        height = len(node.next)
+        for level in range(self._height, height):
+            # The head spans the whole map on levels that were empty
+            self._head.width[level] = self._length + 1
+        self._height = max(self._height, height)
+        position = positions[0] + 1
+        for level in range(self._height):
+            previous = path[level]
+            if level < height:
+                skipped = position - positions[level]
+                node.next[level] = previous.next[level]
+                node.width[level] = previous.width[level] - skipped + 1
+                previous.next[level] = node
+                previous.width[level] = skipped
+            else:
+                previous.width[level] += 1
+        self._length += 1
+
+    @complexity("O(log n)")
+    def __delitem__(self, key: Any) -> None:
+        self._unlink(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __reversed__(self) -> Iterator[Any]:
+        yield from reversed(list(self.keys()))
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self.items(), other.items())
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def __str__(self) -> str:
+        return f"{dict(self.items())}"
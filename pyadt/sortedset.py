@@ -0,0 +1,360 @@
+"""Sorted Set abstract data type."""
+
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+from pyadt.set import Set
+from pyadt.sortedmap import SortedMap
+from pyadt.utils import complexity
+
+# Which of the merged sets an element comes from
+FIRST, BOTH, SECOND = -1, 0, 1
+
+_DONE = object()
+
+
+def _merge(first: Iterable, second: Iterable) -> Iterator[Tuple[int, Any]]:
+    # Walk two ascending runs in step, like the merge of merge sort
+    first, second = iter(first), iter(second)
+    a, b = next(first, _DONE), next(second, _DONE)
+    while a is not _DONE and b is not _DONE:
+        if a < b:
+            yield FIRST, a
+            a = next(first, _DONE)
+        elif b < a:
+            yield SECOND, b
+            b = next(second, _DONE)
+        else:
+            yield BOTH, a
+            a, b = next(first, _DONE), next(second, _DONE)
+    if a is not _DONE:
+        yield FIRST, a
+        yield from ((FIRST, element) for element in first)
+    if b is not _DONE:
+        yield SECOND, b
+        yield from ((SECOND, element) for element in second)
+
+
+class SortedSet:
+    """Implement a Sorted Set abstract data type based on a SortedMap.
+
+    Elements are kept in ascending order, so they must be comparable with
+    each other. Set operations merge the sorted elements of both sets in
+    linear time.
+
+    >>> s = SortedSet([3, 1, 2, 3])
+    >>> s
+    SortedSet([1, 2, 3])
+    >>> len(s)
+    3
+    >>> 2 in s
+    True
+    >>> s[0], s[-1]
+    (1, 3)
+    >>> s[1:]
+    SortedSet([2, 3])
+    """
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, /) -> None:
+        self._map = SortedMap()
+        if iterable is not None:
+            # Sorting in C first beats inserting the elements one by one
+            values = sorted(iterable)
+            self._map = SortedMap.from_sorted(
+                (element, None)
+                for i, element in enumerate(values)
+                if not i or values[i - 1] < element
+            )
+
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[Any]], /) -> "SortedSet":
+        """Return a new SortedSet built from an iterable of chunks of values.
+
+        >>> SortedSet.from_iterable([[3, 1], [2, 3]])
+        SortedSet([1, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
+
+    @classmethod
+    @complexity("O(n)")
+    def from_sorted(cls, iterable: Iterable[Any], /) -> "SortedSet":
+        """Return a new SortedSet from values in strictly ascending order.
+
+        >>> SortedSet.from_sorted([1, 5, 9])
+        SortedSet([1, 5, 9])
+        """
+        new_set = cls()
+        new_set._map = SortedMap.from_sorted(
+            (element, None) for element in iterable
+        )
+        return new_set
+
+    __from_sorted = from_sorted
+
+    @classmethod
+    def from_set(cls, other: Set, /) -> "SortedSet":
+        """Return a new SortedSet with the elements of a Set.
+
+        >>> SortedSet.from_set(Set([3, 1, 2]))
+        SortedSet([1, 2, 3])
+        """
+        # Set elements are unique already
+        return cls.__from_sorted(sorted(other))
+
+    def to_set(self) -> Set:
+        """Return a Set with the elements of sorted set, in ascending order.
+
+        >>> SortedSet([2, 1]).to_set()
+        Set([1, 2])
+        """
+        new_set = Set()
+        new_set._data = list(self)
+        return new_set
+
+    @complexity("O(log n)")
+    def add(self, element: Any) -> None:
+        """Add element to sorted set.
+
+        >>> s = SortedSet([1, 3])
+        >>> s.add(2)
+        >>> s
+        SortedSet([1, 2, 3])
+        """
+        self._map[element] = None
+
+    @complexity("O(log n)")
+    def remove(self, element: Any) -> None:
+        """Remove an element from sorted set.
+
+        >>> s = SortedSet([1, 2])
+        >>> s.remove(2)
+        >>> s
+        SortedSet([1])
+        >>> s.remove(42)
+        Traceback (most recent call last):
+        KeyError: '42 not in set'
+        """
+        try:
+            del self._map[element]
+        except KeyError:
+            raise KeyError(f"{element} not in set") from None
+
+    def discard(self, element: Any) -> None:
+        """Remove element from sorted set if present.
+
+        >>> s = SortedSet([1, 2])
+        >>> s.discard(1)
+        >>> s.discard(100)
+        >>> s
+        SortedSet([2])
+        """
+        if element in self._map:
+            del self._map[element]
+
+    @complexity("O(log n)")
+    def pop(self) -> Any:
+        """Remove and return the largest element.
+
+        >>> s = SortedSet([1, 2])
+        >>> s.pop()
+        2
+        >>> s.pop()
+        1
+        >>> s.pop()
+        Traceback (most recent call last):
+        KeyError: 'pop from an empty set'
+        """
+        if not self._map:
+            raise KeyError("pop from an empty set")
+        return self._map.pop_last()[0]
+
+    def clear(self) -> None:
+        """Remove all the elements from sorted set.
+
+        >>> s = SortedSet([1, 2, 3])
+        >>> s.clear()
+        >>> s
+        SortedSet([])
+        """
+        self._map.clear()
+
+    def update(self, other: "SortedSet") -> None:
+        """Update sorted set with elements from other.
+
+        >>> s = SortedSet([1, 3])
+        >>> s.update(SortedSet([2, 4]))
+        >>> s
+        SortedSet([1, 2, 3, 4])
+        >>> s.update([7, 8, 9])
+        Traceback (most recent call last):
+        TypeError: SortedSet object expected
+        """
+        self._map = self.union(other)._map
+
+    def _validate_other(self, other) -> None:
+        if other.__class__ is not self.__class__:
+            raise TypeError("SortedSet object expected")
+
+    def _merged(self, other: "SortedSet", *sides: int) -> "SortedSet":
+        self._validate_other(other)
+        return self.__from_sorted(
+            element for side, element in _merge(self, other) if side in sides
+        )
+
+    @complexity("O(n)")
+    def is_subset(self, other: "SortedSet") -> bool:
+        """Return True if sorted set is subset of other, False otherwise.
+
+        >>> s = SortedSet([1, 2, 3])
+        >>> s.is_subset(SortedSet([1, 2, 3, 4, 5]))
+        True
+        >>> SortedSet([2, 4, 6]).is_subset(s)
+        False
+        """
+        self._validate_other(other)
+        if len(self) > len(other):
+            return False
+        return all(side != FIRST for side, _ in _merge(self, other))
+
+    def is_superset(self, other: "SortedSet") -> bool:
+        """Return True if sorted set is superset of other, False otherwise.
+
+        >>> SortedSet([1, 2, 3]).is_superset(SortedSet([1, 3]))
+        True
+        """
+        self._validate_other(other)
+        return other.is_subset(self)
+
+    def is_disjoint(self, other: "SortedSet") -> bool:
+        """Return True if sorted set has no elements in common with other.
+
+        >>> s = SortedSet([1, 2, 3])
+        >>> s.is_disjoint(SortedSet([4, 5, 6]))
+        True
+        >>> s.is_disjoint(SortedSet([2, 4, 6]))
+        False
+        """
+        self._validate_other(other)
+        return all(side != BOTH for side, _ in _merge(self, other))
+
+    @complexity("O(n)")
+    def union(self, other: "SortedSet") -> "SortedSet":
+        """Return a new sorted set that is the union of set and other.
+
+        >>> SortedSet([1, 2, 3]).union(SortedSet([1, 4, 5]))
+        SortedSet([1, 2, 3, 4, 5])
+        """
+        return self._merged(other, FIRST, BOTH, SECOND)
+
+    @complexity("O(n)")
+    def intersection(self, other: "SortedSet") -> "SortedSet":
+        """Return a new sorted set that is the intersection of set with other.
+
+        >>> SortedSet([1, 2, 3]).intersection(SortedSet([2, 4, 3, 6]))
+        SortedSet([2, 3])
+        """
+        return self._merged(other, BOTH)
+
+    @complexity("O(n)")
+    def difference(self, other: "SortedSet") -> "SortedSet":
+        """Return a new sorted set with the difference between set and other.
+
+        >>> SortedSet([1, 2, 3]).difference(SortedSet([2, 4, 3, 6]))
+        SortedSet([1])
+        """
+        return self._merged(other, FIRST)
+
+    def symmetric_difference(self, other: "SortedSet") -> "SortedSet":
+        """Return a new sorted set with the elements in exactly one set.
+
+        >>> SortedSet([1, 2, 3]).symmetric_difference(SortedSet([3, 4]))
+        SortedSet([1, 2, 4])
+        """
+        return self._merged(other, FIRST, SECOND)
+
+    @complexity("O(log n)")
+    def rank(self, element: Any) -> int:
+        """Return the number of elements less than element.
+
+        Like bisect.bisect_left(), element doesn't need to be in the set.
+
+        >>> s = SortedSet([10, 20, 30])
+        >>> s.rank(20)
+        1
+        >>> s.rank(25)
+        2
+        """
+        return self._map.rank(element)
+
+    @complexity("O(log n)")
+    def index(self, element: Any) -> int:
+        """Return the position of element in ascending order.
+
+        >>> s = SortedSet([10, 20, 30])
+        >>> s.index(30)
+        2
+        >>> s.index(25)
+        Traceback (most recent call last):
+        ValueError: 25 is not in set
+        """
+        position = self._map.rank(element)
+        if position == len(self) or self._map.select(position) != element:
+            raise ValueError(f"{element} is not in set")
+        return position
+
+    def range(
+        self, low: Optional[Any] = None, high: Optional[Any] = None
+    ) -> Iterator[Any]:
+        """Return an iterator over the elements with low <= element < high.
+
+        A bound of None leaves that end of the range open.
+
+        >>> s = SortedSet(range(0, 100, 10))
+        >>> list(s.range(25, 60))
+        [30, 40, 50]
+        >>> list(s.range(high=20))
+        [0, 10]
+        """
+        return (element for element, _ in self._map.range(low, high))
+
+    @complexity("O(log n)")
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, "SortedSet"]:
+        if not isinstance(index, slice):
+            return self._map.select(index)
+        start, stop, step = index.indices(len(self))
+        if step < 0:
+            raise ValueError("slice step must be positive")
+        if start >= stop:
+            return type(self)()
+        # Walk the bottom level from start, instead of selecting each index
+        node = self._map._node_at(start)
+        elements = []
+        for _ in range(stop - start):
+            elements.append(node.key)
+            node = node.next[0]
+        return self.__from_sorted(islice(elements, 0, None, step))
+
+    @complexity("O(log n)")
+    def __contains__(self, element: Any) -> bool:
+        return element in self._map
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return len(self) == len(other) and all(
+            side == BOTH for side, _ in _merge(self, other)
+        )
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._map.keys()
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._map)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    __str__ = __repr__
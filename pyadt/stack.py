@@ -1,15 +1,28 @@
 """Stack abstract data type."""
 
 from collections import deque
-from typing import Any, Iterator, Optional
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional
+
+from pyadt.utils import complexity
 
 
 class Stack:
-    def __init__(self, iterable: Optional[Any] = None, /) -> None:
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, /) -> None:
         self._data: deque = deque()
         if iterable is not None:
             self._data.extend(iterable)
 
+    @classmethod
+    def from_iterable(cls, chunks: Iterable[Iterable[Any]], /) -> "Stack":
+        """Return a new Stack built from an iterable of chunks of values.
+
+        >>> Stack.from_iterable([[1, 2], [3]])
+        Stack([1, 2, 3])
+        """
+        return cls(chain.from_iterable(chunks))
+
+    @complexity("O(1)")
     def push(self, item: Any) -> None:
         """Push an item onto the stack.
 
@@ -20,6 +33,7 @@ class Stack:
         """
         self._data.append(item)
 
+    @complexity("O(1)")
     def pop(self) -> Any:
         """Pop an item from the top of the stack.
 
@@ -41,6 +55,7 @@ class Stack:
         except IndexError:
             raise IndexError("pop from an empty stack") from None
 
+    @complexity("O(1)")
     def top(self) -> Any:
         """Return the item at the top of the stack.
 
@@ -0,0 +1,376 @@
+"""TTL map abstract data type."""
+
+import time
+from heapq import heapify, heappop, heappush
+from itertools import count
+from math import inf
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pyadt.map import Items, Map
+from pyadt.utils import complexity
+
+EXPIRED, EVICTED = "expired", "evicted"
+
+# Called with the key, the value and EXPIRED or EVICTED
+EvictionCallback = Callable[[Any, Any, str], Any]
+
+
+class TTLMap(Map):
+    """Implement a Map whose items expire after a time to live (TTL).
+
+    Every item gets the default ttl of the map, or its own ttl, in
+    seconds of clock(). Items live in a dict, instead of the lists of
+    Map, so removing one takes O(1), and a min-heap of deadlines finds
+    the expired ones. Every operation sweeps them first, so a sweep takes
+    O(expired log n) and touches none of the live items. If the map grows
+    past maxsize, it evicts the items closest to expiring first, then the
+    oldest ones.
+
+    >>> now = [0]
+    >>> sessions = TTLMap(ttl=30, clock=lambda: now[0])
+    >>> sessions["ana"] = "cart"
+    >>> sessions.set("bob", "checkout", ttl=60)
+    >>> now[0] = 45
+    >>> sessions
+    TTLMap({'bob': 'checkout'})
+    >>> sessions.expired
+    1
+    """
+
+    def __init__(
+        self,
+        mapping: Optional[Items] = None,
+        /,
+        ttl: Optional[float] = None,
+        maxsize: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Optional[EvictionCallback] = None,
+        **kwargs,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._data: Dict[Any, Any] = {}
+        self._ttl = inf if ttl is None else ttl
+        self._maxsize = maxsize
+        self._clock = clock
+        self._on_evict = on_evict
+        self._deadlines: Dict[Any, float] = {}
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._sequence = count()
+        self._expired = 0
+        self._evicted = 0
+        self.update(mapping, **kwargs)
+
+    @property
+    def expired(self) -> int:
+        """Return the number of items removed because they expired."""
+        return self._expired
+
+    @property
+    def evicted(self) -> int:
+        """Return the number of items removed to stay within maxsize."""
+        return self._evicted
+
+    def _schedule(self, key: Any, ttl: Optional[float], now: float) -> None:
+        ttl = self._ttl if ttl is None else ttl
+        if ttl == inf:
+            self._deadlines.pop(key, None)
+            return
+        deadline = now + ttl
+        self._deadlines[key] = deadline
+        heappush(self._heap, (deadline, next(self._sequence), key))
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            # Drop the entries of keys that were set again or removed
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._heap = [
+            (deadline, next(self._sequence), key)
+            for key, deadline in self._deadlines.items()
+        ]
+        heapify(self._heap)
+
+    def _discard(self, keys: List[Any], reason: str) -> None:
+        # Remove only keys, in O(1) each, and report them
+        removed = []
+        for key in keys:
+            removed.append((key, self._data.pop(key)))
+            self._deadlines.pop(key, None)
+        if reason == EXPIRED:
+            self._expired += len(keys)
+        else:
+            self._evicted += len(keys)
+        if self._on_evict is not None:
+            for key, value in removed:
+                self._on_evict(key, value, reason)
+
+    def expire(self) -> int:
+        """Remove the expired items and return how many there were.
+
+        Every other operation calls it, so calling it directly is only
+        needed to run the eviction callbacks sooner.
+
+        >>> now = [0]
+        >>> m = TTLMap({"one": 1, "two": 2}, ttl=10, clock=lambda: now[0])
+        >>> now[0] = 10
+        >>> m.expire()
+        2
+        """
+        now = self._clock()
+        heap, deadlines = self._heap, self._deadlines
+        expired = []
+        while heap and heap[0][0] <= now:
+            deadline, _, key = heappop(heap)
+            if deadlines.get(key) == deadline:
+                # Several entries of a key can share a deadline
+                del deadlines[key]
+                expired.append(key)
+        if expired:
+            self._discard(expired, EXPIRED)
+        return len(expired)
+
+    def _evict(self) -> None:
+        if self._maxsize is None or len(self._data) <= self._maxsize:
+            return
+        excess = len(self._data) - self._maxsize
+        victims = []
+        heap, deadlines = self._heap, self._deadlines
+        while heap and len(victims) < excess:
+            deadline, _, key = heappop(heap)
+            if deadlines.get(key) == deadline:
+                del deadlines[key]
+                victims.append(key)
+        if len(victims) < excess:
+            chosen = set(victims)
+            oldest = (key for key in self._data if key not in chosen)
+            victims.extend(next(oldest) for _ in range(excess - len(victims)))
+        self._discard(victims, EVICTED)
+
+    @complexity("O(log n)")
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Set the value of key, expiring it after ttl seconds.
+
+        ttl defaults to the one of the map. Pass math.inf to keep the item
+        until it's removed.
+
+        >>> now = [0]
+        >>> m = TTLMap(ttl=10, clock=lambda: now[0])
+        >>> m.set("one", 1, ttl=5)
+        >>> m.set("two", 2)
+        >>> now[0] = 5
+        >>> list(m)
+        ['two']
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.expire()
+        self._data[key] = value
+        self._schedule(key, ttl, self._clock())
+        self._evict()
+
+    @complexity("O(n log n)")
+    def set_many(self, pairs: Items, ttl: Optional[float] = None) -> None:
+        """Set the value of every key in pairs, expiring them after ttl.
+
+        >>> m = TTLMap(ttl=10)
+        >>> m.set_many({"one": 1, "two": 2}, ttl=60)
+        >>> m
+        TTLMap({'one': 1, 'two': 2})
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.expire()
+        self._assign(pairs, ttl=ttl)
+        self._evict()
+
+    def _assign(
+        self,
+        pairs: Items,
+        resolver: Optional[Callable[[Any, Any], Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if hasattr(pairs, "items"):
+            pairs = pairs.items()
+        data, now = self._data, self._clock()
+        for key, value in pairs:
+            if resolver is not None and key in data:
+                value = resolver(data[key], value)
+            data[key] = value
+            self._schedule(key, ttl, now)
+
+    @complexity("O(n)")
+    def get_many(self, keys: Iterable[Any]) -> List[Any]:
+        """Return a list with the value of every key in keys."""
+        self.expire()
+        try:
+            return [self._data[key] for key in keys]
+        except KeyError as error:
+            raise KeyError(f"{error.args[0]}") from None
+
+    @complexity("O(n)")
+    def delete_many(self, keys: Iterable[Any]) -> None:
+        """Remove every key in keys, or none of them if one is missing."""
+        self.expire()
+        keys = list(keys)
+        found = set()
+        for key in keys:
+            if key not in self._data or key in found:
+                raise KeyError(f"{key}")
+            found.add(key)
+        for key in keys:
+            del self._data[key]
+            self._deadlines.pop(key, None)
+
+    @complexity("O(n log n)")
+    def merge(
+        self,
+        other: Items,
+        resolver: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> "TTLMap":
+        """Return a new map with the items of map and other.
+
+        Items keep their deadlines, and the ones set from other get the
+        default ttl, as set() does.
+
+        >>> now = [0]
+        >>> m = TTLMap({"apples": 2}, ttl=10, clock=lambda: now[0])
+        >>> now[0] = 5
+        >>> merged = m.merge({"pears": 3})
+        >>> now[0] = 10
+        >>> merged
+        TTLMap({'pears': 3})
+        """
+        self.expire()
+        merged = self.__class__(
+            maxsize=self._maxsize, clock=self._clock, on_evict=self._on_evict
+        )
+        merged._ttl = self._ttl
+        merged._data.update(self._data)
+        merged._deadlines.update(self._deadlines)
+        merged._rebuild()
+        merged._assign(other, resolver)
+        merged._evict()
+        return merged
+
+    @complexity("O(1)")
+    def pop(self, key: Any) -> Any:
+        """Remove a key-value pair and return the value.
+
+        >>> m = TTLMap(one=1)
+        >>> m.pop("one")
+        1
+        """
+        self.expire()
+        try:
+            value = self._data.pop(key)
+        except KeyError:
+            raise KeyError(f"{key}") from None
+        self._deadlines.pop(key, None)
+        return value
+
+    @complexity("O(1)")
+    def popitem(self) -> Any:
+        """Remove and return the last key-value pair as a tuple."""
+        self.expire()
+        try:
+            key, value = self._data.popitem()
+        except KeyError:
+            raise KeyError("popitem from empty Map") from None
+        self._deadlines.pop(key, None)
+        return key, value
+
+    def clear(self) -> None:
+        """Remove all the items from map, without counting them."""
+        self._data.clear()
+        self._deadlines.clear()
+        self._heap.clear()
+
+    @classmethod
+    def fromkeys(
+        cls, iterable: Iterable, value: Optional[Any] = None, /
+    ) -> "TTLMap":
+        """Return a new TTLMap with keys from iterable and values from value.
+
+        >>> TTLMap.fromkeys(["one", "two"])
+        TTLMap({'one': None, 'two': None})
+        """
+        return cls((key, value) for key in iterable)
+
+    def keys(self) -> Iterator[Any]:
+        """Return an iterator over the keys that haven't expired."""
+        self.expire()
+        return iter(list(self._data))
+
+    __iter__ = keys
+
+    def values(self) -> Iterator[Any]:
+        """Return an iterator over the values that haven't expired."""
+        self.expire()
+        return iter(list(self._data.values()))
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Return an iterator over the items that haven't expired."""
+        self.expire()
+        return iter(list(self._data.items()))
+
+    @complexity("O(1)")
+    def __getitem__(self, key: Any) -> Any:
+        self.expire()
+        try:
+            return self._data[key]
+        except KeyError:
+            raise KeyError(f"{key}") from None
+
+    get = __getitem__
+
+    @complexity("O(log n)")
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.set(key, value)
+
+    @complexity("O(1)")
+    def __delitem__(self, key: Any) -> None:
+        self.expire()
+        try:
+            del self._data[key]
+        except KeyError:
+            raise KeyError(f"{key}") from None
+        self._deadlines.pop(key, None)
+
+    @complexity("O(n)")
+    def __eq__(self, other: "Map") -> bool:
+        if other.__class__ is not self.__class__:
+            raise TypeError("Map object expected")
+        self.expire()
+        other.expire()
+        return self._data == other._data
+
+    def __contains__(self, key: Any) -> bool:
+        self.expire()
+        return key in self._data
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self._data)
+
+    def __reversed__(self):
+        self.expire()
+        yield from reversed(list(self._data))
+
+    def __repr__(self) -> str:
+        self.expire()
+        return f"{self.__class__.__name__}({self._data})"
+
+    def __str__(self) -> str:
+        self.expire()
+        return f"{self._data}"
@@ -1,4 +1,4 @@
-from typing import NamedTuple, Tuple
+from typing import Any, Callable, NamedTuple, Tuple
 
 
 class Index(NamedTuple):
@@ -17,3 +17,74 @@ def validate_index(
     if not 0 <= col < cols:
         raise IndexError("Column index out of range")
     return Index(row, col)
+
+
+COMPLEXITY_CLASSES = ("O(1)", "O(log n)", "O(n)", "O(n log n)", "O(n^2)")
+
+
+def complexity(expected: str) -> Callable:
+    """Declare the expected time complexity of a method.
+
+    The declaration is stored in the __complexity__ attribute and checked
+    by pyadt.complexity. The method itself is returned unchanged.
+    """
+    if expected not in COMPLEXITY_CLASSES:
+        raise ValueError(f"unknown complexity class: {expected}")
+
+    def declare(function: Callable) -> Callable:
+        function.__complexity__ = expected
+        return function
+
+    return declare
+
+
+def _encode(item: Any) -> bytes:
+    # Canonical bytes of item: equal items, as with ==, encode the same
+    if isinstance(item, float) and item.is_integer():
+        item = int(item)
+    if isinstance(item, int):
+        return b"i%d" % item
+    if isinstance(item, float):
+        return b"f" + item.hex().encode("ascii")
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+    if isinstance(item, bytes):
+        return b"b" + item
+    if item is None:
+        return b"n"
+    if isinstance(item, (tuple, frozenset)):
+        # Prefix every part with its size, so parts can't run together
+        parts = [_encode(element) for element in item]
+        if isinstance(item, frozenset):
+            parts.sort()
+        prefix = b"t" if isinstance(item, tuple) else b"z"
+        return prefix + b"".join(b"%d:%s" % (len(p), p) for p in parts)
+    raise TypeError(f"can't hash {type(item).__name__} objects stably")
+
+
+def stable_hash(item: Any, size: int = 8) -> int:
+    """Return a hash of item, of size bytes, that's the same in every process.
+
+    hash() of str and bytes objects changes from one process to the next,
+    so it can't be stored. item can be None, a number, a str, a bytes, or
+    a tuple or frozenset of those, and equal items hash the same, like
+    with hash(). Other types raise TypeError.
+
+    >>> stable_hash("pyadt")
+    8158668268756397891
+    >>> stable_hash(1) == stable_hash(1.0) == stable_hash(True)
+    True
+    >>> key = (1, frozenset("ab"))
+    >>> stable_hash(key) == stable_hash((1.0, frozenset("ba")))
+    True
+    >>> stable_hash(b"pyadt", size=16).bit_length() > 64
+    True
+    >>> stable_hash(["pyadt"])
+    Traceback (most recent call last):
+    TypeError: can't hash list objects stably
+    """
+    # Imported here, most ADTs never hash anything
+    from hashlib import blake2b
+
+    data = _encode(item)
+    return int.from_bytes(blake2b(data, digest_size=size).digest(), "little")
@@ -0,0 +1,107 @@
+"""Work-stealing deque abstract data type."""
+
+from collections import deque
+from typing import Any, Iterable, Iterator, Optional
+
+
+class WorkStealingDeque:
+    """Implement a work-stealing deque abstract data type.
+
+    The owner of the deque pushes and pops items at the bottom (LIFO),
+    while other threads steal items from the top (FIFO). Stealing the
+    oldest items gives thieves the largest pieces of pending work.
+
+    This implementation uses a collections.deque, whose append(), pop()
+    and popleft() methods are atomic, so the owner and the thieves can
+    share the deque without extra locking.
+
+    >>> d = WorkStealingDeque([1, 2, 3])
+    >>> d
+    WorkStealingDeque([1, 2, 3])
+    >>> d.push(4)
+    >>> d.pop()
+    4
+    >>> d.steal()
+    1
+    >>> d
+    WorkStealingDeque([2, 3])
+    """
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, /) -> None:
+        self._data: deque = deque()
+        if iterable is not None:
+            self._data.extend(iterable)
+
+    def push(self, item: Any) -> None:
+        """Push an item onto the bottom of the deque. Owner only.
+
+        >>> d = WorkStealingDeque()
+        >>> d.push(1)
+        >>> d.push(2)
+        >>> d
+        WorkStealingDeque([1, 2])
+        """
+        self._data.append(item)
+
+    def pop(self) -> Any:
+        """Pop the newest item from the bottom of the deque. Owner only.
+
+        >>> d = WorkStealingDeque([1, 2])
+        >>> d.pop()
+        2
+        >>> d.pop()
+        1
+        >>> d.pop()
+        Traceback (most recent call last):
+        IndexError: pop from an empty deque
+        """
+        try:
+            return self._data.pop()
+        except IndexError:
+            raise IndexError("pop from an empty deque") from None
+
+    def steal(self) -> Any:
+        """Steal the oldest item from the top of the deque.
+
+        >>> d = WorkStealingDeque([1, 2])
+        >>> d.steal()
+        1
+        >>> d.steal()
+        2
+        >>> d.steal()
+        Traceback (most recent call last):
+        IndexError: steal from an empty deque
+        """
+        try:
+            return self._data.popleft()
+        except IndexError:
+            raise IndexError("steal from an empty deque") from None
+
+    def is_empty(self) -> bool:
+        """Return True if the deque is empty, False otherwise.
+
+        >>> d = WorkStealingDeque()
+        >>> d.is_empty()
+        True
+        >>> d.push(1)
+        >>> d.is_empty()
+        False
+        """
+        return len(self._data) == 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._data)})"
+
+    __str__ = __repr__
+
+    def __iter__(self) -> Iterator:
+        yield from self._data
+
+    def __reversed__(self) -> Iterator:
+        yield from reversed(self._data)
@@ -0,0 +1,108 @@
+"""Test aggstack.py."""
+
+from math import gcd
+from random import Random
+
+import pytest
+
+from pyadt import AggregateQueue, AggregateStack, Stack
+
+
+@pytest.fixture
+def mock_stack():
+    return AggregateStack([5, 2, 8, 1, 9])
+
+
+def test_is_stack(mock_stack):
+    assert isinstance(mock_stack, Stack)
+    assert list(mock_stack) == [5, 2, 8, 1, 9]
+    assert mock_stack.top() == 9
+
+
+def test_aggregates(mock_stack):
+    expected = [(1, 9, 25), (1, 8, 16), (2, 8, 15), (2, 5, 7), (5, 5, 5)]
+    for minimum, maximum, total in expected:
+        assert mock_stack.min() == minimum
+        assert mock_stack.max() == maximum
+        assert mock_stack.sum() == total
+        mock_stack.pop()
+    assert mock_stack.is_empty()
+
+
+def test_aggregate_empty():
+    s = AggregateStack()
+    with pytest.raises(IndexError, match="aggregate of an empty stack"):
+        s.min()
+    with pytest.raises(IndexError):
+        s.pop()
+
+
+def test_custom_operations():
+    s = AggregateStack([12, 18, 27], operations={"gcd": gcd})
+    assert s.aggregate("gcd") == 3
+    with pytest.raises(KeyError, match="unknown aggregate: min"):
+        s.min()
+
+
+def test_push_failure_keeps_stack_consistent(mock_stack):
+    with pytest.raises(TypeError):
+        mock_stack.push("a")
+    assert len(mock_stack) == 5
+    assert mock_stack.sum() == 25
+
+
+def test_queue_fifo():
+    q = AggregateQueue("hello")
+    assert q.front() == "h"
+    assert [q.dequeue() for _ in range(5)] == list("hello")
+    with pytest.raises(IndexError, match="dequeue from an empty queue"):
+        q.dequeue()
+    with pytest.raises(IndexError, match="front from an empty queue"):
+        q.front()
+
+
+def test_queue_aggregate_empty():
+    q = AggregateQueue()
+    with pytest.raises(IndexError, match="aggregate of an empty queue"):
+        q.sum()
+    with pytest.raises(KeyError):
+        q.aggregate("missing")
+
+
+def test_queue_non_commutative_operation():
+    q = AggregateQueue(operations={"concat": str.__add__})
+    for char in "abcdef":
+        q.enqueue(char)
+        if len(q) > 3:
+            q.dequeue()
+        window = "".join(q)
+        assert q.aggregate("concat") == window
+
+
+@pytest.mark.parametrize("window", [1, 3, 10])
+def test_sliding_window(window):
+    random = Random(window)
+    numbers = [random.randint(-100, 100) for _ in range(300)]
+    q = AggregateQueue(maxlen=window)
+    for i, number in enumerate(numbers):
+        q.enqueue(number)
+        expected = numbers[max(0, i - window + 1) : i + 1]
+        assert list(q) == expected
+        assert list(reversed(q)) == expected[::-1]
+        assert q.min() == min(expected)
+        assert q.max() == max(expected)
+        assert q.sum() == sum(expected)
+
+
+def test_queue_invalid_maxlen():
+    with pytest.raises(ValueError):
+        AggregateQueue(maxlen=0)
+
+
+def test_queue_contains():
+    q = AggregateQueue([1, 2, 3])
+    q.dequeue()
+    q.enqueue(4)
+    assert 2 in q
+    assert 4 in q
+    assert 1 not in q
@@ -108,3 +108,103 @@ def test_reversed(get_hello_bag):
 
 def test_iter(get_hello_bag):
     assert list(iter(get_hello_bag)) == ["h", "e", "l", "l", "o"]
+
+
+def test_from_iterable():
+    assert list(Bag.from_iterable(iter([[1, 1], [2]]))) == [1, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "method, operator",
+    [
+        pytest.param("sum", "__add__", id="sum"),
+        pytest.param("union", "__or__", id="union"),
+        pytest.param("intersection", "__and__", id="intersection"),
+        pytest.param("difference", "__sub__", id="difference"),
+    ],
+)
+def test_multiset_operations(method, operator):
+    first, second = "mississippi", "misspell"
+    result = getattr(Bag(first), method)(Bag(second))
+    expected = getattr(Counter(first), operator)(Counter(second))
+    assert result.as_counter() == expected
+    assert len(result) == sum(expected.values())
+    assert all(result.count(value) == expected[value] for value in expected)
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [
+        pytest.param("", "abc", True, id="empty"),
+        pytest.param("aab", "abab", True, id="subbag"),
+        pytest.param("aab", "aab", True, id="equal"),
+        pytest.param("aaa", "aab", False, id="count"),
+        pytest.param("abc", "aabb", False, id="missing"),
+    ],
+)
+def test_is_subbag(first, second, expected):
+    assert Bag(first).is_subbag(Bag(second)) == expected
+
+
+def test_multiset_operation_invalid(get_hello_bag):
+    with pytest.raises(TypeError, match="Bag object expected"):
+        get_hello_bag.union(Counter("hello"))
+    with pytest.raises(TypeError):
+        get_hello_bag.union(Bag([[1, 2]]))
+
+
+@pytest.mark.parametrize("k", [None, 0, 2, 10])
+def test_most_common(k):
+    text = "the quick brown fox jumps over the lazy dog"
+    assert Bag(text).most_common(k) == Counter(text).most_common(k)
+
+
+def test_add_many():
+    b = Bag([1])
+    b.add_many(iter([2, 2]))
+    b.add_many("ab", counts=iter([3, 0]))
+    assert list(b) == [1, 2, 2, "a", "a", "a"]
+    assert b.count(2) == 2
+    assert b.count("b") == 0
+    with pytest.raises(ValueError, match="non-negative"):
+        b.add_many("cd", counts=[1, -1])
+    # A failed add_many leaves the bag unchanged
+    assert len(b) == 6
+    assert "c" not in b
+
+
+@pytest.mark.parametrize(
+    "counts, error",
+    [
+        pytest.param([1], ValueError, id="short-counts"),
+        pytest.param([1, 1, 1], ValueError, id="long-counts"),
+        pytest.param([1, 2.0], TypeError, id="float-count"),
+    ],
+)
+def test_add_many_invalid_counts(counts, error):
+    b = Bag([1])
+    with pytest.raises(error):
+        b.add_many("cd", counts=counts)
+    assert list(b) == [1]
+    assert b.count("c") == 0
+
+
+def test_counts_follow_mutations(get_hello_bag):
+    get_hello_bag.remove("l")
+    get_hello_bag.pop()
+    get_hello_bag.randpop()
+    get_hello_bag.add("h")
+    assert get_hello_bag.as_counter() == Counter(get_hello_bag)
+
+
+def test_unhashable_items():
+    b = Bag([[1], 2, 2])
+    assert b.count([1]) == 1
+    assert b.count(2) == 2
+    assert [1] in b
+    with pytest.raises(TypeError):
+        b.most_common()
+    # Counting resumes once the unhashable items are gone
+    b.remove([1])
+    assert b.most_common() == [(2, 2)]
+    assert [1] not in b
@@ -0,0 +1,48 @@
+"""Test the benchmarks package."""
+
+import pytest
+
+from benchmarks import runner
+from benchmarks.__main__ import main
+from benchmarks.scenarios import SCENARIOS
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenarios_run(name):
+    SCENARIOS[name].setup(10)()
+
+
+def test_run_skips_sizes_above_max_size():
+    results = runner.run(sizes=[10, 10**9], pattern="map.set")
+    assert list(results) == ["map.set"]
+    assert list(results["map.set"]) == ["10"]
+
+
+def test_compare():
+    baseline = {"map.get": {"10": 1.0, "100": 2.0}, "set.add": {"10": 1.0}}
+    current = {"map.get": {"10": 1.05, "100": 3.0}, "bag.add": {"10": 9.0}}
+    regressions = runner.compare(baseline, current, threshold=0.1)
+    assert regressions == [runner.Regression("map.get", "100", 2.0, 3.0)]
+    assert regressions[0].ratio == 1.5
+
+
+def test_cli(tmp_path, capsys):
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    assert (
+        main(
+            [
+                "run",
+                "--sizes",
+                "10",
+                "--filter",
+                "stack.*",
+                "--output",
+                str(baseline),
+            ]
+        )
+        == 0
+    )
+    runner.save({"stack.push_pop": {"10": 1e6}}, str(current))
+    assert runner.load(str(baseline)).keys() == {"stack.push_pop"}
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert "REGRESSION stack.push_pop size=10" in capsys.readouterr().out
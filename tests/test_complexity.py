@@ -0,0 +1,80 @@
+"""Test complexity.py."""
+
+import pytest
+
+from pyadt import complexity
+from pyadt.complexity import PROBES, Probe, declarations, fit, main, verify
+from pyadt.utils import complexity as declare
+
+SIZES = [256, 512, 1024, 2048, 4096]
+
+
+class Linear:
+    @declare("O(1)")
+    def scan(self, values):
+        for _ in values:
+            pass
+
+
+def _classes():
+    return [
+        value
+        for value in vars(complexity).values()
+        if isinstance(value, type) and value.__module__.startswith("pyadt.")
+    ]
+
+
+@pytest.mark.parametrize("target", PROBES, ids=lambda target: target.name)
+def test_probes_run(target):
+    target.setup(min(target.sizes))()
+
+
+def test_every_declaration_has_a_probe():
+    probed = {(target.cls, target.method) for target in PROBES}
+    for cls in _classes():
+        for method in declarations(cls):
+            assert (cls, method) in probed, f"{cls.__name__}.{method}"
+
+
+@pytest.mark.parametrize(
+    "times, expected",
+    [
+        pytest.param([5.0, 5.2, 4.9, 5.1, 5.0], "O(1)", id="constant"),
+        pytest.param([8.0, 9.0, 10.0, 11.0, 12.0], "O(log n)", id="log"),
+        pytest.param([1.0, 2.1, 3.9, 8.2, 16.0], "O(n)", id="linear"),
+        pytest.param([8.0, 18.0, 40.0, 88.0, 192.0], "O(n log n)", id="nlogn"),
+        pytest.param([1.0, 4.0, 16.0, 64.0, 256.0], "O(n^2)", id="quadratic"),
+    ],
+)
+def test_fit(times, expected):
+    assert fit(SIZES, times) == expected
+
+
+def test_declare_unknown_class():
+    with pytest.raises(ValueError, match="unknown complexity class: O"):
+        declare("O")
+
+
+def test_declarations():
+    assert declarations(Linear) == {"scan": "O(1)"}
+
+
+def test_verify_reports_failures(monkeypatch):
+    probe = Probe(
+        Linear,
+        "scan",
+        lambda size: lambda: Linear().scan(range(size * 100)),
+        SIZES,
+    )
+    monkeypatch.setattr(complexity, "PROBES", [probe])
+    (result,) = verify()
+    assert result.name == "Linear.scan"
+    assert result.declared == "O(1)"
+    assert not result.passed
+
+
+def test_cli(capsys):
+    assert main(["--filter", "Stack.top"]) == 0
+    output = capsys.readouterr().out
+    assert "Stack.top" in output
+    assert "AggregateStack.top" not in output
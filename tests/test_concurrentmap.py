@@ -0,0 +1,148 @@
+"""Test concurrentmap.py."""
+
+import pickle
+import threading
+
+import pytest
+
+from pyadt import ConcurrentMap
+
+THREADS = 8
+
+
+def _run_threads(target, *args):
+    threads = [
+        threading.Thread(target=target, args=(number, *args))
+        for number in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.fixture
+def get_map():
+    return ConcurrentMap({"one": 1, "two": 2}, three=3)
+
+
+def test_build(get_map):
+    assert len(get_map) == 3
+    assert dict(get_map.items()) == {"one": 1, "two": 2, "three": 3}
+    assert sorted(get_map) == ["one", "three", "two"]
+    assert sorted(get_map.values()) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("shards", [0, -1])
+def test_invalid_shards(shards):
+    with pytest.raises(ValueError, match="shards must be positive"):
+        ConcurrentMap(shards=shards)
+
+
+def test_get_set_delete(get_map):
+    get_map["four"] = 4
+    assert get_map["four"] == 4
+    assert "four" in get_map
+    del get_map["four"]
+    assert "four" not in get_map
+    assert get_map.get("four") is None
+    with pytest.raises(KeyError, match="four"):
+        get_map["four"]
+    with pytest.raises(KeyError, match="four"):
+        del get_map["four"]
+
+
+def test_shard_sizes():
+    mapping = ConcurrentMap(((key, key) for key in range(1000)), shards=8)
+    sizes = mapping.shard_sizes()
+    assert len(sizes) == 8
+    assert sum(sizes) == len(mapping) == 1000
+    assert min(sizes) > 0
+
+
+def test_concurrent_writes():
+    mapping = ConcurrentMap()
+
+    def write(number):
+        for key in range(1000):
+            mapping[number * 1000 + key] = number
+
+    _run_threads(write)
+    assert len(mapping) == THREADS * 1000
+
+
+def test_atomic_set_default_and_pop():
+    mapping = ConcurrentMap()
+    winners, popped = [], []
+
+    def set_default(number):
+        for key in range(500):
+            if mapping.set_default(key, number) == number:
+                winners.append(key)
+
+    def pop(number):
+        for key in range(500):
+            if mapping.pop(key, None) is not None:
+                popped.append(key)
+
+    # Exactly one thread sets, and one thread pops, every key
+    _run_threads(set_default)
+    assert sorted(winners) == list(range(500))
+    _run_threads(pop)
+    assert sorted(popped) == list(range(500))
+    assert len(mapping) == 0
+
+
+def test_compute_if_absent_calls_function_once():
+    mapping = ConcurrentMap(shards=2)
+    calls = []
+
+    def compute(key):
+        calls.append(key)
+        return key * 2
+
+    def race(number):
+        for key in range(200):
+            assert mapping.compute_if_absent(key, compute) == key * 2
+
+    _run_threads(race)
+    assert sorted(calls) == list(range(200))
+
+
+def test_weakly_consistent_iteration():
+    mapping = ConcurrentMap((key, key) for key in range(1000))
+    stop = threading.Event()
+
+    def churn(number):
+        key = 1000 + number
+        while not stop.is_set():
+            mapping[key] = key
+            del mapping[key]
+
+    threads = [
+        threading.Thread(target=churn, args=(number,)) for number in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(20):
+            # Never fails, and sees every key that doesn't change
+            assert set(range(1000)) <= set(mapping)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def test_clear(get_map):
+    get_map.clear()
+    assert len(get_map) == 0
+    assert list(get_map) == []
+
+
+def test_pickle(get_map):
+    restored = pickle.loads(pickle.dumps(get_map))
+    assert restored == get_map
+    assert len(restored.shard_sizes()) == len(get_map.shard_sizes())
+    restored["four"] = 4
+    assert restored != get_map
@@ -0,0 +1,194 @@
+"""Test diskmap.py."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pyadt import DiskMap
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "table"
+
+
+@pytest.fixture
+def get_map(path):
+    with DiskMap(path) as mapping:
+        mapping.update({"one": 1, "two": 2}, three=3)
+        yield mapping
+
+
+def test_map_interface(get_map):
+    assert len(get_map) == 3
+    assert get_map["one"] == get_map.get("one") == 1
+    assert "two" in get_map
+    assert "four" not in get_map
+    assert get_map.set_default("four", 4) == 4
+    assert get_map.set_default("four", 44) == 4
+    assert get_map.pop("four") == 4
+    with pytest.raises(KeyError, match="four"):
+        get_map.pop("four")
+    with pytest.raises(KeyError, match="four"):
+        get_map["four"]
+    with pytest.raises(TypeError):
+        get_map[[1, 2]] = 12
+    with pytest.raises(TypeError, match="tuple key expected"):
+        get_map[frozenset("abc")] = 3
+    with pytest.raises(TypeError, match="tuple key expected"):
+        get_map[("one", None)]
+    assert get_map.get_many(["three", "one"]) == [3, 1]
+    assert repr(get_map) == f"DiskMap({str(get_map._path)!r})"
+
+
+def test_iteration_order(get_map):
+    get_map["one"] = 11
+    del get_map["two"]
+    assert list(get_map) == ["three", "one"]
+    assert list(get_map.values()) == [3, 11]
+    assert list(get_map.items()) == [("three", 3), ("one", 11)]
+
+
+def test_delete_many(get_map):
+    with pytest.raises(KeyError, match="missing"):
+        get_map.delete_many(["one", "missing"])
+    assert len(get_map) == 3
+    get_map.delete_many(["one", "two"])
+    assert list(get_map.items()) == [("three", 3)]
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        pytest.param(1, 1.0, id="int"),
+        pytest.param((1, "a"), [1, 2], id="tuple"),
+        pytest.param(b"bytes", {"a": None}, id="bytes"),
+    ],
+)
+def test_keys_and_values(path, key, value):
+    with DiskMap(path) as mapping:
+        mapping[key] = value
+    with DiskMap(path) as mapping:
+        assert mapping[key] == value
+        # Equal keys are the same key, as in a dict
+        if key == 1:
+            assert mapping[1.0] == value
+
+
+def test_many_items_grow_the_index(path):
+    with DiskMap(path, buffer_size=4096) as mapping:
+        mapping.update((key, str(key)) for key in range(5000))
+        for key in range(0, 5000, 2):
+            del mapping[key]
+    with DiskMap(path) as mapping:
+        assert len(mapping) == 2500
+        assert mapping._capacity > 2500 / 0.7
+        assert all(mapping[key] == str(key) for key in range(1, 5000, 2))
+        assert not any(key in mapping for key in range(0, 5000, 2))
+
+
+def test_reopen_uses_the_saved_index(path, get_map, monkeypatch):
+    get_map.close()
+
+    def rebuild(self):
+        raise AssertionError("the log was scanned")
+
+    monkeypatch.setattr(DiskMap, "_rebuild_index", rebuild)
+    with DiskMap(path) as mapping:
+        assert dict(mapping.items()) == {"one": 1, "two": 2, "three": 3}
+
+
+def test_crash_rebuilds_the_index(path):
+    crashed = DiskMap(path)
+    crashed.update(one=1, two=2)
+    del crashed["one"]
+    crashed.flush()
+    # Left in the buffer when the process dies
+    crashed["three"] = 3
+    with DiskMap(path) as mapping:
+        assert dict(mapping.items()) == {"two": 2}
+        assert mapping.garbage > 0
+
+
+def test_torn_record_is_dropped(path, get_map):
+    get_map.close()
+    size = os.path.getsize(path)
+    with open(path, "ab") as log:
+        log.write(b"\x01\x02\x03 half a record")
+    os.remove(f"{path}.index")
+    with DiskMap(path) as mapping:
+        assert len(mapping) == 3
+        assert os.path.getsize(path) == size
+        mapping["four"] = 4
+    with DiskMap(path) as mapping:
+        assert mapping["four"] == 4
+
+
+def test_compact(path):
+    with DiskMap(path) as mapping:
+        for value in range(100):
+            mapping[value % 10] = value
+        del mapping[0]
+        size = os.path.getsize(path) + len(mapping._buffer)
+        assert mapping.garbage > 0
+        mapping.compact()
+        assert mapping.garbage == 0
+        assert os.path.getsize(path) < size / 5
+        assert dict(mapping.items()) == {key: 90 + key for key in range(1, 10)}
+        mapping[0] = 0
+    with DiskMap(path) as mapping:
+        assert len(mapping) == 10
+        assert mapping[0] == 0
+        assert mapping[9] == 99
+
+
+def test_clear(get_map, path):
+    get_map.clear()
+    assert len(get_map) == 0
+    assert list(get_map) == []
+    get_map["one"] = 1
+    get_map.close()
+    with DiskMap(path) as mapping:
+        assert dict(mapping.items()) == {"one": 1}
+
+
+def test_invalid_log(path):
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError, match="not a DiskMap log"):
+        DiskMap(path)
+
+
+def test_equal_keys(get_map):
+    get_map[(1, "a")] = "tuple"
+    assert (1.0, "a") in get_map
+    get_map[(True, "a")] = "again"
+    assert len(get_map) == 4
+    assert get_map[(1, "a")] == "again"
+
+
+def test_reopen_with_another_hash_seed(path):
+    # str hashes change with PYTHONHASHSEED, the index must not
+    code = (
+        "import sys\n"
+        "from pyadt import DiskMap\n"
+        "with DiskMap(sys.argv[1]) as m:\n"
+        "    key = ('spam', b'eggs', 1)\n"
+        "    if sys.argv[2] == 'write':\n"
+        "        m[key] = m['spam'] = 1\n"
+        "    else:\n"
+        "        m[key] = m['spam'] = 2\n"
+        "        print(len(m), m[key], m['spam'], key in m)\n"
+    )
+    outputs = [
+        subprocess.run(
+            [sys.executable, "-c", code, str(path), action],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed, action in (("1", "write"), ("2", "read"))
+    ]
+    assert outputs[1].split() == ["2", "2", "2", "True"]
@@ -0,0 +1,157 @@
+"""Test filters.py."""
+
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from pyadt import BloomFilter, CuckooFilter
+
+CAPACITY = 2000
+
+
+@pytest.fixture(params=[BloomFilter, CuckooFilter])
+def filter_class(request):
+    return request.param
+
+
+@pytest.mark.parametrize("error_rate", [0.05, 0.01, 0.001])
+def test_error_rate(filter_class, error_rate):
+    approximate = filter_class(CAPACITY, error_rate)
+    approximate.add_many(range(CAPACITY))
+    # No false negatives, and false positives close to error_rate
+    assert all(approximate.contains_many(range(CAPACITY)))
+    trials = 20 * CAPACITY
+    false_positives = sum(
+        approximate.contains_many(range(CAPACITY, CAPACITY + trials))
+    )
+    assert false_positives / trials < 2 * error_rate
+
+
+@pytest.mark.parametrize(
+    "capacity, error_rate",
+    [
+        pytest.param(0, 0.01, id="capacity"),
+        pytest.param(10, 0, id="zero-rate"),
+        pytest.param(10, 1, id="one-rate"),
+    ],
+)
+def test_invalid_parameters(filter_class, capacity, error_rate):
+    with pytest.raises(ValueError):
+        filter_class(capacity, error_rate)
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        pytest.param([], id="empty"),
+        pytest.param(["a", b"b", 3, 4.5, (6, "7"), None], id="mixed"),
+    ],
+)
+def test_serialization(filter_class, items):
+    approximate = filter_class(100, 0.01)
+    approximate.add_many(items)
+    for restored in (
+        filter_class.from_bytes(approximate.to_bytes()),
+        pickle.loads(pickle.dumps(approximate)),
+    ):
+        assert restored == approximate
+        assert all(restored.contains_many(items))
+
+
+def test_invalid_serialization(filter_class):
+    data = filter_class(100).to_bytes()
+    with pytest.raises(ValueError, match="serialization"):
+        filter_class.from_bytes(b"nope" + data[4:])
+    with pytest.raises(EOFError):
+        filter_class.from_bytes(data[:-1])
+
+
+def test_serialization_is_stable_across_processes(filter_class):
+    # str hashes change with PYTHONHASHSEED, the filters must not
+    code = (
+        f"from pyadt import {filter_class.__name__} as cls\n"
+        "f = cls(100)\n"
+        "f.add_many(['spam', ('eggs', 1), frozenset('abcdef')])\n"
+        "print(f.to_bytes().hex())"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+
+
+def test_equal_items_match(filter_class):
+    approximate = filter_class(100)
+    approximate.add_many([(1, "spam"), frozenset("abc")])
+    assert (1.0, "spam") in approximate
+    assert frozenset("cba") in approximate
+
+
+def test_unsupported_item(filter_class):
+    with pytest.raises(TypeError, match="can't hash list objects stably"):
+        filter_class(100).add(["spam"])
+
+
+def test_bloom_union():
+    first, second = BloomFilter(CAPACITY), BloomFilter(CAPACITY)
+    first.add_many(range(0, CAPACITY, 2))
+    second.add_many(range(1, CAPACITY, 2))
+    both = first.union(second)
+    assert all(both.contains_many(range(CAPACITY)))
+    everything = BloomFilter(CAPACITY)
+    everything.add_many(range(CAPACITY))
+    assert both == everything
+
+
+@pytest.mark.parametrize(
+    "other, error",
+    [
+        pytest.param(BloomFilter(CAPACITY, 0.001), ValueError, id="shape"),
+        pytest.param(CuckooFilter(CAPACITY), TypeError, id="type"),
+    ],
+)
+def test_bloom_union_invalid(other, error):
+    with pytest.raises(error):
+        BloomFilter(CAPACITY).union(other)
+
+
+def test_cuckoo_remove():
+    cuckoo = CuckooFilter(CAPACITY)
+    cuckoo.add_many(range(CAPACITY))
+    for item in range(0, CAPACITY, 2):
+        cuckoo.remove(item)
+    assert len(cuckoo) == CAPACITY // 2
+    assert all(cuckoo.contains_many(range(1, CAPACITY, 2)))
+    assert sum(cuckoo.contains_many(range(0, CAPACITY, 2))) < CAPACITY // 20
+    with pytest.raises(KeyError, match="not in filter"):
+        cuckoo.remove("missing")
+
+
+def test_cuckoo_full():
+    cuckoo = CuckooFilter(100)
+    added = []
+    with pytest.raises(OverflowError, match="full"):
+        for item in range(10 * CAPACITY):
+            cuckoo.add(item)
+            added.append(item)
+    # The item that filled it up is kept aside rather than lost
+    assert len(cuckoo) == len(added)
+    assert all(cuckoo.contains_many(added))
+    restored = CuckooFilter.from_bytes(cuckoo.to_bytes())
+    assert all(restored.contains_many(added))
+    # Removing items makes room again
+    half = len(added) // 2
+    for item in added[:half]:
+        cuckoo.remove(item)
+    cuckoo.add("again")
+    assert all(cuckoo.contains_many(added[half:] + ["again"]))
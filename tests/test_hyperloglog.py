@@ -0,0 +1,106 @@
+"""Test hyperloglog.py."""
+
+import pickle
+
+import pytest
+
+from pyadt import Bag, HyperLogLog, Set
+from pyadt.memory import deep_sizeof
+
+
+@pytest.mark.parametrize(
+    "cardinality",
+    [
+        pytest.param(0, id="empty"),
+        pytest.param(100, id="sparse"),
+        pytest.param(20_000, id="dense"),
+    ],
+)
+@pytest.mark.parametrize("precision", [10, 14])
+def test_estimate(cardinality, precision):
+    hll = HyperLogLog(range(cardinality), precision=precision)
+    # Three standard errors
+    assert abs(len(hll) - cardinality) <= max(
+        1, 3 * hll.relative_error * cardinality
+    )
+
+
+def test_sparse_is_nearly_exact():
+    hll = HyperLogLog(str(value) for value in range(3000))
+    assert hll.is_sparse
+    assert abs(len(hll) - 3000) <= 1
+    hll.add_many(range(5000))
+    assert not hll.is_sparse
+
+
+def test_duplicates_are_counted_once():
+    values = [value % 500 for value in range(10_000)]
+    assert len(HyperLogLog(values)) == len(Set(values))
+    assert len(HyperLogLog(values)) == len(Bag(values).as_counter())
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        pytest.param(range(100), range(50, 150), id="sparse"),
+        pytest.param(range(100), range(50, 20_000), id="mixed"),
+        pytest.param(range(20_000), range(10_000, 30_000), id="dense"),
+    ],
+)
+def test_union_and_intersection(first, second):
+    a, b = HyperLogLog(first), HyperLogLog(second)
+    union, intersection = set(first) | set(second), set(first) & set(second)
+    merged = a.union(b)
+    assert merged == HyperLogLog(union)
+    assert abs(len(merged) - len(union)) <= max(
+        1, 3 * merged.relative_error * len(union)
+    )
+    assert abs(a.intersection_count(b) - len(intersection)) <= max(
+        2, 3 * merged.relative_error * len(union)
+    )
+
+
+@pytest.mark.parametrize(
+    "other, error",
+    [
+        pytest.param(HyperLogLog(precision=10), ValueError, id="precision"),
+        pytest.param(set(), TypeError, id="type"),
+    ],
+)
+def test_union_invalid(other, error):
+    with pytest.raises(error):
+        HyperLogLog().union(other)
+
+
+@pytest.mark.parametrize("precision", [3, 17])
+def test_invalid_precision(precision):
+    with pytest.raises(ValueError, match="precision"):
+        HyperLogLog(precision=precision)
+
+
+@pytest.mark.parametrize("cardinality", [0, 100, 20_000])
+def test_serialization(cardinality):
+    hll = HyperLogLog(range(cardinality))
+    for restored in (
+        HyperLogLog.from_bytes(hll.to_bytes()),
+        pickle.loads(pickle.dumps(hll)),
+    ):
+        assert restored == hll
+        assert restored.is_sparse == hll.is_sparse
+        assert len(restored) == len(hll)
+
+
+def test_invalid_serialization():
+    data = HyperLogLog(range(20_000)).to_bytes()
+    with pytest.raises(ValueError, match="serialization"):
+        HyperLogLog.from_bytes(b"nope" + data[4:])
+    with pytest.raises(EOFError):
+        HyperLogLog.from_bytes(data[:-1])
+
+
+def test_memory_is_bounded():
+    hll = HyperLogLog(range(50_000), precision=12)
+    size = deep_sizeof(hll)
+    assert size < 2 * 2**12
+    hll.add_many(range(50_000, 100_000))
+    assert deep_sizeof(hll) == size
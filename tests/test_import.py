@@ -0,0 +1,67 @@
+"""Test the lazy imports of pyadt/__init__.py."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pyadt
+
+# Budget in microseconds for "from pyadt import Stack", on top of what the
+# interpreter imports at startup. It's generous, so that slow CI machines
+# don't fail, but importing every ADT eagerly takes several times longer
+IMPORT_BUDGET_US = 60_000
+
+
+def _run(code, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _import_times(code):
+    # Map module names to their own import time in microseconds
+    times = {}
+    for line in _run(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(own)
+    return times
+
+
+@pytest.mark.parametrize("name", pyadt.__all__)
+def test_exports(name):
+    value = getattr(pyadt, name)
+    assert name in dir(pyadt)
+    assert vars(pyadt)[name] is value
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        pyadt.Nope
+
+
+def test_import_loads_only_what_is_used():
+    output = _run(
+        "import sys\n"
+        "from pyadt import Stack\n"
+        "print(*sorted(sys.modules))"
+    ).stdout.split()
+    assert [name for name in output if name.startswith("pyadt")] == [
+        "pyadt",
+        "pyadt.stack",
+        "pyadt.utils",
+    ]
+    for heavy in ("ctypes", "random", "multiprocessing", "threading"):
+        assert heavy not in output
+
+
+def test_import_time_budget():
+    startup = _import_times("pass")
+    times = _import_times("from pyadt import Stack")
+    spent = sum(own for name, own in times.items() if name not in startup)
+    assert spent < IMPORT_BUDGET_US, f"{spent} us"
@@ -0,0 +1,166 @@
+"""Test indexedmap.py."""
+
+from random import Random
+
+import pytest
+
+from pyadt import IndexedMap, Map
+
+
+def _user(session):
+    return session["user"]
+
+
+def _started(session):
+    return session["started"]
+
+
+@pytest.fixture
+def get_map():
+    sessions = IndexedMap(
+        s1={"user": "ana", "started": 9},
+        s2={"user": "bob", "started": 10},
+        s3={"user": "ana", "started": 12},
+    )
+    sessions.add_index("user", _user)
+    sessions.add_index("started", _started, sorted=True)
+    return sessions
+
+
+def _keys(mapping):
+    return list(mapping)
+
+
+def test_find_by(get_map):
+    assert _keys(get_map.find_by("user", "ana")) == ["s1", "s3"]
+    assert _keys(get_map.find_by("started", 10)) == ["s2"]
+    assert get_map.find_by("user", "eve") == Map()
+    assert isinstance(get_map.find_by("user", "ana"), Map)
+
+
+@pytest.mark.parametrize(
+    "low, high, expected",
+    [
+        pytest.param(10, 12, ["s2"], id="closed"),
+        pytest.param(None, 12, ["s1", "s2"], id="open-low"),
+        pytest.param(10, None, ["s2", "s3"], id="open-high"),
+        pytest.param(None, None, ["s1", "s2", "s3"], id="open"),
+        pytest.param(13, 20, [], id="empty"),
+    ],
+)
+def test_find_range(get_map, low, high, expected):
+    assert _keys(get_map.find_range("started", low, high)) == expected
+
+
+def test_find_range_needs_sorted_index(get_map):
+    with pytest.raises(ValueError, match="user index isn't sorted"):
+        get_map.find_range("user", "a", "b")
+
+
+def test_unknown_index(get_map):
+    with pytest.raises(KeyError, match="email"):
+        get_map.find_by("email", "ana@example.com")
+    with pytest.raises(KeyError, match="email"):
+        get_map.find_range("email")
+    with pytest.raises(KeyError, match="email"):
+        get_map.drop_index("email")
+
+
+def test_add_and_drop_index(get_map):
+    with pytest.raises(ValueError, match="user index already exists"):
+        get_map.add_index("user", _started)
+    get_map.drop_index("user")
+    get_map.add_index("user", _user)
+    assert _keys(get_map.find_by("user", "bob")) == ["s2"]
+
+
+def test_setitem_moves_bucket(get_map):
+    get_map["s1"] = {"user": "bob", "started": 15}
+    assert _keys(get_map.find_by("user", "ana")) == ["s3"]
+    assert _keys(get_map.find_by("user", "bob")) == ["s2", "s1"]
+    assert _keys(get_map.find_range("started", 12)) == ["s3", "s1"]
+    assert get_map.find_by("started", 9) == Map()
+
+
+def test_setitem_same_bucket_keeps_order(get_map):
+    get_map["s1"] = {"user": "ana", "started": 9, "page": 2}
+    found = get_map.find_by("user", "ana")
+    assert _keys(found) == ["s1", "s3"]
+    assert found["s1"]["page"] == 2
+
+
+def test_update_and_set_many(get_map):
+    get_map.update(
+        {"s4": {"user": "eve", "started": 1}},
+        s2={"user": "ana", "started": 10},
+    )
+    assert _keys(get_map.find_by("user", "ana")) == ["s1", "s3", "s2"]
+    assert _keys(get_map.find_range("started", high=10)) == ["s4", "s1"]
+    get_map.set_many([("s4", {"user": "bob", "started": 30})])
+    assert _keys(get_map.find_by("user", "bob")) == ["s4"]
+
+
+def test_removals(get_map):
+    del get_map["s1"]
+    assert get_map.pop("s2")["user"] == "bob"
+    assert _keys(get_map.find_by("user", "ana")) == ["s3"]
+    assert get_map.find_by("user", "bob") == Map()
+    assert get_map.popitem()[0] == "s3"
+    assert get_map.find_range("started") == Map()
+    with pytest.raises(KeyError, match="s1"):
+        get_map.pop("s1")
+
+
+def test_delete_many(get_map):
+    with pytest.raises(KeyError, match="s9"):
+        get_map.delete_many(["s1", "s9"])
+    assert _keys(get_map.find_by("user", "ana")) == ["s1", "s3"]
+    get_map.delete_many(["s1", "s2"])
+    assert _keys(get_map.find_range("started")) == ["s3"]
+
+
+def test_clear(get_map):
+    get_map.clear()
+    assert get_map.find_by("user", "ana") == Map()
+    get_map["s5"] = {"user": "ana", "started": 5}
+    assert _keys(get_map.find_by("user", "ana")) == ["s5"]
+
+
+def test_merge_keeps_indexes(get_map):
+    merged = get_map.merge({"s4": {"user": "ana", "started": 1}})
+    assert isinstance(merged, IndexedMap)
+    assert _keys(merged.find_by("user", "ana")) == ["s1", "s3", "s4"]
+    assert _keys(get_map.find_by("user", "ana")) == ["s1", "s3"]
+
+
+def test_failing_function_changes_nothing(get_map):
+    with pytest.raises(KeyError, match="user"):
+        get_map["s4"] = {"started": 4}
+    with pytest.raises(KeyError, match="user"):
+        get_map["s1"] = {"started": 4}
+    assert len(get_map) == 3
+    assert _keys(get_map.find_range("started")) == ["s1", "s2", "s3"]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_operations(seed):
+    random = Random(seed)
+    mapping = IndexedMap()
+    mapping.add_index("mod", lambda value: value % 7)
+    mapping.add_index("value", lambda value: value, sorted=True)
+    reference = {}
+    for _ in range(1000):
+        key, value = random.randrange(50), random.randrange(100)
+        if random.random() < 0.7:
+            mapping[key] = reference[key] = value
+        elif key in reference:
+            del reference[key]
+            mapping.pop(key)
+    for mod in range(7):
+        expected = {k for k, v in reference.items() if v % 7 == mod}
+        assert set(mapping.find_by("mod", mod)) == expected
+    low, high = 20, 60
+    found = mapping.find_range("value", low, high)
+    expected = {k: v for k, v in reference.items() if low <= v < high}
+    assert dict(found.items()) == expected
+    assert list(found.values()) == sorted(expected.values())
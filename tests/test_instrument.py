@@ -0,0 +1,92 @@
+"""Test instrument.py."""
+
+import pytest
+
+from pyadt import AggregateStack, Map, Matrix, Set, Stack, instrument
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_by_default():
+    assert not instrument.is_enabled()
+    Map(one=1)["two"] = 2
+    assert instrument.snapshot() == {}
+
+
+def test_disable_restores_originals():
+    setitem, add, push = Map.__setitem__, Set.add, AggregateStack.push
+    instrument.enable()
+    assert instrument.is_enabled()
+    assert Map.__setitem__ is not setitem
+    instrument.disable()
+    assert not instrument.is_enabled()
+    assert Map.__setitem__ is setitem
+    assert Set.add is add
+    assert AggregateStack.push is push
+    assert "top" not in AggregateStack.__dict__
+
+
+def test_counts_calls_and_sizes():
+    with instrument.instrumented(Map, Set):
+        m = Map()
+        for i in range(5):
+            m[i] = i
+        del m[0]
+        s = Set([1, 2, 3])
+        s.add(4)
+    stats = instrument.snapshot()
+    assert stats["Map"]["methods"]["__setitem__"]["calls"] == 5
+    assert stats["Map"]["methods"]["__delitem__"]["calls"] == 1
+    assert stats["Map"]["methods"]["__setitem__"]["seconds"] > 0
+    assert stats["Map"]["max_size"] == 5
+    assert stats["Set"]["methods"]["add"]["calls"] == 1
+    assert stats["Set"]["max_size"] == 4
+
+
+def test_unsized_class():
+    with instrument.instrumented(Matrix):
+        Matrix(2, 2, 1) * Matrix(2, 2, 1)
+    stats = instrument.snapshot()["Matrix"]
+    assert stats["methods"]["__mul__"]["calls"] == 1
+    assert stats["max_size"] == 0
+
+
+def test_super_calls_counted_once():
+    with instrument.instrumented(Stack, AggregateStack):
+        s = AggregateStack()
+        s.push(1)
+        s.push(2)
+        s.pop()
+        Stack().push(1)
+    stats = instrument.snapshot()
+    assert stats["AggregateStack"]["methods"]["push"]["calls"] == 2
+    assert stats["AggregateStack"]["methods"]["pop"]["calls"] == 1
+    assert stats["Stack"]["methods"]["push"]["calls"] == 1
+
+
+def test_enable_twice():
+    instrument.enable(Map)
+    instrument.enable(Map)
+    Map()["one"] = 1
+    assert instrument.snapshot()["Map"]["methods"]["__setitem__"]["calls"] == 1
+
+
+def test_reset():
+    with instrument.instrumented(Set):
+        Set().add(1)
+    instrument.reset()
+    assert instrument.snapshot() == {}
+
+
+def test_to_prometheus():
+    with instrument.instrumented(Set):
+        Set().add(1)
+    text = instrument.to_prometheus()
+    assert "# TYPE pyadt_calls_total counter" in text
+    assert 'pyadt_calls_total{class="Set",method="add"} 1' in text
+    assert 'pyadt_size_max{class="Set"} 1' in text
@@ -0,0 +1,174 @@
+"""Test intset.py."""
+
+import pickle
+from random import Random
+
+import pytest
+
+from pyadt import IntSet, Set
+from pyadt.intset import ARRAY_MAX, CHUNK_SIZE
+from pyadt.memory import deep_sizeof
+
+
+def _random_set(random):
+    kind = random.randrange(3)
+    if kind == 0:  # Sparse, array containers
+        return set(random.sample(range(5 * CHUNK_SIZE), random.randrange(300)))
+    if kind == 1:  # Dense, bitmap containers
+        start = random.randrange(CHUNK_SIZE)
+        return set(range(start, start + random.randrange(2 * CHUNK_SIZE)))
+    # Around the array to bitmap threshold
+    return set(random.sample(range(CHUNK_SIZE), ARRAY_MAX + 1))
+
+
+def _random_pairs(count=12):
+    random = Random(count)
+    for _ in range(count):
+        yield _random_set(random), _random_set(random)
+
+
+@pytest.fixture
+def mock_intset():
+    return IntSet([1, 2, 3, CHUNK_SIZE + 1])
+
+
+@pytest.mark.parametrize(
+    "method, operation",
+    [
+        pytest.param("union", set.union, id="union"),
+        pytest.param("intersection", set.intersection, id="intersection"),
+        pytest.param("difference", set.difference, id="difference"),
+        pytest.param(
+            "symmetric_difference",
+            set.symmetric_difference,
+            id="symmetric_difference",
+        ),
+        pytest.param("is_subset", set.issubset, id="is_subset"),
+        pytest.param("is_superset", set.issuperset, id="is_superset"),
+        pytest.param("is_disjoint", set.isdisjoint, id="is_disjoint"),
+    ],
+)
+def test_set_operations(method, operation):
+    for first, second in _random_pairs():
+        result = getattr(IntSet(first), method)(IntSet(second))
+        expected = operation(first, second)
+        if isinstance(expected, set):
+            assert result == IntSet(expected)
+            assert list(result) == sorted(expected)
+        else:
+            assert result == expected
+
+
+def test_array_operations_skip_bitmaps(monkeypatch):
+    def bitmap(container):
+        raise AssertionError("array converted to a bitmap")
+
+    monkeypatch.setattr("pyadt.intset._bitmap", bitmap)
+    first = IntSet(range(0, 3 * CHUNK_SIZE, 70))
+    second = IntSet(range(0, 3 * CHUNK_SIZE, 105))
+    assert list(first.union(second)) == sorted({*first, *second})
+    assert list(first.intersection(second)) == list(
+        range(0, 3 * CHUNK_SIZE, 210)
+    )
+    assert list(first.difference(second)) == sorted({*first} - {*second})
+    assert IntSet(range(0, 3 * CHUNK_SIZE, 210)).is_subset(first)
+
+
+def test_set_operations_validate_other(mock_intset):
+    with pytest.raises(TypeError, match="IntSet object expected"):
+        mock_intset.union(Set([1]))
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_add_and_discard_across_threshold(seed):
+    random = Random(seed)
+    elements, reference = IntSet(), set()
+    for _ in range(3 * ARRAY_MAX):
+        value = random.randrange(2 * ARRAY_MAX)
+        if random.random() < 0.7:
+            elements.add(value)
+            reference.add(value)
+        else:
+            elements.discard(value)
+            reference.discard(value)
+    assert list(elements) == sorted(reference)
+    # Built one by one or in bulk, the containers end up the same
+    assert elements == IntSet(reference)
+    assert [elements.pop() for _ in range(len(reference))] == sorted(
+        reference, reverse=True
+    )
+    assert not elements
+
+
+def test_remove(mock_intset):
+    mock_intset.remove(CHUNK_SIZE + 1)
+    assert list(mock_intset) == [1, 2, 3]
+    for value in (CHUNK_SIZE + 1, 42, -1, "a"):
+        with pytest.raises(KeyError, match="not in set"):
+            mock_intset.remove(value)
+
+
+@pytest.mark.parametrize(
+    "value, error",
+    [
+        pytest.param(-1, ValueError, id="negative"),
+        pytest.param(2**64, ValueError, id="too-large"),
+        pytest.param(1.0, TypeError, id="float"),
+    ],
+)
+def test_invalid_values(value, error):
+    with pytest.raises(error):
+        IntSet([value])
+    with pytest.raises(error):
+        IntSet().add(value)
+    assert value not in IntSet([0, 1])
+
+
+def test_membership(mock_intset):
+    assert all(value in mock_intset for value in (1, 2, 3, CHUNK_SIZE + 1))
+    assert 4 not in mock_intset
+    assert 2**63 not in mock_intset
+    assert len(mock_intset) == 4
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param([], id="empty"),
+        pytest.param([0, 2**64 - 1], id="extremes"),
+        pytest.param(range(0, 3 * CHUNK_SIZE, 7), id="mixed"),
+    ],
+)
+def test_serialization(values):
+    elements = IntSet(values)
+    assert IntSet.from_bytes(elements.to_bytes()) == elements
+    assert pickle.loads(pickle.dumps(elements)) == elements
+
+
+def test_serialization_is_compact():
+    dense = IntSet(range(CHUNK_SIZE))
+    assert len(dense.to_bytes()) < CHUNK_SIZE // 8 + 32
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        pytest.param(b"nope", ValueError, id="magic"),
+        pytest.param(IntSet([1, 2]).to_bytes()[:-1], EOFError, id="cut"),
+        pytest.param(
+            IntSet(range(ARRAY_MAX + 1)).to_bytes()[:-1],
+            EOFError,
+            id="cut-bitmap",
+        ),
+    ],
+)
+def test_invalid_serialization(data, error):
+    with pytest.raises(error):
+        IntSet.from_bytes(data)
+
+
+def test_memory_of_dense_ranges():
+    values = list(range(100_000))
+    elements = Set()
+    elements._data = values
+    assert deep_sizeof(IntSet(values)) * 10 < deep_sizeof(elements)
@@ -3,6 +3,7 @@
 import pytest
 
 from pyadt import LinkedList
+from pyadt.dllist import DoublyLinkedList
 
 
 @pytest.fixture
@@ -17,6 +18,8 @@ def mock_llist():
         pytest.param((2, 4, 5, 6), 4),  # Tuple
         pytest.param({2, 4, 5, 6}, 4),  # Set
         pytest.param("hello", 5),  # String
+        pytest.param(iter([]), 0),  # Empty iterator
+        pytest.param((i for i in range(3)), 3),  # Generator
     ],
 )
 def test_build(iterable, expected):
@@ -24,6 +27,21 @@ def test_build(iterable, expected):
     assert len(b) == expected
 
 
+def test_build_from_generator():
+    ll = LinkedList(i * 2 for i in range(3))
+    assert [node.data for node in ll] == [0, 2, 4]
+    dll = DoublyLinkedList(i * 2 for i in range(3))
+    assert [node.data for node in dll] == [0, 2, 4]
+    assert [node.data for node in reversed(dll)] == [4, 2, 0]
+
+
+@pytest.mark.parametrize("cls", [LinkedList, DoublyLinkedList])
+def test_from_iterable(cls):
+    llist = cls.from_iterable(iter([[1, 2], [], [3]]))
+    assert [node.data for node in llist] == [1, 2, 3]
+    assert len(llist) == 3
+
+
 def test_append_left(mock_llist):
     assert len(mock_llist) == 3
     for i in range(10):
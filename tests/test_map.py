@@ -13,6 +13,8 @@ from pyadt import Map
         pytest.param({}, 0),  # Empty dict
         pytest.param({"one": 1, "two": 2}, 2),  # dict
         pytest.param(OrderedDict({"one": 1, "two": 2}), 2),
+        pytest.param([("one", 1), ("two", 2), ("one", 11)], 2),  # Pairs
+        pytest.param(((i, i) for i in range(3)), 3),  # Generator of pairs
     ],
 )
 def test_build(iterable, expected):
@@ -106,3 +108,90 @@ def test_del(mock_map):
 
 def test_reverse_iteration(mock_map):
     assert list(reversed(mock_map)) == ["three", "two", "one"]
+
+
+def test_fromkeys_generator():
+    m = Map.fromkeys(key for key in ["one", "two"])
+    assert list(m.keys()) == ["one", "two"]
+
+
+def test_from_iterable():
+    chunks = ([(i, i * 10)] for i in range(3))
+    assert list(Map.from_iterable(chunks).items()) == [
+        (0, 0),
+        (1, 10),
+        (2, 20),
+    ]
+
+
+def test_get_many(mock_map):
+    assert mock_map.get_many(["three", "one", "one"]) == [3, 1, 1]
+    assert mock_map.get_many([]) == []
+    with pytest.raises(KeyError, match="missing"):
+        mock_map.get_many(["one", "missing"])
+
+
+def test_set_many(mock_map):
+    mock_map.set_many(iter([("four", 4), ("one", 11), ("four", 44)]))
+    assert list(mock_map.items()) == [
+        ("one", 11),
+        ("two", 2),
+        ("three", 3),
+        ("four", 44),
+    ]
+    mock_map.set_many({"five": 5})
+    assert mock_map["five"] == 5
+    with pytest.raises(TypeError):
+        mock_map.set_many([([1], 1)])
+
+
+def test_delete_many(mock_map):
+    mock_map.delete_many(iter(["three", "one"]))
+    assert list(mock_map.items()) == [("two", 2)]
+    # Nothing is removed if a key is missing, or repeated
+    for keys in (["two", "missing"], ["two", "two"]):
+        with pytest.raises(KeyError):
+            mock_map.delete_many(keys)
+        assert list(mock_map.items()) == [("two", 2)]
+
+
+@pytest.mark.parametrize(
+    "resolver, expected",
+    [
+        pytest.param(
+            None, {"one": 1, "two": 20, "three": 3, "four": 4}, id="none"
+        ),
+        pytest.param(
+            max, {"one": 1, "two": 20, "three": 3, "four": 4}, id="max"
+        ),
+        pytest.param(
+            min, {"one": 1, "two": 2, "three": 3, "four": 4}, id="min"
+        ),
+        pytest.param(
+            lambda mine, theirs: [mine, theirs],
+            {"one": 1, "two": [2, 20], "three": 3, "four": 4},
+            id="pair",
+        ),
+    ],
+)
+def test_merge(mock_map, resolver, expected):
+    merged = mock_map.merge([("two", 20), ("four", 4)], resolver)
+    assert dict(merged.items()) == expected
+    assert list(merged) == ["one", "two", "three", "four"]
+    # The original map doesn't change
+    assert list(mock_map.items()) == [("one", 1), ("two", 2), ("three", 3)]
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        pytest.param(Map(three=3, two=2, one=1), True, id="order"),
+        pytest.param(Map(one=1, two=2), False, id="length"),
+        pytest.param(Map(one=1, two=2, four=3), False, id="key"),
+        pytest.param(Map(one=1, two=2, three=[3]), False, id="value"),
+    ],
+)
+def test_eq(mock_map, other, expected):
+    assert (mock_map == other) == expected
+    with pytest.raises(TypeError):
+        mock_map == {"one": 1}
@@ -85,3 +85,21 @@ def test_multiply():
 def test_from_list_of_lists():
     m = Matrix.from_list_of_lists([[1, 2], [3, 4], [5, 6]])
     assert m.size == (3, 2)
+
+
+def test_from_list_of_lists_iterables():
+    m = Matrix.from_list_of_lists(range(i, i + 3) for i in range(2))
+    assert m.size == (2, 3)
+    assert m[1, 2] == 3
+
+
+def test_from_list_of_lists_invalid_size():
+    with pytest.raises(ValueError, match="invalid matrix size"):
+        Matrix.from_list_of_lists([[1, 2], [3]])
+
+
+def test_from_iterable():
+    chunks = iter([[[1, 2], [3, 4]], [[5, 6]]])
+    m = Matrix.from_iterable(chunks)
+    assert m.size == (3, 2)
+    assert m[2, 1] == 6
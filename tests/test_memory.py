@@ -0,0 +1,76 @@
+"""Test memory.py."""
+
+import sys
+
+import pytest
+
+from pyadt import LinkedList, PersistentStack, Set
+from pyadt.dllist import DoublyLinkedList
+from pyadt.memory import compare, deep_sizeof, main, measure
+
+
+@pytest.fixture
+def items():
+    return list(range(2**32, 2**32 + 100))
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    item = 2**40
+    assert deep_sizeof([item, item]) == sys.getsizeof(
+        [item, item]
+    ) + sys.getsizeof(item)
+
+
+def test_deep_sizeof_exclude(items):
+    elements = Set(items)
+    overhead = deep_sizeof(elements, items)
+    assert overhead == deep_sizeof(elements) - sum(map(sys.getsizeof, items))
+    assert overhead == (
+        sys.getsizeof(elements)
+        + sys.getsizeof(elements.__dict__)
+        + sum(map(sys.getsizeof, elements.__dict__))
+        + sys.getsizeof(elements._data)
+    )
+
+
+def test_deep_sizeof_cycles(items):
+    # Doubly linked nodes reference each other both ways
+    dll = DoublyLinkedList(items)
+    assert deep_sizeof(dll, items) > len(items) * sys.getsizeof(dll.head)
+
+
+def test_deep_sizeof_slots(items):
+    stack = PersistentStack(items)
+    node_size = sys.getsizeof(stack._top)
+    assert deep_sizeof(stack, items) == (
+        sys.getsizeof(stack)
+        + sys.getsizeof(stack._length)
+        + node_size * len(items)
+    )
+
+
+def test_deep_sizeof_deep_structures():
+    llist = LinkedList(list(range(sys.getrecursionlimit() * 2)))
+    assert deep_sizeof(llist) > 0
+
+
+def test_measure(items):
+    footprint = measure(lambda: LinkedList(items), items)
+    assert footprint.name == "LinkedList"
+    assert footprint.length == len(items)
+    assert footprint.allocations >= len(items)
+    assert footprint.allocated > 0
+    assert footprint.per_element == footprint.size / len(items)
+
+
+def test_compare():
+    footprints = {footprint.name: footprint for footprint in compare(16)}
+    assert footprints["list"].size < footprints["LinkedList"].size
+    assert all(footprint.length == 16 for footprint in footprints.values())
+
+
+def test_cli(capsys):
+    assert main(["-n", "16"]) == 0
+    output = capsys.readouterr().out
+    assert "bytes/elem" in output
+    assert "DoublyLinkedList" in output
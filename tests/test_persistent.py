@@ -0,0 +1,103 @@
+"""Test persistent.py."""
+
+import pytest
+
+from pyadt import LinkedList, PersistentLinkedList, PersistentStack, Stack
+
+
+@pytest.fixture
+def mock_stack():
+    return PersistentStack("hello")
+
+
+@pytest.fixture
+def mock_llist():
+    return PersistentLinkedList([1, 2, 3])
+
+
+@pytest.mark.parametrize(
+    "iterable, expected",
+    [
+        pytest.param([2, 4, 5, 6], 4),  # List
+        pytest.param((2, 4, 5, 6), 4),  # Tuple
+        pytest.param({2, 4, 5, 6}, 4),  # Set
+        pytest.param("hello", 5),  # String
+    ],
+)
+def test_build(iterable, expected):
+    assert len(PersistentStack(iterable)) == expected
+    assert len(PersistentLinkedList(iterable)) == expected
+
+
+def test_stack_read_api_matches_stack(mock_stack):
+    s = Stack("hello")
+    assert list(mock_stack) == list(s)
+    assert list(reversed(mock_stack)) == list(reversed(s))
+    assert mock_stack.top() == s.top()
+    assert ("h" in mock_stack) == ("h" in s)
+    assert ("a" in mock_stack) == ("a" in s)
+    assert repr(mock_stack) == "Persistent" + repr(s)
+
+
+def test_stack_versions(mock_stack):
+    versions = [mock_stack]
+    for char in "world":
+        versions.append(versions[-1].push(char))
+    assert list(versions[0]) == list("hello")
+    assert list(versions[-1]) == list("helloworld")
+    assert [len(v) for v in versions] == list(range(5, 11))
+    popped = versions[-1].pop()
+    assert list(popped) == list(versions[-2])
+    assert popped._top is versions[-2]._top
+
+
+def test_stack_pop_empty():
+    s = PersistentStack()
+    assert s.is_empty()
+    with pytest.raises(IndexError):
+        s.pop()
+    with pytest.raises(IndexError):
+        s.top()
+
+
+def test_llist_read_api_matches_llist(mock_llist):
+    ll = LinkedList([1, 2, 3])
+    assert [node.data for node in mock_llist] == [node.data for node in ll]
+    assert mock_llist.head.data == ll.head.data
+    assert str(mock_llist) == str(ll)
+    assert str(PersistentLinkedList()) == str(LinkedList())
+
+
+def test_llist_append_left_shares(mock_llist):
+    new = mock_llist.append_left(0)
+    assert new.head.next is mock_llist.head
+    assert len(new) == 4
+    assert len(mock_llist) == 3
+
+
+def test_llist_append(mock_llist):
+    new = mock_llist.append(4)
+    assert [node.data for node in new] == [1, 2, 3, 4]
+    assert [node.data for node in mock_llist] == [1, 2, 3]
+
+
+def test_llist_insert_shares_suffix(mock_llist):
+    new = mock_llist.insert(1, 100)
+    assert [node.data for node in new] == [1, 100, 2, 3]
+    assert new.head.next.next is mock_llist.head.next
+    with pytest.raises(IndexError, match="index out of range"):
+        mock_llist.insert(5, 100)
+
+
+def test_llist_remove_shares_suffix(mock_llist):
+    new = mock_llist.remove(2)
+    assert [node.data for node in new] == [1, 3]
+    assert new.head.next is mock_llist.head.next.next
+    assert len(new) == 2
+    with pytest.raises(IndexError, match="100 doesn't exist"):
+        mock_llist.remove(100)
+
+
+def test_llist_reverse(mock_llist):
+    assert [node.data for node in mock_llist.reverse()] == [3, 2, 1]
+    assert mock_llist.head.data == 1
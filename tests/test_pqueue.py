@@ -0,0 +1,125 @@
+"""Test pqueue.py."""
+
+from random import Random
+
+import pytest
+
+from pyadt import IndexedPriorityQueue, PriorityQueue
+
+
+@pytest.fixture
+def mock_pqueue():
+    return PriorityQueue([("c", 3), ("a", 1), ("b", 2)])
+
+
+def _random_priorities(seed, size=500):
+    random = Random(seed)
+    return [random.randint(0, 50) for _ in range(size)]
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_heapify(arity):
+    priorities = _random_priorities(arity)
+    pq = PriorityQueue(enumerate(priorities), arity=arity)
+    dequeued = [pq.dequeue() for _ in range(len(pq))]
+    assert dequeued == sorted(range(500), key=priorities.__getitem__)
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_enqueue_dequeue(arity):
+    priorities = _random_priorities(arity)
+    pq = PriorityQueue(arity=arity)
+    for item, priority in enumerate(priorities):
+        pq.enqueue(item, priority)
+    dequeued = [pq.dequeue() for _ in range(len(pq))]
+    assert dequeued == sorted(range(500), key=priorities.__getitem__)
+
+
+def test_invalid_arity():
+    with pytest.raises(ValueError):
+        PriorityQueue(arity=1)
+
+
+def test_stable_ties():
+    pq = PriorityQueue()
+    for item in "hello":
+        pq.enqueue(item, 0)
+    assert [pq.dequeue() for _ in range(5)] == list("hello")
+
+
+def test_unorderable_items():
+    pq = PriorityQueue([({"a": 1}, 1), ({"b": 2}, 1)])
+    assert pq.dequeue() == {"a": 1}
+
+
+def test_dequeue_empty():
+    with pytest.raises(IndexError):
+        PriorityQueue().dequeue()
+
+
+def test_front(mock_pqueue):
+    assert mock_pqueue.front() == "a"
+    assert len(mock_pqueue) == 3
+
+
+def test_front_empty():
+    with pytest.raises(IndexError):
+        PriorityQueue().front()
+
+
+def test_is_empty(mock_pqueue):
+    assert not mock_pqueue.is_empty()
+    assert PriorityQueue().is_empty()
+
+
+def test_iteration(mock_pqueue):
+    assert list(mock_pqueue) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize(
+    "item, expected", [pytest.param("a", True), pytest.param("z", False)]
+)
+def test_contains(item, expected, mock_pqueue):
+    assert (item in mock_pqueue) == expected
+
+
+def test_repr(mock_pqueue):
+    assert repr(mock_pqueue) == "PriorityQueue([('a', 1), ('b', 2), ('c', 3)])"
+
+
+def test_indexed_update_priority():
+    pq = IndexedPriorityQueue()
+    handles = [pq.enqueue(item, 10) for item in "abcde"]
+    pq.update_priority(handles[3], 1)
+    pq.update_priority(handles[0], 20)
+    assert pq.priority(handles[3]) == 1
+    assert [pq.dequeue() for _ in range(5)] == ["d", "b", "c", "e", "a"]
+
+
+def test_indexed_remove():
+    priorities = _random_priorities(42)
+    pq = IndexedPriorityQueue(enumerate(priorities), arity=3)
+    removed = set(range(0, 500, 7))
+    for handle in removed:
+        assert pq.remove(handle) == handle
+    dequeued = [pq.dequeue() for _ in range(len(pq))]
+    expected = [
+        item
+        for item in sorted(range(500), key=priorities.__getitem__)
+        if item not in removed
+    ]
+    assert dequeued == expected
+
+
+def test_indexed_invalid_handle():
+    pq = IndexedPriorityQueue([("a", 1)])
+    pq.dequeue()
+    with pytest.raises(KeyError, match="invalid handle: 0"):
+        pq.remove(0)
+    with pytest.raises(KeyError):
+        pq.update_priority(0, 1)
+
+
+def test_indexed_handles():
+    pq = IndexedPriorityQueue([("a", 3), ("b", 1), ("c", 2)])
+    assert list(pq.handles()) == [1, 2, 0]
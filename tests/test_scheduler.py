@@ -0,0 +1,98 @@
+"""Test scheduler.py."""
+
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from pyadt import WorkStealingPool
+
+
+def tree_sum(pool, low, high, cutoff=64):
+    if high - low <= cutoff:
+        return sum(range(low, high))
+    middle = (low + high) // 2
+    left = pool.spawn(tree_sum, pool, low, middle, cutoff)
+    right = tree_sum(pool, middle, high, cutoff)
+    return left.join() + right
+
+
+@pytest.fixture
+def pool():
+    with WorkStealingPool(4) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_invalid_workers(workers):
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        WorkStealingPool(workers)
+
+
+def test_build():
+    with WorkStealingPool(2) as pool:
+        assert pool.workers == 2
+
+
+def test_run(pool):
+    assert pool.run(pow, 2, 10) == 1024
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_fork_join(workers):
+    with WorkStealingPool(workers) as pool:
+        assert pool.run(tree_sum, pool, 0, 10_000) == sum(range(10_000))
+
+
+def test_many_external_tasks(pool):
+    tasks = [pool.spawn(pow, i, 2) for i in range(200)]
+    assert [task.join() for task in tasks] == [i**2 for i in range(200)]
+    assert all(task.done() for task in tasks)
+
+
+def test_repr(pool):
+    task = pool.spawn(pow, 2, 3)
+    task.join()
+    assert repr(task) == "Task(pow, done)"
+    task = pool.spawn(partial(pow, 2), 3)
+    assert task.join() == 8
+    assert repr(task).startswith("Task(functools.partial(<built-in")
+    assert repr(task).endswith(", done)")
+
+
+def test_exception_propagates(pool):
+    task = pool.spawn(divmod, 1, 0)
+    with pytest.raises(ZeroDivisionError):
+        task.join()
+
+
+def test_spawn_closed_pool():
+    pool = WorkStealingPool(1)
+    pool.close()
+    with pytest.raises(RuntimeError, match="spawn on a closed pool"):
+        pool.spawn(print)
+
+
+def test_close_cancels_pending_tasks():
+    pool = WorkStealingPool(1)
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    running = pool.spawn(block)
+    started.wait()
+    pending = [pool.spawn(pow, 2, i) for i in range(3)]
+    closer = threading.Thread(target=pool.close)
+    closer.start()
+    while not pool._shutdown:
+        time.sleep(0.001)
+    release.set()
+    closer.join()
+    assert running.join() is None
+    for task in pending:
+        assert task.done()
+        with pytest.raises(RuntimeError, match="pool closed"):
+            task.join()
@@ -0,0 +1,169 @@
+"""Test serialize.py."""
+
+import copy
+import io
+import pickle
+
+import pytest
+
+from pyadt import Array, Bag, Map, Matrix, Set, serialize
+from pyadt.serialize import dump, dumps, load, loads
+
+
+class CountingFile(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.largest_write = 0
+
+    def write(self, data):
+        self.largest_write = max(self.largest_write, len(data))
+        return super().write(data)
+
+
+class LabeledMap(Map):
+    pass
+
+
+def _array(*values):
+    array = Array(len(values))
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def _state(obj):
+    if isinstance(obj, Matrix):
+        return obj.size, [list(row) for row in obj._data]
+    if isinstance(obj, Array):
+        return list(obj)
+    return type(obj), list(obj.items() if isinstance(obj, Map) else obj)
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(Map(), id="empty-map"),
+        pytest.param(Map({"one": 1, "two": 2}), id="map"),
+        pytest.param(Map({1: 1.5, 2: 2.5}), id="numeric-map"),
+        pytest.param(Set(), id="empty-set"),
+        pytest.param(Set(range(-5, 100)), id="int-set"),
+        pytest.param(Set([2**64, -(2**63) - 1, 2**63 - 1]), id="big-ints"),
+        pytest.param(Set([True, False, 2]), id="bools"),
+        pytest.param(Bag([1.5, 1.5, float("inf")]), id="float-bag"),
+        pytest.param(Bag([[1, 2], "a", None, 3]), id="object-bag"),
+        pytest.param(Matrix(3, 2, 7), id="int-matrix"),
+        pytest.param(
+            Matrix.from_list_of_lists([[0.5, 1.0], [1.5, 2.0]]),
+            id="float-matrix",
+        ),
+        pytest.param(_array(1, None, "x"), id="array"),
+    ]
+)
+def container(request):
+    return request.param
+
+
+def test_round_trip(container):
+    assert _state(loads(dumps(container))) == _state(container)
+
+
+def test_dump_and_load_file(container, tmp_path):
+    path = tmp_path / "container.padt"
+    with open(path, "wb") as file:
+        dump(container, file)
+    with open(path, "rb") as file:
+        assert _state(load(file)) == _state(container)
+
+
+def test_pickle(container):
+    restored = pickle.loads(pickle.dumps(container))
+    assert type(restored) is type(container)
+    assert _state(restored) == _state(container)
+
+
+def test_bools_stay_bools():
+    assert [type(value) for value in loads(dumps(Bag([True, 1])))] == [
+        bool,
+        int,
+    ]
+
+
+@pytest.mark.parametrize(
+    "value, size",
+    [
+        pytest.param(-128, 1, id="int8"),
+        pytest.param(32767, 2, id="int16"),
+        pytest.param(-(2**31), 4, id="int32"),
+        pytest.param(2**31, 8, id="int64"),
+        pytest.param(0.5, 8, id="float64"),
+    ],
+)
+def test_numeric_payload_is_raw(value, size):
+    matrix = Matrix(100, 100, value)
+    header = len(dumps(Matrix(0, 0)))
+    assert len(dumps(matrix)) == header + 100 * 100 * size
+
+
+def test_dump_writes_chunks(monkeypatch):
+    monkeypatch.setattr(serialize, "CHUNK_SIZE", 10)
+    file = CountingFile()
+    dump(Bag(range(1000)), file)
+    assert file.largest_write == 10 * 2
+    file.seek(0)
+    assert list(load(file)) == list(range(1000))
+
+
+def test_copy_is_shallow():
+    mapping = Map({"key": [1]})
+    shallow, deep = copy.copy(mapping), copy.deepcopy(mapping)
+    shallow["other"] = 2
+    assert "other" not in mapping
+    assert shallow["key"] is mapping["key"]
+    assert deep["key"] == [1] and deep["key"] is not mapping["key"]
+
+
+def test_subclasses_keep_their_state():
+    mapping = LabeledMap(one=1)
+    mapping.label = "numbers"
+    restored = pickle.loads(pickle.dumps(mapping))
+    assert type(restored) is LabeledMap
+    assert restored.label == "numbers"
+    assert restored["one"] == 1
+    with pytest.raises(TypeError, match="cannot serialize LabeledMap"):
+        dumps(mapping)
+
+
+@pytest.mark.parametrize(
+    "data, error, message",
+    [
+        pytest.param(b"", EOFError, "unexpected end of data", id="empty"),
+        pytest.param(
+            b"XXXX\x01\x01",
+            ValueError,
+            "not a pyadt serialization",
+            id="magic",
+        ),
+        pytest.param(
+            b"PADT\x09\x01",
+            ValueError,
+            "unsupported format version: 9",
+            id="v",
+        ),
+        pytest.param(
+            b"PADT\x01\x63", ValueError, "unknown type tag: 99", id="tag"
+        ),
+        pytest.param(
+            dumps(Set([1, 2]))[:-1],
+            EOFError,
+            "unexpected end of data",
+            id="cut",
+        ),
+    ],
+)
+def test_invalid_data(data, error, message):
+    with pytest.raises(error, match=message):
+        loads(data)
+
+
+def test_unsupported_type():
+    with pytest.raises(TypeError, match="cannot serialize list objects"):
+        dumps([1, 2])
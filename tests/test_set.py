@@ -13,6 +13,7 @@ from pyadt import Set
         pytest.param((2, 4, 5, 5, 5, 6), 4),  # Tuple
         pytest.param({2, 4, 5, 6, 2, 2}, 4),  # Set
         pytest.param("hello", 4),  # String
+        pytest.param((i % 4 for i in range(10)), 4),  # Generator
     ],
 )
 def test_build(iterable, expected):
@@ -138,3 +139,47 @@ def test_equal():
     n = Set([4, 1, 2])
     assert s == o
     assert n != o
+
+
+def test_from_iterable():
+    chunks = ([i, i + 1] for i in range(0, 6, 2))
+    assert list(Set.from_iterable(chunks)) == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "method", ["union", "intersection", "difference", "is_disjoint"]
+)
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        pytest.param([], [1, 2], id="empty"),
+        pytest.param(["a", 1, 2.5, (3, "b")], [(3, "b"), 2, "a"], id="mixed"),
+        pytest.param(range(0, 3000, 2), range(0, 3000, 3), id="overlap"),
+        pytest.param(range(1000), range(1000, 2000), id="disjoint"),
+    ],
+)
+def test_parallel_operations(method, first, second, monkeypatch):
+    monkeypatch.setattr("pyadt.set.PARALLEL_MIN_SIZE", 0)
+    first, second = Set(first), Set(second)
+    serial = getattr(first, method)(second, workers=1)
+    parallel = getattr(first, method)(second, workers=3)
+    if method == "is_disjoint":
+        assert parallel == serial
+    else:
+        # Same elements, in the same order
+        assert list(parallel) == list(serial)
+
+
+def test_parallel_is_opt_in(monkeypatch):
+    def fail(*args):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(Set, "_compare_in_parallel", fail)
+    monkeypatch.setattr("pyadt.set.PARALLEL_MIN_SIZE", 20)
+    first, second = Set(range(10)), Set(range(5, 15))
+    assert list(first.intersection(second)) == [5, 6, 7, 8, 9]
+    # Too small to be worth the processes
+    monkeypatch.setattr("pyadt.set.PARALLEL_MIN_SIZE", 50)
+    assert list(first.difference(second, workers=4)) == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError, match="workers must be positive"):
+        first.union(second, workers=0)
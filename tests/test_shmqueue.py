@@ -0,0 +1,172 @@
+"""Test shmqueue.py."""
+
+import multiprocessing
+import pickle
+import struct
+
+import pytest
+
+from pyadt import SharedQueue
+
+
+@pytest.fixture
+def shared_queue():
+    queue = SharedQueue(64)
+    yield queue
+    queue.close()
+    queue.unlink()
+
+
+@pytest.fixture
+def fixed_queue():
+    queue = SharedQueue(20, record_size=8)
+    yield queue
+    queue.close()
+    queue.unlink()
+
+
+def _produce(queue, start, stop):
+    numbers = list(range(start, stop))
+    while numbers:
+        added = queue.enqueue_many(struct.pack("<q", n) for n in numbers[:10])
+        numbers = numbers[added:]
+    queue.close()
+
+
+def _consume(queue, count, results):
+    received = []
+    while len(received) < count:
+        received.extend(queue.dequeue_many(min(10, count - len(received))))
+    while received:
+        received = received[results.enqueue_many(received) :]
+    queue.close()
+    results.close()
+
+
+def test_build():
+    with pytest.raises(ValueError):
+        SharedQueue(0)
+    with pytest.raises(ValueError):
+        SharedQueue(8, record_size=16)
+
+
+def test_enqueue_dequeue(shared_queue):
+    for i in range(100):
+        record = f"record-{i}".encode()
+        shared_queue.enqueue(record)
+        assert shared_queue.dequeue() == record
+    assert shared_queue.is_empty()
+
+
+def test_enqueue_full(shared_queue):
+    shared_queue.enqueue(b"x" * 60)
+    with pytest.raises(IndexError, match="enqueue to a full queue"):
+        shared_queue.enqueue(b"x")
+
+
+def test_enqueue_too_large(shared_queue):
+    shared_queue.enqueue(b"x" * 60)
+    with pytest.raises(ValueError, match="larger than the queue capacity"):
+        shared_queue.enqueue(b"x" * 61)
+    assert shared_queue.dequeue() == b"x" * 60
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        pytest.param([b"one", b"x" * 61], id="too-large"),
+        pytest.param([b"one", "two"], id="not-bytes"),
+    ],
+)
+def test_invalid_batch_adds_nothing(shared_queue, records):
+    with pytest.raises((ValueError, TypeError)):
+        shared_queue.enqueue_many(records)
+    assert shared_queue.is_empty()
+    shared_queue.enqueue(b"two")
+    assert shared_queue.dequeue_many() == [b"two"]
+
+
+def test_dequeue_empty(shared_queue):
+    with pytest.raises(IndexError, match="dequeue from an empty queue"):
+        shared_queue.dequeue()
+
+
+def test_wrap_around(fixed_queue):
+    for i in range(50):
+        record = struct.pack("<q", i)
+        fixed_queue.enqueue(record)
+        assert len(fixed_queue) == 1
+        assert fixed_queue.dequeue() == record
+
+
+def test_fixed_record_size(fixed_queue):
+    with pytest.raises(ValueError, match="record size must be 8"):
+        fixed_queue.enqueue(b"short")
+
+
+def test_batch(shared_queue):
+    records = [bytes([i]) * i for i in range(1, 10)]
+    added = shared_queue.enqueue_many(records)
+    assert added == 7
+    assert len(shared_queue) == 7
+    assert shared_queue.dequeue_many(4) == records[:4]
+    assert shared_queue.dequeue_many() == records[4:7]
+
+
+def test_attach(shared_queue):
+    shared_queue.enqueue(b"spam")
+    other = SharedQueue.attach(shared_queue.name)
+    assert len(other) == 1
+    assert other.dequeue() == b"spam"
+    other.close()
+    assert shared_queue.is_empty()
+
+
+def test_pickle_attaches(shared_queue):
+    other = pickle.loads(pickle.dumps(shared_queue))
+    other.enqueue(b"eggs")
+    assert shared_queue.dequeue() == b"eggs"
+    other.close()
+
+
+def test_single_producer_single_consumer():
+    queue = SharedQueue(8 * 1_024, record_size=8)
+    producer = multiprocessing.Process(
+        target=_produce, args=(queue, 0, 10_000)
+    )
+    producer.start()
+    received = []
+    while len(received) < 10_000:
+        received.extend(queue.dequeue_many())
+    producer.join()
+    queue.close()
+    queue.unlink()
+    assert [struct.unpack("<q", r)[0] for r in received] == list(range(10_000))
+
+
+def test_multiple_producers_multiple_consumers():
+    queue = SharedQueue(
+        8 * 1_024,
+        record_size=8,
+        producer_lock=multiprocessing.Lock(),
+        consumer_lock=multiprocessing.Lock(),
+    )
+    results = SharedQueue(
+        8 * 4_000, record_size=8, producer_lock=multiprocessing.Lock()
+    )
+    processes = [
+        multiprocessing.Process(target=_produce, args=(queue, 0, 2_000)),
+        multiprocessing.Process(target=_produce, args=(queue, 2_000, 4_000)),
+        multiprocessing.Process(target=_consume, args=(queue, 1_000, results)),
+        multiprocessing.Process(target=_consume, args=(queue, 3_000, results)),
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    received = results.dequeue_many()
+    for shared in (queue, results):
+        shared.close()
+        shared.unlink()
+    numbers = sorted(struct.unpack("<q", r)[0] for r in received)
+    assert numbers == list(range(4_000))
@@ -0,0 +1,111 @@
+"""Test sketches.py."""
+
+import pickle
+from collections import Counter
+from random import Random
+
+import pytest
+
+from pyadt import CountMinSketch, SketchBag, SpaceSaving
+from pyadt.memory import deep_sizeof
+
+
+def _stream(seed, length=20_000):
+    # A skewed stream, like most real ones, with a long tail
+    random = Random(seed)
+    return [int(random.paretovariate(1.1)) for _ in range(length)]
+
+
+@pytest.fixture
+def stream():
+    return _stream(0)
+
+
+@pytest.mark.parametrize("epsilon", [0.01, 0.001])
+def test_count_error_bound(stream, epsilon):
+    bag = SketchBag(stream, epsilon=epsilon)
+    assert len(bag) == len(stream)
+    assert bag.error_bound == pytest.approx(epsilon * len(stream))
+    for value, count in Counter(stream).items():
+        assert count <= bag.count(value) <= count + bag.error_bound
+
+
+def test_most_common(stream):
+    bag = SketchBag(stream, top_k=20)
+    expected = Counter(stream).most_common(5)
+    assert bag.most_common(5) == expected
+    assert len(bag.most_common()) == 20
+
+
+def test_merge(stream):
+    second = _stream(1)
+    merged = SketchBag(stream).merge(SketchBag(second))
+    everything = Counter(stream + second)
+    assert len(merged) == len(stream) + len(second)
+    assert merged.most_common(3) == everything.most_common(3)
+    for value, count in everything.items():
+        assert count <= merged.count(value) <= count + merged.error_bound
+
+
+@pytest.mark.parametrize(
+    "other, error",
+    [
+        pytest.param(SketchBag(epsilon=0.01), ValueError, id="epsilon"),
+        pytest.param(SketchBag(top_k=5), ValueError, id="top_k"),
+        pytest.param(Counter(), TypeError, id="type"),
+    ],
+)
+def test_merge_invalid(other, error):
+    with pytest.raises(error):
+        SketchBag().merge(other)
+
+
+def test_memory_does_not_grow_with_the_stream():
+    bag = SketchBag(range(1000), top_k=10)
+    size = deep_sizeof(bag)
+    bag.add_many(range(1000, 50_000))
+    assert deep_sizeof(bag) <= size * 1.1
+
+
+def test_weighted_add():
+    bag = SketchBag()
+    bag.add("a", 1_000_000)
+    bag.add("b")
+    assert bag.count("a") == 1_000_000
+    assert bag.most_common(1) == [("a", 1_000_000)]
+    with pytest.raises(ValueError, match="non-negative"):
+        bag.add("a", -1)
+
+
+def test_pickle(stream):
+    bag = SketchBag(stream)
+    restored = pickle.loads(pickle.dumps(bag))
+    assert restored.most_common(5) == bag.most_common(5)
+    assert restored._sketch == bag._sketch
+    restored.add(1)
+    assert restored.count(1) == bag.count(1) + 1
+
+
+@pytest.mark.parametrize(
+    "epsilon, delta",
+    [
+        pytest.param(0, 0.01, id="epsilon"),
+        pytest.param(0.01, 1, id="delta"),
+    ],
+)
+def test_invalid_parameters(epsilon, delta):
+    with pytest.raises(ValueError, match="must be between 0 and 1"):
+        CountMinSketch(epsilon, delta)
+
+
+def test_space_saving_guarantees(stream):
+    top = SpaceSaving(capacity=50)
+    for item in stream:
+        top.add(item)
+    counts = Counter(stream)
+    for item, count in top.most_common():
+        assert count - top.error(item) <= counts[item] <= count
+    # Every item more frequent than total / capacity is monitored
+    for item, count in counts.items():
+        if count > len(stream) / 50:
+            assert item in top
@@ -0,0 +1,138 @@
+"""Test sortedmap.py."""
+
+from bisect import bisect_left, bisect_right
+from random import Random
+
+import pytest
+
+from pyadt import SortedMap
+
+
+@pytest.fixture
+def mock_sortedmap():
+    return SortedMap({30: "c", 10: "a", 20: "b"})
+
+
+def _check(mapping, reference):
+    keys = sorted(reference)
+    assert list(mapping.items()) == sorted(reference.items())
+    assert len(mapping) == len(reference)
+    for index, key in enumerate(keys):
+        assert mapping.select(index) == key
+        assert mapping.rank(key) == index
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_operations(seed):
+    random = Random(seed)
+    mapping, reference = SortedMap(), {}
+    for step in range(3000):
+        key = random.randrange(300)
+        if random.random() < 0.6:
+            mapping[key] = reference[key] = step
+        elif key in reference:
+            assert mapping.pop(key) == reference.pop(key)
+        else:
+            with pytest.raises(KeyError):
+                del mapping[key]
+        if step % 300 == 0:
+            _check(mapping, reference)
+    _check(mapping, reference)
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        pytest.param([], id="empty"),
+        pytest.param([(1, "a")], id="single"),
+        pytest.param([(key, -key) for key in range(1000)], id="many"),
+    ],
+)
+def test_from_sorted(items):
+    mapping = SortedMap.from_sorted(iter(items))
+    _check(mapping, dict(items))
+    # The bulk loaded skip list stays consistent under updates
+    mapping[0.5] = "new"
+    reference = {**dict(items), 0.5: "new"}
+    _check(mapping, reference)
+    for key in list(reference):
+        del mapping[key]
+    assert len(mapping) == 0
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        pytest.param([(2, "b"), (1, "a")], id="descending"),
+        pytest.param([(1, "a"), (1, "b")], id="duplicates"),
+    ],
+)
+def test_from_sorted_unsorted(items):
+    with pytest.raises(ValueError, match="strictly ascending"):
+        SortedMap.from_sorted(items)
+
+
+@pytest.mark.parametrize(
+    "low, high, expected",
+    [
+        pytest.param(None, None, [10, 20, 30], id="all"),
+        pytest.param(10, 30, [10, 20], id="half-open"),
+        pytest.param(11, 31, [20, 30], id="between-keys"),
+        pytest.param(None, 20, [10], id="open-low"),
+        pytest.param(20, None, [20, 30], id="open-high"),
+        pytest.param(30, 10, [], id="empty"),
+    ],
+)
+def test_range(mock_sortedmap, low, high, expected):
+    assert list(mock_sortedmap.range(low, high)) == [
+        (key, mock_sortedmap[key]) for key in expected
+    ]
+
+
+@pytest.mark.parametrize("key", [5, 10, 15, 20, 25, 30, 35])
+def test_order_queries(mock_sortedmap, key):
+    keys = list(mock_sortedmap)
+    assert mock_sortedmap.rank(key) == bisect_left(keys, key)
+    below = bisect_right(keys, key)
+    if below:
+        assert mock_sortedmap.floor(key) == keys[below - 1]
+    else:
+        with pytest.raises(KeyError):
+            mock_sortedmap.floor(key)
+    above = bisect_left(keys, key)
+    if above < len(keys):
+        assert mock_sortedmap.ceiling(key) == keys[above]
+    else:
+        with pytest.raises(KeyError):
+            mock_sortedmap.ceiling(key)
+
+
+def test_pops(mock_sortedmap):
+    assert mock_sortedmap.pop_first() == (10, "a")
+    assert mock_sortedmap.pop_last() == (30, "c")
+    assert mock_sortedmap.pop_last() == (20, "b")
+    with pytest.raises(KeyError, match="empty SortedMap"):
+        mock_sortedmap.pop_first()
+    with pytest.raises(KeyError, match="empty SortedMap"):
+        mock_sortedmap.pop_last()
+
+
+def test_select_out_of_range(mock_sortedmap):
+    assert mock_sortedmap.select(-3) == 10
+    for index in (3, -4):
+        with pytest.raises(IndexError):
+            mock_sortedmap.select(index)
+
+
+def test_mapping_interface(mock_sortedmap):
+    assert list(reversed(mock_sortedmap)) == [30, 20, 10]
+    assert list(mock_sortedmap.values()) == ["a", "b", "c"]
+    assert mock_sortedmap.get(40) is None
+    assert mock_sortedmap.set_default(40, "d") == "d"
+    assert 40 in mock_sortedmap
+    assert mock_sortedmap == SortedMap.from_iterable(
+        [[(40, "d"), (20, "b")], [(10, "a"), (30, "c")]]
+    )
+    mock_sortedmap.clear()
+    assert mock_sortedmap == SortedMap()
+    assert repr(mock_sortedmap) == "SortedMap({})"
@@ -0,0 +1,125 @@
+"""Test sortedset.py."""
+
+from bisect import bisect_left
+from random import Random
+
+import pytest
+
+from pyadt import Set, SortedSet
+
+
+@pytest.fixture
+def mock_sortedset():
+    return SortedSet([30, 10, 20, 10])
+
+
+def _random_pairs(count=50):
+    random = Random(count)
+    for _ in range(count):
+        yield (
+            set(random.sample(range(100), random.randrange(40))),
+            set(random.sample(range(100), random.randrange(40))),
+        )
+
+
+@pytest.mark.parametrize(
+    "method, operation",
+    [
+        pytest.param("union", set.union, id="union"),
+        pytest.param("intersection", set.intersection, id="intersection"),
+        pytest.param("difference", set.difference, id="difference"),
+        pytest.param(
+            "symmetric_difference",
+            set.symmetric_difference,
+            id="symmetric_difference",
+        ),
+        pytest.param("is_subset", set.issubset, id="is_subset"),
+        pytest.param("is_superset", set.issuperset, id="is_superset"),
+        pytest.param("is_disjoint", set.isdisjoint, id="is_disjoint"),
+        pytest.param("__eq__", set.__eq__, id="eq"),
+    ],
+)
+def test_set_operations(method, operation):
+    for first, second in _random_pairs():
+        result = getattr(SortedSet(first), method)(SortedSet(second))
+        expected = operation(first, second)
+        if isinstance(expected, set):
+            assert list(result) == sorted(expected)
+        else:
+            assert result == expected
+
+
+def test_set_operations_validate_other(mock_sortedset):
+    with pytest.raises(TypeError, match="SortedSet object expected"):
+        mock_sortedset.union(Set([1]))
+
+
+def test_add_remove(mock_sortedset):
+    mock_sortedset.add(15)
+    mock_sortedset.add(15)
+    assert list(mock_sortedset) == [10, 15, 20, 30]
+    mock_sortedset.remove(20)
+    mock_sortedset.discard(20)
+    assert list(mock_sortedset) == [10, 15, 30]
+    with pytest.raises(KeyError, match="20 not in set"):
+        mock_sortedset.remove(20)
+    assert [mock_sortedset.pop() for _ in range(3)] == [30, 15, 10]
+    with pytest.raises(KeyError, match="pop from an empty set"):
+        mock_sortedset.pop()
+
+
+@pytest.mark.parametrize("element", [5, 10, 15, 30, 35])
+def test_rank_and_index(mock_sortedset, element):
+    elements = list(mock_sortedset)
+    assert mock_sortedset.rank(element) == bisect_left(elements, element)
+    if element in elements:
+        assert mock_sortedset.index(element) == elements.index(element)
+    else:
+        with pytest.raises(ValueError, match="is not in set"):
+            mock_sortedset.index(element)
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pytest.param(slice(None), id="all"),
+        pytest.param(slice(2, 7), id="middle"),
+        pytest.param(slice(-3, None), id="negative"),
+        pytest.param(slice(1, None, 3), id="step"),
+        pytest.param(slice(7, 2), id="empty"),
+        pytest.param(slice(5, 100), id="past-the-end"),
+    ],
+)
+def test_slicing(index):
+    elements = list(range(0, 100, 10))
+    assert list(SortedSet(elements)[index]) == elements[index]
+
+
+def test_slicing_negative_step(mock_sortedset):
+    with pytest.raises(ValueError, match="step must be positive"):
+        mock_sortedset[::-1]
+
+
+def test_indexing(mock_sortedset):
+    assert [mock_sortedset[i] for i in range(-3, 3)] == [10, 20, 30] * 2
+    with pytest.raises(IndexError):
+        mock_sortedset[3]
+
+
+def test_range(mock_sortedset):
+    assert list(mock_sortedset.range(15, 30)) == [20]
+    assert list(mock_sortedset.range()) == [10, 20, 30]
+
+
+def test_set_conversion():
+    elements = Set([3, 1, 2])
+    sorted_elements = SortedSet.from_set(elements)
+    assert list(sorted_elements) == [1, 2, 3]
+    assert sorted_elements.to_set() == elements
+    assert SortedSet(elements) == sorted_elements
+
+
+def test_update(mock_sortedset):
+    mock_sortedset.update(SortedSet([5, 20, 40]))
+    assert list(mock_sortedset) == [5, 10, 20, 30, 40]
+    assert list(reversed(mock_sortedset)) == [40, 30, 20, 10, 5]
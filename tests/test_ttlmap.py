@@ -0,0 +1,231 @@
+"""Test ttlmap.py."""
+
+import math
+
+import pytest
+
+from pyadt import TTLMap
+from pyadt.ttlmap import EVICTED, EXPIRED
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def get_map(clock):
+    return TTLMap({"one": 1, "two": 2}, ttl=10, clock=clock, three=3)
+
+
+def test_build(get_map):
+    assert len(get_map) == 3
+    assert list(get_map.items()) == [("one", 1), ("two", 2), ("three", 3)]
+    assert repr(get_map) == "TTLMap({'one': 1, 'two': 2, 'three': 3})"
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        pytest.param({"ttl": 0}, "ttl", id="zero-ttl"),
+        pytest.param({"ttl": -1}, "ttl", id="negative-ttl"),
+        pytest.param({"maxsize": 0}, "maxsize", id="zero-maxsize"),
+    ],
+)
+def test_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=f"{message} must be positive"):
+        TTLMap(**kwargs)
+
+
+def test_invalid_item_ttl(get_map):
+    with pytest.raises(ValueError, match="ttl must be positive"):
+        get_map.set("four", 4, ttl=0)
+    with pytest.raises(ValueError, match="ttl must be positive"):
+        get_map.set_many({"four": 4}, ttl=-1)
+
+
+def test_default_ttl(get_map, clock):
+    clock.now = 9.9
+    assert get_map["one"] == 1
+    clock.now = 10
+    with pytest.raises(KeyError, match="one"):
+        get_map["one"]
+    assert len(get_map) == 0
+    assert get_map.expired == 3
+
+
+def test_no_ttl_keeps_items(clock):
+    mapping = TTLMap(one=1, clock=clock)
+    clock.now = 1e9
+    assert mapping["one"] == 1
+    assert mapping.expired == 0
+
+
+def test_item_ttl(get_map, clock):
+    get_map.set("four", 4, ttl=20)
+    get_map.set("five", 5, ttl=math.inf)
+    clock.now = 15
+    assert list(get_map) == ["four", "five"]
+    clock.now = 100
+    assert list(get_map) == ["five"]
+
+
+def test_set_again_renews_ttl(get_map, clock):
+    clock.now = 8
+    get_map["one"] = 11
+    clock.now = 12
+    assert get_map == TTLMap({"one": 11})
+    assert get_map.expired == 2
+    clock.now = 18
+    assert len(get_map) == 0
+    assert get_map.expired == 3
+
+
+def test_stale_entries_are_dropped(clock):
+    mapping = TTLMap(ttl=10, clock=clock)
+    for value in range(1000):
+        mapping["key"] = value
+    assert len(mapping._heap) < 100
+    clock.now = 10
+    assert mapping.expire() == 1
+    assert not mapping._heap
+
+
+class _Tracking(dict):
+    # Record what a sweep does to the items
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.popped = []
+        self.scanned = False
+
+    def pop(self, key, *args):
+        self.popped.append(key)
+        return super().pop(key, *args)
+
+    def __iter__(self):
+        self.scanned = True
+        return super().__iter__()
+
+
+def test_sweep_touches_only_expired_items(clock):
+    mapping = TTLMap(((key, key) for key in range(1000)), clock=clock)
+    mapping.set("short", 0, ttl=5)
+    mapping.set("long", 0, ttl=50)
+    mapping._data = _Tracking(mapping._data)
+    clock.now = 5
+    assert mapping.expire() == 1
+    assert mapping._data.popped == ["short"]
+    assert not mapping._data.scanned
+    assert list(mapping)[-2:] == [999, "long"]
+
+
+def test_callback(clock):
+    removed = []
+    mapping = TTLMap(
+        ttl=10,
+        maxsize=2,
+        clock=clock,
+        on_evict=lambda *args: removed.append(args),
+    )
+    mapping["one"] = 1
+    mapping.set("two", 2, ttl=5)
+    mapping["three"] = 3
+    assert removed == [("two", 2, EVICTED)]
+    clock.now = 10
+    assert mapping.expire() == 2
+    assert removed[1:] == [("one", 1, EXPIRED), ("three", 3, EXPIRED)]
+    assert (mapping.expired, mapping.evicted) == (2, 1)
+
+
+def test_maxsize_evicts_oldest_without_ttl():
+    mapping = TTLMap(((key, key) for key in range(5)), maxsize=3)
+    assert list(mapping) == [2, 3, 4]
+    assert mapping.evicted == 2
+
+
+def test_maxsize_evicts_closest_deadline_first(clock):
+    mapping = TTLMap(maxsize=2, clock=clock)
+    mapping["forever"] = 0
+    mapping.set("long", 1, ttl=100)
+    mapping.set("short", 2, ttl=1)
+    assert list(mapping) == ["forever", "long"]
+    mapping.set("other", 3, ttl=200)
+    assert list(mapping) == ["forever", "other"]
+    assert mapping.evicted == 2
+
+
+def test_bulk_operations(get_map, clock):
+    get_map.set_many([("four", 4), ("one", 11)], ttl=30)
+    get_map.update(five=5)
+    clock.now = 10
+    assert get_map.get_many(["one", "four"]) == [11, 4]
+    with pytest.raises(KeyError, match="two"):
+        get_map.get_many(["two"])
+    get_map.delete_many(["four"])
+    assert list(get_map) == ["one"]
+    assert get_map.expired == 3
+
+
+def test_delete_and_pop(get_map, clock):
+    del get_map["one"]
+    assert get_map.pop("two") == 2
+    assert get_map.popitem() == ("three", 3)
+    clock.now = 10
+    assert get_map.expire() == 0
+    assert not get_map._deadlines
+
+
+def test_pop_expired(get_map, clock):
+    clock.now = 10
+    with pytest.raises(KeyError, match="one"):
+        get_map.pop("one")
+    with pytest.raises(KeyError, match="one"):
+        del get_map["one"]
+
+
+def test_merge(get_map, clock):
+    clock.now = 5
+    merged = get_map.merge({"one": 10, "four": 4}, lambda a, b: a + b)
+    assert list(merged.items()) == [
+        ("one", 11),
+        ("two", 2),
+        ("three", 3),
+        ("four", 4),
+    ]
+    clock.now = 10
+    assert list(merged) == ["one", "four"]
+    assert len(get_map) == 0
+
+
+def test_eq_ignores_expired_items(clock):
+    first = TTLMap({"one": 1}, ttl=10, clock=clock)
+    first.set("two", 2, ttl=5)
+    second = TTLMap({"one": 1}, ttl=20, clock=clock)
+    second.set("two", 22, ttl=5)
+    assert first != second
+    clock.now = 5
+    assert list(first._data) == ["one", "two"]
+    assert first == second
+    assert second == first
+
+
+def test_set_default(get_map, clock):
+    clock.now = 10
+    assert get_map.set_default("one", 111) == 111
+    assert list(get_map) == ["one"]
+
+
+def test_clear(get_map, clock):
+    get_map.clear()
+    clock.now = 10
+    assert get_map.expire() == 0
+    assert get_map.expired == 0
+    assert not get_map._heap
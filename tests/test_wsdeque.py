@@ -0,0 +1,84 @@
+"""Test wsdeque.py."""
+
+import threading
+
+import pytest
+
+from pyadt import WorkStealingDeque
+
+
+@pytest.fixture
+def get_hello_deque():
+    return WorkStealingDeque("hello")
+
+
+@pytest.mark.parametrize(
+    "iterable, expected",
+    [
+        pytest.param([2, 4, 5, 6], 4),  # List
+        pytest.param((2, 4, 5, 6), 4),  # Tuple
+        pytest.param("hello", 5),  # String
+    ],
+)
+def test_build(iterable, expected):
+    d = WorkStealingDeque(iterable)
+    assert len(d) == expected
+
+
+def test_pop_is_lifo(get_hello_deque):
+    assert [get_hello_deque.pop() for _ in range(5)] == list("olleh")
+
+
+def test_steal_is_fifo(get_hello_deque):
+    assert [get_hello_deque.steal() for _ in range(5)] == list("hello")
+
+
+def test_pop_and_steal_empty():
+    d = WorkStealingDeque()
+    with pytest.raises(IndexError, match="pop from an empty deque"):
+        d.pop()
+    with pytest.raises(IndexError, match="steal from an empty deque"):
+        d.steal()
+
+
+def test_is_empty(get_hello_deque):
+    assert not get_hello_deque.is_empty()
+    assert WorkStealingDeque().is_empty()
+
+
+@pytest.mark.parametrize(
+    "item, expected", [pytest.param("h", True), pytest.param("a", False)]
+)
+def test_contains(item, expected, get_hello_deque):
+    assert (item in get_hello_deque) == expected
+
+
+def test_iteration(get_hello_deque):
+    assert list(get_hello_deque) == list("hello")
+    assert list(reversed(get_hello_deque)) == list("olleh")
+
+
+def test_concurrent_steal():
+    d = WorkStealingDeque(range(10_000))
+    stolen = [[] for _ in range(4)]
+
+    def thief(bucket):
+        while True:
+            try:
+                bucket.append(d.steal())
+            except IndexError:
+                return
+
+    threads = [threading.Thread(target=thief, args=(b,)) for b in stolen]
+    for thread in threads:
+        thread.start()
+    popped = []
+    while True:
+        try:
+            popped.append(d.pop())
+        except IndexError:
+            break
+    for thread in threads:
+        thread.join()
+    items = popped + [item for bucket in stolen for item in bucket]
+    assert sorted(items) == list(range(10_000))